@@ -168,13 +168,44 @@ class ApplicationSettings(BaseSettings):
         description="Exports directory path"
     )
     
+    # Caching
+    scrape_cache_ttl_hours: float = Field(
+        default=12.0,
+        description="How long cached scrapes in data/raw stay fresh (0 disables)",
+        ge=0.0,
+        le=720.0
+    )
+    
+    raw_store_max_mb: float = Field(
+        default=2048.0,
+        description="Disk budget for stored page blobs in data/raw (0 for unlimited)",
+        ge=0.0
+    )
+    
+    extraction_cache_max_mb: float = Field(
+        default=256.0,
+        description="Size budget for cached Claude extractions in data/processed (0 disables the cache)",
+        ge=0.0
+    )
+    
+    robots_cache_ttl_hours: float = Field(
+        default=24.0,
+        description="How long cached robots.txt files in data/raw stay fresh (0 refetches every run)",
+        ge=0.0,
+        le=720.0
+    )
+    
     # API Settings (flattened)
     firecrawl_api_key: str = Field(..., description="Firecrawl API key")
     claude_api_key: str = Field(..., description="Anthropic Claude API key")
+    firecrawl_base_url: str = Field(default="https://api.firecrawl.dev/v0", description="Firecrawl API base URL")
+    claude_base_url: str = Field(default="https://api.anthropic.com/v1", description="Anthropic API base URL")
     firecrawl_timeout: int = Field(default=60, description="Firecrawl request timeout")
     claude_timeout: int = Field(default=30, description="Claude request timeout")
     max_concurrent_requests: int = Field(default=10, description="Maximum concurrent requests", ge=1, le=50)
     rate_limit_per_minute: int = Field(default=60, description="API rate limit per minute", ge=1, le=1000)
+    claude_tokens_per_minute: int = Field(default=50000, description="Claude input tokens per minute budget", ge=1000, le=10000000)
+    combined_extraction: bool = Field(default=True, description="Extract products and promotions in one Claude call for pages that need both")
     
     # Database Settings (flattened)
     supabase_url: str = Field(..., description="Supabase project URL")
@@ -185,6 +216,8 @@ class ApplicationSettings(BaseSettings):
     crawl_depth: int = Field(default=2, description="Default crawl depth", ge=1, le=5)
     max_pages_per_competitor: int = Field(default=50, description="Maximum pages per competitor", ge=1, le=1000)
     extraction_timeout: int = Field(default=30, description="AI extraction timeout per page", ge=5, le=300)
+    extraction_chunk_tokens: int = Field(default=1500, description="Approximate content tokens per extraction call", ge=250, le=50000)
+    extraction_max_chunks: int = Field(default=20, description="Maximum extraction calls per page and type", ge=1, le=200)
     min_url_success_rate: float = Field(default=0.95, description="Minimum URL success rate", ge=0.0, le=1.0)
     min_price_extraction_rate: float = Field(default=0.90, description="Minimum price extraction rate", ge=0.0, le=1.0)
     min_image_access_rate: float = Field(default=0.95, description="Minimum image access rate", ge=0.0, le=1.0)
@@ -5,28 +5,56 @@ Streamlined version focused on core deliverables.
 """
 
 import sys
+import argparse
 import asyncio
+import time
 from pathlib import Path
 from datetime import datetime
+from typing import Callable, Optional
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent
 sys.path.insert(0, str(project_root))
 
 from config.settings import load_competitor_config
+from src.models.competitor import CompetitorConfig, GlobalSettings
 from src.collectors.firecrawl_collector import FirecrawlCollector
 from src.extractors.claude_extractor import ClaudeExtractor
+from src.simulators.cassette import CassetteServer
 from src.storage.csv_exporter import CSVExporter
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+from src.utils.concurrency import AdaptiveConcurrency
+from src.utils.rate_limiter import RateLimiter
+from src.utils.retry import RetryPolicy
+from src.utils.scheduler import DeadlineScheduler
 
 
 class CompetitorMonitorPipeline:
     """Main pipeline for competitive intelligence."""
     
-    def __init__(self):
-        """Initialize pipeline components."""
-        self.collector = FirecrawlCollector()
-        self.extractor = ClaudeExtractor()
+    # Time held back from the deadline for exporting results
+    EXPORT_RESERVE_SECONDS = 60
+    
+    def __init__(self, cassette: Optional[CassetteServer] = None):
+        """
+        Initialize pipeline components.
+        
+        Args:
+            cassette: Optional record/replay server for Firecrawl and Claude traffic
+        """
+        self.cassette = cassette
+        self.rate_limiter = RateLimiter()
+        self.circuit_breakers = CircuitBreakerRegistry()
+        self.concurrency = AdaptiveConcurrency()
+        # Built once the global settings are loaded, so only one session is ever opened
+        self.collector: Optional[FirecrawlCollector] = None
+        self.extractor = ClaudeExtractor(
+            rate_limiter=self.rate_limiter,
+            circuit_breakers=self.circuit_breakers,
+            concurrency=self.concurrency
+        )
         self.exporter = CSVExporter()
+        self.scheduler: Optional[DeadlineScheduler] = None
         
         self.all_products = []
         self.all_promotions = []
@@ -55,18 +83,75 @@ class CompetitorMonitorPipeline:
             
             print(f"🎯 Monitoring {len(competitors)} competitors")
             
-            # Process each competitor
-            for i, competitor in enumerate(competitors, 1):
-                name = competitor.get('name', f'Competitor_{i}')
-                print(f"\n📊 Processing {name} ({i}/{len(competitors)})")
-                
-                success = await self.process_competitor(competitor)
-                if not success:
-                    print(f"⚠️ Failed to process {name}, continuing...")
+            # Share one pooled collector session across all competitors
+            global_settings = GlobalSettings(**(config.get('global_settings') or {}))
+            self.rate_limiter.default_rate_per_minute = global_settings.rate_limit_per_minute
+            self.circuit_breakers.failure_threshold = global_settings.circuit_failure_threshold
+            self.circuit_breakers.cooldown_seconds = global_settings.circuit_cooldown_seconds
+            for key in ('firecrawl', 'claude'):
+                self.concurrency.configure(
+                    key,
+                    initial_limit=global_settings.concurrent_requests,
+                    max_limit=global_settings.get_max_concurrency()
+                )
+            self.collector = FirecrawlCollector(
+                global_settings,
+                rate_limiter=self.rate_limiter,
+                circuit_breakers=self.circuit_breakers,
+                concurrency=self.concurrency
+            )
+            self.extractor.retry_policy = RetryPolicy(
+                max_retries=global_settings.max_retries,
+                retry_on=ClaudeExtractor.RETRY_ON
+            )
+            
+            self.scheduler = self._build_scheduler(competitors, global_settings)
+            competitors = self.scheduler.order(competitors)
+            
+            if self.cassette:
+                await self._start_cassette()
             
-            # Export data
-            print(f"\n💾 Exporting data...")
-            await self.export_results()
+            try:
+                async with self.collector, self.extractor:
+                    # Process each competitor, highest priority first
+                    for i, competitor in enumerate(competitors, 1):
+                        name = competitor.get('name', f'Competitor_{i}')
+                        plan = self.scheduler.plan(competitor, competitors[i:])
+                        if not plan['pages']:
+                            print(f"\n⏭️ Skipping {name}: no time left before the deadline")
+                            continue
+                        
+                        print(f"\n📊 Processing {name} ({i}/{len(competitors)}, "
+                              f"{plan['budget_seconds'] / 60:.1f} min budget)")
+                        if plan['shed']:
+                            print(f"  ✂️ Shed {plan['shed']} pages to fit the deadline")
+                        
+                        competitor_start = time.monotonic()
+                        try:
+                            success = await asyncio.wait_for(
+                                self.process_competitor(plan['config']),
+                                timeout=plan['budget_seconds']
+                            )
+                        except asyncio.TimeoutError:
+                            self.scheduler.record_timeout(competitor)
+                            print(f"⏰ {name} cut short at its time budget, keeping partial results")
+                            continue
+                        
+                        self.scheduler.record(plan['pages'], time.monotonic() - competitor_start)
+                        if not success:
+                            print(f"⚠️ Failed to process {name}, continuing...")
+            
+            finally:
+                # Export whatever was collected, even if the run was cut short
+                print(f"\n💾 Exporting data...")
+                await self.export_results()
+            
+            # Keep the raw page store within its disk budget
+            if self.collector.cache:
+                compaction = self.collector.cache.compact()
+                if compaction['removed']:
+                    print(f"🧹 Evicted {compaction['removed']} stored pages "
+                          f"({compaction['freed_bytes'] / 1024 / 1024:.1f} MB)")
             
             # Summary
             end_time = datetime.now()
@@ -78,71 +163,202 @@ class CompetitorMonitorPipeline:
             print(f"⏱️  Duration: {duration:.1f} seconds ({duration/60:.1f} minutes)")
             print(f"📦 Products extracted: {len(self.all_products)}")
             print(f"🎯 Promotions extracted: {len(self.all_promotions)}")
+            schedule = self.scheduler.get_summary()
+            print(f"⏳ Deadline: {schedule['elapsed_seconds'] / 60:.1f} of "
+                  f"{schedule['deadline_seconds'] / 60:.0f} minutes used")
+            if schedule['shed_pages']:
+                print(f"✂️  Pages shed to meet the deadline: {schedule['shed_pages']}")
+            if schedule['timed_out']:
+                print(f"⏰ Cut short at time budget: {', '.join(schedule['timed_out'])}")
+            if schedule['skipped']:
+                print(f"⏭️  Skipped for lack of time: {', '.join(schedule['skipped'])}")
+            if self.extractor.combined_calls:
+                print(f"🧩 Combined extractions: {self.extractor.combined_calls} calls returned "
+                      f"{self.extractor.combined_products} products and {self.extractor.combined_promotions} promotions")
+            if self.collector.robots_blocked:
+                print(f"🤖 URLs skipped by robots.txt: {self.collector.robots_blocked}")
+            if self.collector.direct_pages or self.collector.direct_fallbacks:
+                print(f"⚡ Direct fetches: {self.collector.direct_pages} pages, "
+                      f"{self.collector.direct_fallbacks} fell back to Firecrawl")
+            hedges = self.collector.hedge_budget
+            if hedges.hedges or hedges.hedges_skipped:
+                print(f"🔀 Hedged scrapes: {hedges.hedges} sent, {hedges.hedges_won} won, "
+                      f"{hedges.hedges_skipped} skipped for lack of capacity")
+            if self.collector.truncated_pages:
+                print(f"⚠️  Oversized pages aborted: {self.collector.truncated_pages}")
+            if self.collector.cache:
+                cache_stats = self.collector.cache.get_stats()
+                print(f"💾 Scrape cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses")
+            if self.extractor.cache:
+                cache_stats = self.extractor.cache.get_stats()
+                lookups = cache_stats['hits'] + cache_stats['misses']
+                hit_rate = cache_stats['hits'] / lookups * 100 if lookups else 0.0
+                print(f"🧠 Extraction cache: {cache_stats['hits']} hits, {cache_stats['misses']} misses "
+                      f"({hit_rate:.0f}% hit rate, {cache_stats['evicted']} evicted)")
+            tripped = {
+                key: state for key, state in self.circuit_breakers.get_summary().items()
+                if state['times_opened']
+            }
+            if tripped:
+                print("🔌 Circuit breakers:")
+                for key, state in tripped.items():
+                    print(f"   {key}: {state['state']} (opened {state['times_opened']}x, {state['rejected']} requests rejected)")
+            self._print_concurrency_summary()
+            if self.cassette and self.cassette.mode == 'replay':
+                print(f"📼 Cassette misses: {self.cassette.misses}")
             print(f"✅ Pipeline completed successfully!")
             
             return True
-            
+        
         except Exception as e:
             print(f"\n💥 Pipeline failed: {e}")
             return False
+        
+        finally:
+            if self.cassette:
+                await self.cassette.stop()
+    
+    def _build_scheduler(self, competitors: list, global_settings: GlobalSettings) -> DeadlineScheduler:
+        """
+        Build the deadline scheduler from the configured pipeline timeout.
+        
+        Args:
+            competitors: Competitor configurations to run
+            global_settings: Global crawl settings
+        
+        Returns:
+            DeadlineScheduler: Scheduler seeded with the configured per-page estimate
+        """
+        deadline_minutes = self.collector.settings.pipeline_timeout_minutes
+        config = CompetitorConfig(competitors=competitors, global_settings=global_settings)
+        
+        is_valid, message = config.validate_time_constraint(deadline_minutes)
+        if is_valid:
+            print(f"⏱️  {message}")
+        else:
+            print(f"⚠️  {message}; lower-priority pages will be shed")
+        
+        pages = config.get_total_estimated_pages()
+        seconds_per_page = config.get_total_estimated_time() * 60 / pages if pages else 0.0
+        return DeadlineScheduler(
+            deadline_minutes * 60,
+            seconds_per_page=seconds_per_page,
+            reserve_seconds=self.EXPORT_RESERVE_SECONDS
+        )
+    
+    def _print_concurrency_summary(self) -> None:
+        """Print each API's adaptive concurrency limit and the decreases behind it."""
+        states = self.concurrency.get_summary()
+        if not states:
+            return
+        
+        print("🎚️  Adaptive concurrency:")
+        for key, state in states.items():
+            print(f"   {key}: limit {state['limit']} (range {state['lowest_limit']}-{state['peak_limit']}, "
+                  f"{state['increases']} increases, {state['decreases']} decreases)")
+            for decision in self.concurrency.get_decisions(key):
+                if decision['action'] == 'decrease':
+                    print(f"      {decision['at']:.1f}s: {decision['from']} → {decision['to']} ({decision['reason']})")
+    
+    async def _start_cassette(self) -> None:
+        """Route Firecrawl and Claude traffic through the cassette server."""
+        local_urls = await self.cassette.start({
+            'firecrawl': self.collector.base_url,
+            'claude': self.extractor.base_url
+        })
+        self.collector.base_url = local_urls['firecrawl']
+        self.extractor.base_url = local_urls['claude']
+        
+        # Every request must reach the cassette for a reproducible benchmark
+        self.collector.cache = None
+        self.extractor.cache = None
     
     async def process_competitor(self, competitor_config: dict) -> bool:
         """
         Process a single competitor.
         
+        Each page is handed to extraction as soon as it is scraped, so a
+        competitor cut short by the deadline keeps every page that finished.
+        
         Args:
             competitor_config: Competitor configuration
-            
+        
         Returns:
             bool: True if successful
         """
         name = competitor_config.get('name', 'Unknown')
+        competitor_products = []
+        competitor_promotions = []
+        extractions = []
+        
+        def collect(result: dict) -> None:
+            competitor_products.extend(result['products'])
+            competitor_promotions.extend(result['promotions'])
+            self.all_products.extend(result['products'])
+            self.all_promotions.extend(result['promotions'])
+        
+        def extract(page_data: dict) -> None:
+            extractions.append(asyncio.create_task(self.extract_page(page_data, name, collect)))
         
         try:
-            # Step 1: Scrape URLs
-            scraped_data = await self.collector.scrape_competitor_urls(competitor_config)
+            # Step 1: Scrape URLs, extracting each page as it arrives
+            scraped_data = await self.collector.scrape_competitor_urls(competitor_config, on_page=extract)
             
             if not scraped_data:
                 print(f"  ❌ No data scraped for {name}")
                 return False
             
-            # Step 2: Extract data from scraped content
-            competitor_products = []
-            competitor_promotions = []
-            
-            for page_data in scraped_data:
-                if page_data.get('status') != 'success':
-                    continue
-                
-                content = page_data.get('markdown', '') or page_data.get('html', '')
-                if not content:
-                    continue
-                
-                url_type = page_data.get('url_type', 'unknown')
-                
-                # Extract products from new product pages
-                if url_type == 'new' or 'new' in page_data.get('url', '').lower():
-                    print(f"    🔍 Extracting products from: {page_data.get('url', '')[:50]}...")
-                    products = await self.extractor.extract_products(content, name)
-                    competitor_products.extend(products)
-                
-                # Extract promotions from promo pages
-                if url_type == 'promo' or any(term in page_data.get('url', '').lower() 
-                                              for term in ['sale', 'promo', 'discount', 'clearance']):
-                    print(f"    🔍 Extracting promotions from: {page_data.get('url', '')[:50]}...")
-                    promotions = await self.extractor.extract_promotions(content, name)
-                    competitor_promotions.extend(promotions)
-            
-            # Add to overall results
-            self.all_products.extend(competitor_products)
-            self.all_promotions.extend(competitor_promotions)
+            # Step 2: Wait for the remaining extractions
+            await asyncio.gather(*extractions)
             
             print(f"  ✅ {name}: {len(competitor_products)} products, {len(competitor_promotions)} promotions")
             return True
-            
+        
         except Exception as e:
             print(f"  ❌ Error processing {name}: {e}")
             return False
+        
+        finally:
+            # Extractions still running at the deadline are dropped
+            for task in extractions:
+                task.cancel()
+    
+    async def extract_page(self, page_data: dict, competitor: str, on_result: Callable[[dict], None]) -> None:
+        """
+        Run the extractions a scraped page needs.
+        
+        Args:
+            page_data: Tagged scrape result
+            competitor: Competitor name
+            on_result: Called with the page's products and promotions
+        """
+        if page_data.get('status') != 'success':
+            return
+        
+        url = page_data.get('url', '')
+        content = page_data.get('markdown', '') or page_data.get('html', '')
+        if not content:
+            # HTML is only fetched on demand when markdown came back empty
+            content = await self.collector.fetch_html(url)
+        if not content:
+            return
+        
+        url_type = page_data.get('url_type', 'unknown')
+        extract = []
+        
+        # Extract products from new product pages
+        if url_type == 'new' or 'new' in url.lower():
+            extract.append('products')
+        
+        # Extract promotions from promo pages
+        if url_type == 'promo' or any(term in url.lower()
+                                      for term in ['sale', 'promo', 'discount', 'clearance']):
+            extract.append('promotions')
+        
+        if extract:
+            print(f"    🔍 Extracting {' and '.join(extract)} from: {url[:50]}...")
+            page = {'url': url, 'content': content, 'extract': extract}
+            await self.extractor.extract_many([page], competitor, on_result=on_result)
     
     async def export_results(self) -> None:
         """Export all results to CSV files."""
@@ -162,19 +378,40 @@ class CompetitorMonitorPipeline:
                 print(f"  🎯 Promotions: {validation.get('row_count', 0)} rows → {promo_file}")
             else:
                 print("  🎯 No promotions to export")
-                
+        
         except Exception as e:
             print(f"  ❌ Export error: {e}")
 
 
+def parse_args() -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run the competitive intelligence pipeline")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--record', type=Path, metavar='CASSETTE',
+                       help="Record all Firecrawl/Claude traffic to a cassette (.jsonl.gz)")
+    group.add_argument('--replay', type=Path, metavar='CASSETTE',
+                       help="Serve Firecrawl/Claude traffic from a recorded cassette")
+    parser.add_argument('--replay-speed', type=float, default=1.0,
+                        help="Replay timing multiplier (1.0 original, 0 instant)")
+    return parser.parse_args()
+
+
 async def main():
     """Main function."""
+    args = parse_args()
+    
     print("🎯 CSC Competitive Intelligence Pipeline")
     print("⚡ Streamlined version for rapid deployment")
     print()
     
     try:
-        pipeline = CompetitorMonitorPipeline()
+        cassette = None
+        if args.record:
+            cassette = CassetteServer(args.record, mode='record')
+        elif args.replay:
+            cassette = CassetteServer(args.replay, mode='replay', speed=args.replay_speed)
+        
+        pipeline = CompetitorMonitorPipeline(cassette=cassette)
         success = await pipeline.run_full_pipeline()
         
         if success:
@@ -184,7 +421,7 @@ async def main():
         else:
             print("\n❌ FAILED: Pipeline encountered errors")
             sys.exit(1)
-            
+    
     except KeyboardInterrupt:
         print("\n🛑 Pipeline interrupted by user")
         sys.exit(1)
@@ -0,0 +1,172 @@
+"""
+Direct HTTP fetcher for server-rendered pages.
+
+Fetches pages straight from competitor sites over a pooled session and
+converts them to markdown locally, so simple pages skip the Firecrawl API.
+Pages that look JavaScript-rendered are reported as failures so the caller
+can fall back to Firecrawl.
+"""
+
+import asyncio
+import re
+from typing import Any, Dict, List, Optional
+
+import aiohttp
+
+from src.utils.validators import TextValidator
+
+# aiohttp decodes brotli responses only when a brotli package is installed
+try:
+    import brotli  # noqa: F401
+    ACCEPT_ENCODING = 'gzip, deflate, br'
+except ImportError:
+    try:
+        import brotlicffi  # noqa: F401
+        ACCEPT_ENCODING = 'gzip, deflate, br'
+    except ImportError:
+        ACCEPT_ENCODING = 'gzip, deflate'
+
+
+TITLE_PATTERN = re.compile(r'<title[^>]*>(.*?)</title>', re.IGNORECASE | re.DOTALL)
+
+
+class DirectFetcher:
+    """Pooled HTTP fetcher with local HTML-to-markdown conversion."""
+    
+    # Pages with less visible content than this are treated as client-rendered
+    MIN_CONTENT_CHARS = 500
+    
+    # Visible text shown by pages that need JavaScript to render
+    JS_MARKERS = (
+        'enable javascript',
+        'javascript is disabled',
+        'javascript is required',
+        'requires javascript',
+        'turn on javascript'
+    )
+    
+    READ_CHUNK_SIZE = 64 * 1024
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 30
+    
+    def __init__(self, concurrency: int = 5, timeout: int = 30, max_response_bytes: int = 10 * 1024 * 1024):
+        """
+        Initialize fetcher.
+        
+        Args:
+            concurrency: Maximum pooled connections
+            timeout: Request timeout in seconds
+            max_response_bytes: Maximum page size before aborting
+        """
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.max_response_bytes = max_response_bytes
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Get the pooled session, creating it on first use."""
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit=self.concurrency,
+                limit_per_host=self.concurrency,
+                use_dns_cache=True,
+                ttl_dns_cache=self.DNS_CACHE_TTL,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the pooled session."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+    
+    @classmethod
+    def needs_javascript(cls, markdown: str) -> bool:
+        """
+        Check whether converted page content looks client-rendered.
+        
+        Args:
+            markdown: Markdown converted from the server response
+        
+        Returns:
+            bool: True if the page should be rendered by Firecrawl instead
+        """
+        if len(markdown) < cls.MIN_CONTENT_CHARS:
+            return True
+        
+        lowered = markdown.lower()
+        return any(marker in lowered for marker in cls.JS_MARKERS)
+    
+    async def fetch(
+        self,
+        url: str,
+        headers: Optional[Dict[str, str]] = None,
+        formats: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Fetch a page and convert it to markdown.
+        
+        HTML is parsed in a worker thread so large pages do not stall other
+        requests on the event loop.
+        
+        Args:
+            url: URL to fetch
+            headers: Request headers (e.g. the competitor's user agent and
+                custom headers)
+            formats: Page formats to return; the raw HTML is only kept when
+                'html' is requested (markdown only if unset)
+        
+        Returns:
+            Dict with scraped content in the same shape as a Firecrawl scrape,
+            or failure details if the page needs Firecrawl
+        """
+        request_headers = {
+            'Accept': 'text/html,application/xhtml+xml;q=0.9,*/*;q=0.8',
+            'Accept-Encoding': ACCEPT_ENCODING,
+            'Accept-Language': 'en-US,en;q=0.9',
+            **(headers or {})
+        }
+        
+        try:
+            session = await self._get_session()
+            async with session.get(
+                url,
+                headers=request_headers,
+                timeout=aiohttp.ClientTimeout(total=self.timeout)
+            ) as response:
+                if response.status != 200:
+                    return self._failed(url, f"HTTP {response.status}")
+                if 'html' not in response.headers.get('Content-Type', 'text/html').lower():
+                    return self._failed(url, f"Not HTML: {response.headers.get('Content-Type')}")
+                
+                body = bytearray()
+                async for chunk in response.content.iter_chunked(self.READ_CHUNK_SIZE):
+                    body.extend(chunk)
+                    if len(body) > self.max_response_bytes:
+                        return self._failed(url, f"Response exceeds {self.max_response_bytes} bytes")
+                
+                html = body.decode(response.charset or 'utf-8', errors='replace')
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError, LookupError) as e:
+            return self._failed(url, str(e) or type(e).__name__)
+        
+        markdown = await asyncio.to_thread(TextValidator.html_to_markdown, html, url)
+        if self.needs_javascript(markdown):
+            return self._failed(url, "Page appears to be JavaScript-rendered")
+        
+        title_match = TITLE_PATTERN.search(html)
+        return {
+            'url': url,
+            'markdown': markdown,
+            'html': html if formats and 'html' in formats else '',
+            'title': TextValidator.clean_text(title_match.group(1)) if title_match else '',
+            'status': 'success',
+            'engine': 'direct'
+        }
+    
+    @staticmethod
+    def _failed(url: str, error: str) -> Dict[str, Any]:
+        """Build a failed fetch result."""
+        return {'url': url, 'status': 'failed', 'error': error, 'engine': 'direct'}
@@ -4,88 +4,1386 @@ Minimal implementation focused on core functionality.
 """
 
 import asyncio
+import json
+import time
 import aiohttp
-from typing import List, Dict, Any, Optional
+from collections import deque
+from typing import List, Dict, Any, Optional, AsyncIterator, Callable, Set
+from urllib.parse import urlparse
 from config.settings import get_settings
+from src.collectors.direct_fetcher import DirectFetcher
+from src.collectors.frontier import CrawlFrontier
+from src.collectors.pagination import find_next_page, find_numbered_pages, page_url
+from src.collectors.sitemap import SitemapEntry, SitemapParser
+from src.models.competitor import Competitor, CrawlSettings, GlobalSettings
+from src.storage.scrape_cache import ScrapeCache
+from src.storage.url_state import URLStateStore
+from src.utils.circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+from src.utils.concurrency import AdaptiveConcurrency
+from src.utils.hedging import HedgeBudget, HedgeUnavailableError, LatencyTracker, run_hedged
+from src.utils.rate_limiter import RateLimiter
+from src.utils.retry import RetryPolicy, RetryableError, is_retryable_status, parse_retry_after
+from src.utils.robots import RobotsCache, RobotsRules
+from src.utils.validators import URLValidator
+
+
+class ResponseTooLargeError(Exception):
+    """Response body exceeded the configured size limit."""
 
 
 class FirecrawlCollector:
     """Simple Firecrawl integration for web scraping."""
     
-    def __init__(self):
-        """Initialize collector with settings."""
+    # Streaming read chunk size in bytes
+    READ_CHUNK_SIZE = 64 * 1024
+    
+    # Connection pool tuning
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 30
+    
+    # Page formats requested when a competitor does not configure any
+    DEFAULT_FORMATS = ['markdown']
+    
+    # Crawl job polling
+    CRAWL_POLL_INTERVAL = 2.0
+    CRAWL_JOB_TIMEOUT = 600
+    
+    # robots.txt fetching (bodies beyond the cap are ignored)
+    ROBOTS_TIMEOUT = 10
+    ROBOTS_MAX_BYTES = 512 * 1024
+    
+    # Upper bound on a robots.txt Crawl-delay so one site cannot stall a run
+    ROBOTS_MAX_CRAWL_DELAY = 60.0
+    
+    # Sitemap ingestion (nested index depth and URL state write batch size)
+    SITEMAP_TIMEOUT = 120
+    SITEMAP_MAX_DEPTH = 2
+    SITEMAP_BATCH_SIZE = 1000
+    
+    # Transport errors treated as transient
+    RETRY_ON = RetryPolicy.DEFAULT_RETRY_ON + (
+        aiohttp.ClientConnectionError,
+        aiohttp.ClientPayloadError
+    )
+    
+    def __init__(
+        self,
+        global_settings: Optional[GlobalSettings] = None,
+        rate_limiter: Optional[RateLimiter] = None,
+        cache: Optional[ScrapeCache] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None
+    ):
+        """
+        Initialize collector with settings.
+        
+        Args:
+            global_settings: Global crawling settings (defaults used if omitted)
+            rate_limiter: Shared rate limiter keyed by domain and API
+            cache: On-disk scrape cache (built from settings if omitted)
+            circuit_breakers: Shared circuit breakers keyed by domain and API
+            concurrency: Shared adaptive concurrency limits keyed by API
+        """
         self.settings = get_settings()
+        self.global_settings = global_settings or GlobalSettings()
         self.api_key = self.settings.firecrawl_api_key
-        self.base_url = "https://api.firecrawl.dev/v0"
+        self.base_url = self.settings.firecrawl_base_url.rstrip('/')
+        self._session: Optional[aiohttp.ClientSession] = None
+        # Direct fetches to competitor sites keep a fixed concurrency limit
+        self._semaphore = asyncio.Semaphore(self.global_settings.concurrent_requests)
+        
+        # Per-domain budgets default to the global rate; the API has its own
+        self.rate_limiter = rate_limiter or RateLimiter(
+            default_rate_per_minute=self.global_settings.rate_limit_per_minute
+        )
+        if not self.rate_limiter.is_configured('firecrawl'):
+            self.rate_limiter.configure(
+                'firecrawl',
+                rate_per_minute=self.settings.rate_limit_per_minute,
+                burst=self.global_settings.concurrent_requests
+            )
+        
+        # Retry policies per domain; competitors override the global default
+        self.default_retry_policy = RetryPolicy(
+            max_retries=self.global_settings.max_retries,
+            retry_on=self.RETRY_ON
+        )
+        self._retry_policies: Dict[str, RetryPolicy] = {}
+        self._formats: Dict[str, List[str]] = {}
+        self._max_pages: Dict[str, int] = {}
+        self._engines: Dict[str, str] = {}
+        self._direct_patterns: Dict[str, List[str]] = {}
+        self._request_headers: Dict[str, Dict[str, str]] = {}
+        
+        self.circuit_breakers = circuit_breakers or CircuitBreakerRegistry(
+            failure_threshold=self.global_settings.circuit_failure_threshold,
+            cooldown_seconds=self.global_settings.circuit_cooldown_seconds
+        )
+        
+        # Firecrawl concurrency starts at concurrent_requests and adapts within bounds
+        self.concurrency = concurrency or AdaptiveConcurrency()
+        if not self.concurrency.is_configured('firecrawl'):
+            self.concurrency.configure(
+                'firecrawl',
+                initial_limit=self.global_settings.concurrent_requests,
+                max_limit=self.global_settings.get_max_concurrency()
+            )
+        
+        # Scrape latencies drive the hedge delay; the budget caps extra requests
+        self.latency = LatencyTracker()
+        self.hedge_budget = HedgeBudget(self.global_settings.hedge_budget)
+        
+        # Response size cap and truncation metric
+        self.max_response_bytes = int(self.global_settings.max_response_mb * 1024 * 1024)
+        self.truncated_pages = 0
+        
+        # Direct fetches for server-rendered pages, with Firecrawl as fallback
+        self.direct_fetcher = DirectFetcher(
+            concurrency=self.global_settings.concurrent_requests,
+            timeout=self.global_settings.timeout,
+            max_response_bytes=self.max_response_bytes
+        )
+        self.direct_pages = 0
+        self.direct_fallbacks = 0
+        
+        # Scrape cache under data/raw; a zero TTL disables it
+        if cache is None and self.settings.scrape_cache_ttl_hours > 0:
+            max_mb = self.settings.raw_store_max_mb
+            cache = ScrapeCache(
+                self.settings.data_dir / "raw" / "scrape_cache",
+                ttl_seconds=self.settings.scrape_cache_ttl_hours * 3600,
+                max_bytes=int(max_mb * 1024 * 1024) if max_mb else None
+            )
+        self.cache = cache
+        
+        # robots.txt rules are fetched once per domain per run
+        self.robots_cache: Optional[RobotsCache] = None
+        if self.global_settings.respect_robots_txt:
+            self.robots_cache = RobotsCache(
+                self.settings.data_dir / "raw" / "robots_cache",
+                ttl_seconds=self.settings.robots_cache_ttl_hours * 3600
+            )
+        self._robots: Dict[str, RobotsRules] = {}
+        self._robots_locks: Dict[str, asyncio.Lock] = {}
+        self.robots_blocked = 0
+        
+        # Sitemap URL state, opened on first sitemap crawl
+        self._url_state: Optional[URLStateStore] = None
+    
+    async def __aenter__(self) -> "FirecrawlCollector":
+        """Open the pooled HTTP session."""
+        await self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the pooled HTTP session."""
+        await self.close()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use.
+        
+        Returns:
+            Pooled aiohttp session reused across scrapes
+        """
+        if self._session is None or self._session.closed:
+            # Hedges run alongside the request they duplicate, so leave them room
+            concurrency = self.global_settings.get_max_concurrency()
+            if self.global_settings.hedge_requests:
+                concurrency *= 2
+            connector = aiohttp.TCPConnector(
+                limit=concurrency,
+                limit_per_host=concurrency,
+                use_dns_cache=True,
+                ttl_dns_cache=self.DNS_CACHE_TTL,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the HTTP sessions and the URL state store."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        
+        await self.direct_fetcher.close()
+        
+        if self._url_state is not None:
+            self._url_state.close()
+            self._url_state = None
     
-    async def scrape_url(self, url: str) -> Optional[Dict[str, Any]]:
+    def configure_competitor(self, competitor_config: Dict[str, Any]) -> CrawlSettings:
         """
-        Scrape a single URL using Firecrawl.
+        Apply a competitor's crawl settings to its domains' rate limits, retries, formats,
+        pagination and fetch engine.
         
         Args:
-            url: URL to scrape
-            
+            competitor_config: Competitor configuration
+        
         Returns:
-            Dict with scraped content or None if failed
+            CrawlSettings: Parsed crawl settings for the competitor
         """
+        crawl_config = competitor_config.get('crawl') or {}
+        crawl = CrawlSettings(**crawl_config)
+        urls = competitor_config.get('new_urls', []) + competitor_config.get('promo_urls', [])
+        
+        retry_policy = RetryPolicy(
+            max_retries=crawl.retries if 'retries' in crawl_config else self.global_settings.max_retries,
+            base_delay=crawl.backoff_base,
+            max_delay=crawl.backoff_max,
+            retry_on=self.RETRY_ON
+        )
+        
+        # Direct fetches identify as the competitor's configured client
         headers = {
+            'User-Agent': competitor_config.get('user_agent') or self.global_settings.user_agent,
+            **(competitor_config.get('custom_headers') or {})
+        }
+        
+        for domain in {URLValidator.get_domain(str(url)) for url in urls}:
+            if domain:
+                self.rate_limiter.configure(domain, min_interval=crawl.delay)
+                self._retry_policies[domain] = retry_policy
+                self._formats[domain] = crawl.formats
+                self._max_pages[domain] = crawl.max_pages
+                self._engines[domain] = crawl.engine
+                self._direct_patterns[domain] = competitor_config.get('direct_fetch_patterns', [])
+                self._request_headers[domain] = headers
+        
+        return crawl
+    
+    async def filter_by_robots(self, urls: List[str], crawl: Optional[CrawlSettings] = None) -> List[str]:
+        """
+        Drop URLs disallowed by their site's robots.txt.
+        
+        Runs before any Firecrawl request so disallowed pages cost no credits
+        or rate-limit budget. A robots.txt Crawl-delay longer than the
+        competitor's configured delay slows the domain down accordingly.
+        
+        Args:
+            urls: Candidate URLs
+            crawl: Competitor crawl settings providing the configured delay
+        
+        Returns:
+            List[str]: Allowed URLs, in input order
+        """
+        if not self.global_settings.respect_robots_txt:
+            return list(urls)
+        
+        crawl = crawl or CrawlSettings()
+        seeds = {}
+        for url in urls:
+            seeds.setdefault(URLValidator.get_domain(url), url)
+        
+        await asyncio.gather(*[self._get_robots(url) for domain, url in seeds.items() if domain])
+        
+        for domain in seeds:
+            rules = self._robots.get(domain)
+            if rules and rules.crawl_delay and rules.crawl_delay > crawl.delay:
+                delay = min(rules.crawl_delay, self.ROBOTS_MAX_CRAWL_DELAY)
+                self.rate_limiter.configure(domain, min_interval=delay)
+        
+        return [url for url in urls if self.is_allowed_by_robots(url)]
+    
+    def is_allowed_by_robots(self, url: str) -> bool:
+        """
+        Check a URL against already-loaded robots.txt rules.
+        
+        Args:
+            url: URL to check
+        
+        Returns:
+            bool: False if the URL is disallowed; True if allowed or unknown
+        """
+        if not self._is_disallowed(url):
+            return True
+        
+        self.robots_blocked += 1
+        print(f"  🤖 Disallowed by robots.txt: {url}")
+        return False
+    
+    def _is_disallowed(self, url: str) -> bool:
+        """Check a URL against already-loaded robots.txt rules without counting it."""
+        if not self.global_settings.respect_robots_txt:
+            return False
+        
+        rules = self._robots.get(URLValidator.get_domain(url))
+        return rules is not None and not rules.can_fetch(url)
+    
+    async def _get_robots(self, url: str) -> RobotsRules:
+        """
+        Get the robots.txt rules for a URL's domain, loading them once per run.
+        
+        Args:
+            url: Any URL on the domain
+        
+        Returns:
+            RobotsRules: Parsed rules (allow-all if robots.txt is unavailable)
+        """
+        domain = URLValidator.get_domain(url)
+        lock = self._robots_locks.setdefault(domain, asyncio.Lock())
+        
+        async with lock:
+            if domain in self._robots:
+                return self._robots[domain]
+            
+            body = self.robots_cache.get(domain) if self.robots_cache else None
+            if body is None:
+                body = await self._fetch_robots(url)
+                if body is not None and self.robots_cache:
+                    self.robots_cache.put(domain, body)
+            
+            rules = RobotsRules.parse(body or '', self.global_settings.user_agent)
+            self._robots[domain] = rules
+            return rules
+    
+    async def _fetch_robots(self, url: str) -> Optional[str]:
+        """
+        Fetch robots.txt directly from a site.
+        
+        Args:
+            url: Any URL on the site
+        
+        Returns:
+            Optional[str]: robots.txt content, empty if the site has none
+                (4xx), or None if it could not be fetched
+        """
+        parsed = urlparse(url)
+        robots_url = f"{parsed.scheme or 'https'}://{parsed.netloc}/robots.txt"
+        
+        session = await self._get_session()
+        try:
+            async with session.get(
+                robots_url,
+                headers={'User-Agent': self.global_settings.user_agent},
+                timeout=aiohttp.ClientTimeout(total=self.ROBOTS_TIMEOUT)
+            ) as response:
+                if response.status == 200:
+                    body = bytearray()
+                    async for chunk in response.content.iter_chunked(self.READ_CHUNK_SIZE):
+                        body.extend(chunk)
+                        if len(body) >= self.ROBOTS_MAX_BYTES:
+                            break
+                    return body[:self.ROBOTS_MAX_BYTES].decode('utf-8', errors='replace')
+                
+                # A missing or forbidden robots.txt places no restrictions
+                if 400 <= response.status < 500:
+                    return ''
+                
+                print(f"⚠️ Could not fetch {robots_url}: HTTP {response.status}")
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError) as e:
+            print(f"⚠️ Could not fetch {robots_url}: {e or type(e).__name__}")
+        
+        return None
+    
+    def _get_headers(self) -> Dict[str, str]:
+        """Get Firecrawl API request headers."""
+        return {
             'Authorization': f'Bearer {self.api_key}',
             'Content-Type': 'application/json'
         }
+    
+    async def scrape_url(self, url: str, formats: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Scrape a single URL using Firecrawl, retrying transient failures.
+        
+        Fresh results from the scrape cache are returned without a request.
+        Pages selected for direct fetching are fetched from the site first and
+        only go through Firecrawl if that fails.
+        
+        Args:
+            url: URL to scrape
+            formats: Page formats to request (defaults to the competitor's
+                configured formats, markdown only if unset)
+        
+        Returns:
+            Dict with scraped content or None if failed
+        """
+        domain = URLValidator.get_domain(url)
+        formats = formats or self._formats.get(domain, self.DEFAULT_FORMATS)
+        
+        if self.cache:
+            cached = self.cache.get(url, fields=formats)
+            if cached:
+                print(f"  💾 Cache hit: {url}")
+                return cached
+        
+        if self._use_direct(url):
+            result = await self._scrape_direct(url, formats)
+            if result:
+                if self.cache:
+                    result['content_hash'] = self.cache.put(url, result)
+                return result
+        
+        retry_policy = self._retry_policies.get(domain, self.default_retry_policy)
+        
+        try:
+            result = await retry_policy.run(self._scrape_once, url, formats, description=url)
+            if self.cache and result.get('status') == 'success':
+                result['content_hash'] = self.cache.put(url, result)
+            return result
+        
+        except RetryableError as e:
+            print(f"❌ Failed to scrape {url}: {e}")
+            return {'url': url, 'status': 'failed', 'error': str(e)}
+        
+        except CircuitOpenError as e:
+            print(f"⛔ Skipping {url}: {e}")
+            return {'url': url, 'status': 'failed', 'error': str(e)}
+        
+        except ResponseTooLargeError as e:
+            self.truncated_pages += 1
+            print(f"⚠️ Aborted oversized page {url}: {e}")
+            return {'url': url, 'status': 'failed', 'error': str(e), 'truncated': True}
+        
+        except Exception as e:
+            print(f"❌ Error scraping {url}: {e or type(e).__name__}")
+            return {'url': url, 'status': 'failed', 'error': str(e) or type(e).__name__}
+    
+    async def fetch_html(self, url: str) -> str:
+        """
+        Fetch a page's HTML on demand.
+        
+        Used as a fallback when a markdown-only scrape came back empty.
+        
+        Args:
+            url: URL to fetch
+        
+        Returns:
+            str: Page HTML, or empty string if unavailable
+        """
+        result = await self.scrape_url(url, formats=['html'])
+        if result and result.get('status') == 'success':
+            return result.get('html', '')
+        return ''
+    
+    def _use_direct(self, url: str) -> bool:
+        """Check whether a URL is configured for direct fetching."""
+        domain = URLValidator.get_domain(url)
+        if self._engines.get(domain) == 'direct':
+            return True
+        return any(pattern in url for pattern in self._direct_patterns.get(domain, []))
+    
+    async def _scrape_direct(self, url: str, formats: List[str]) -> Optional[Dict[str, Any]]:
+        """
+        Fetch a page directly from the site.
+        
+        Args:
+            url: URL to fetch
+            formats: Page formats to return
+        
+        Returns:
+            Dict with scraped content, or None if the page needs Firecrawl
+        """
+        domain = URLValidator.get_domain(url)
+        await self.rate_limiter.acquire(domain)
+        
+        async with self._semaphore:
+            result = await self.direct_fetcher.fetch(url, self._request_headers.get(domain), formats)
+        
+        if result.get('status') == 'success':
+            self.direct_pages += 1
+            return result
+        
+        self.direct_fallbacks += 1
+        print(f"  ↪️ Falling back to Firecrawl for {url}: {result.get('error')}")
+        return None
+    
+    async def _scrape_once(self, url: str, formats: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Make a single Firecrawl scrape request.
         
+        Transport errors, 429s and 5xx responses count against the Firecrawl
+        circuit; pages Firecrawl reports it could not scrape count against
+        the target domain's circuit.
+        
+        Args:
+            url: URL to scrape
+            formats: Page formats to request
+        
+        Returns:
+            Dict with scraped content or failure details
+        
+        Raises:
+            CircuitOpenError: If the domain or API circuit is open
+            RetryableError: If the response status is transient
+            ResponseTooLargeError: If the response exceeds the size limit
+        """
+        domain = URLValidator.get_domain(url)
+        
+        # Fail fast while the target site or the API is known to be down
+        self.circuit_breakers.check(domain, admit=False)
+        self.circuit_breakers.check('firecrawl', admit=False)
+        
+        # Pace the target domain before taking a connection slot
+        await self.rate_limiter.acquire(domain)
+        
+        limit = self.concurrency.get('firecrawl')
+        async with limit.slot():
+            await self.rate_limiter.acquire('firecrawl')
+            
+            # Circuits may have opened while this request was queued
+            self.circuit_breakers.check(domain)
+            self.circuit_breakers.check('firecrawl')
+            started_at = time.monotonic()
+            try:
+                result = await self._post_scrape_hedged(url, formats)
+            except self.RETRY_ON as e:
+                self.circuit_breakers.record_failure('firecrawl')
+                limit.record_failure(e)
+                raise
+            limit.record_success(time.monotonic() - started_at)
+        
+        self.circuit_breakers.record_success('firecrawl')
+        if result.get('status') == 'success':
+            self.circuit_breakers.record_success(domain)
+        else:
+            self.circuit_breakers.record_failure(domain)
+        return result
+    
+    async def _post_scrape_hedged(self, url: str, formats: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Send a scrape request, hedging it when it runs slower than usual.
+        
+        With hedging enabled, a duplicate request is sent once the first one
+        has been pending longer than the configured latency percentile (or
+        hedge_delay until enough latencies are recorded), within the hedge
+        budget. Whichever finishes first successfully is used. The duplicate
+        is skipped unless a concurrency slot and domain and API rate tokens
+        are free right away, and the losing request's elapsed time is still
+        recorded as a latency sample.
+        
+        Args:
+            url: URL to scrape
+            formats: Page formats to request
+        
+        Returns:
+            Dict with scraped content or failure details
+        """
+        if not self.global_settings.hedge_requests:
+            return await self._post_scrape(url, formats)
+        
+        delay = self.latency.percentile(self.global_settings.hedge_percentile)
+        if delay is None:
+            delay = self.global_settings.hedge_delay
+        domain = URLValidator.get_domain(url)
+        limit = self.concurrency.get('firecrawl')
+        
+        async def send() -> Dict[str, Any]:
+            started_at = time.monotonic()
+            try:
+                return await self._post_scrape(url, formats)
+            except asyncio.CancelledError:
+                # The loser took at least this long; dropping it would pull the percentile down
+                self.latency.record(time.monotonic() - started_at)
+                raise
+        
+        async def hedge() -> Dict[str, Any]:
+            # Hedges respect the domain delay and concurrency limit like any
+            # other request, but are skipped rather than queued
+            if not limit.try_acquire():
+                raise HedgeUnavailableError("No free Firecrawl concurrency slot")
+            try:
+                if not self.rate_limiter.try_acquire(domain, 'firecrawl'):
+                    raise HedgeUnavailableError(f"No rate budget left for {domain}")
+                print(f"  🔀 Hedging slow scrape after {delay:.1f}s: {url}")
+                return await send()
+            finally:
+                limit.release()
+        
+        return await run_hedged(send, hedge, delay, self.hedge_budget)
+    
+    async def _post_scrape(self, url: str, formats: Optional[List[str]] = None) -> Dict[str, Any]:
+        """
+        Send a scrape request to Firecrawl and parse the response.
+        
+        Args:
+            url: URL to scrape
+            formats: Page formats to request
+        
+        Returns:
+            Dict with scraped content or failure details
+        
+        Raises:
+            RetryableError: If the response status is transient
+            ResponseTooLargeError: If the response exceeds the size limit
+        """
         payload = {
             'url': url,
-            'formats': ['markdown', 'html'],
+            'formats': formats or self.DEFAULT_FORMATS,
             'onlyMainContent': True
         }
         
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/scrape",
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get('success'):
-                            return {
-                                'url': url,
-                                'markdown': data.get('data', {}).get('markdown', ''),
-                                'html': data.get('data', {}).get('html', ''),
-                                'title': data.get('data', {}).get('metadata', {}).get('title', ''),
-                                'status': 'success'
-                            }
-                    
-                    print(f"❌ Failed to scrape {url}: HTTP {response.status}")
-                    return {'url': url, 'status': 'failed', 'error': f'HTTP {response.status}'}
-                    
-        except Exception as e:
-            print(f"❌ Error scraping {url}: {e}")
-            return {'url': url, 'status': 'failed', 'error': str(e)}
+        session = await self._get_session()
+        started_at = time.monotonic()
+        async with session.post(
+            f"{self.base_url}/scrape",
+            json=payload,
+            headers=self._get_headers(),
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as response:
+            if response.status == 200:
+                data = await self._read_json_limited(response)
+                if data.get('success'):
+                    self.latency.record(time.monotonic() - started_at)
+                    return {
+                        'url': url,
+                        'markdown': data.get('data', {}).get('markdown', ''),
+                        'html': data.get('data', {}).get('html', ''),
+                        'title': data.get('data', {}).get('metadata', {}).get('title', ''),
+                        'status': 'success'
+                    }
+                
+                # Firecrawl answered but could not load the page itself
+                error = data.get('error') or 'Scrape unsuccessful'
+                print(f"❌ Failed to scrape {url}: {error}")
+                return {'url': url, 'status': 'failed', 'error': error}
+            
+            if is_retryable_status(response.status):
+                raise RetryableError(
+                    f"HTTP {response.status}",
+                    status=response.status,
+                    retry_after=parse_retry_after(response.headers.get('Retry-After'))
+                )
+            
+            print(f"❌ Failed to scrape {url}: HTTP {response.status}")
+            return {'url': url, 'status': 'failed', 'error': f'HTTP {response.status}'}
+    
+    async def _read_json_limited(self, response: aiohttp.ClientResponse) -> Dict[str, Any]:
+        """
+        Stream a JSON response body, aborting once it exceeds the size limit.
+        
+        Args:
+            response: HTTP response to read
+        
+        Returns:
+            Parsed JSON body
+        
+        Raises:
+            ResponseTooLargeError: If the body exceeds max_response_bytes
+        """
+        limit = self.max_response_bytes
+        if response.content_length is not None and response.content_length > limit:
+            raise ResponseTooLargeError(f"Content-Length {response.content_length} exceeds {limit} bytes")
+        
+        body = bytearray()
+        async for chunk in response.content.iter_chunked(self.READ_CHUNK_SIZE):
+            body.extend(chunk)
+            if len(body) > limit:
+                # Leaving the response context closes the connection unread
+                raise ResponseTooLargeError(f"Response exceeds {limit} bytes")
+        
+        return json.loads(body)
     
-    async def scrape_competitor_urls(self, competitor_config: Dict[str, Any]) -> List[Dict[str, Any]]:
+    async def scrape_competitor_urls(
+        self,
+        competitor_config: Dict[str, Any],
+        concurrent: bool = True,
+        on_page: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
         """
         Scrape all URLs for a competitor.
         
         Args:
             competitor_config: Competitor configuration
+            concurrent: Fan out all configured URLs under the shared concurrency
+                limit; when False, scrape a truncated URL list one at a time
+            on_page: Called with each tagged page as soon as it is scraped
+        
+        Returns:
+            List of scraped content, in input order
+        """
+        name = competitor_config.get('name', 'Unknown')
+        print(f"🕷️ Scraping {name}...")
+        
+        crawl = self.configure_competitor(competitor_config)
+        
+        if crawl.mode == 'crawl':
+            results = []
+            async for page in self.crawl_competitor(competitor_config, crawl):
+                results.append(page)
+                if on_page:
+                    on_page(page)
+            print(f"  ✅ {len(results)} pages crawled")
+            return results
+        
+        if crawl.mode == 'frontier':
+            return await self.crawl_frontier(competitor_config, crawl, on_page)
+        
+        if crawl.mode == 'sitemap':
+            return await self.crawl_sitemap(competitor_config, crawl, on_page)
+        
+        if not concurrent:
+            return await self._scrape_sequential(competitor_config, crawl, on_page)
+        
+        new_urls = competitor_config.get('new_urls', [])
+        promo_urls = competitor_config.get('promo_urls', [])
+        tagged_urls = [(url, 'new') for url in new_urls] + [(url, 'promo') for url in promo_urls]
+        
+        allowed = set(await self.filter_by_robots([url for url, _ in tagged_urls], crawl))
+        tagged_urls = [(url, url_type) for url, url_type in tagged_urls if url in allowed]
+        
+        # Scrape URLs concurrently; gather preserves input order
+        results = await asyncio.gather(*[
+            self._scrape_tagged(url, url_type, name, on_page)
+            for url, url_type in tagged_urls
+        ])
+        results = [r for r in results if r]
+        
+        successful = len([r for r in results if r.get('status') == 'success'])
+        print(f"  ✅ {successful}/{len(tagged_urls)} URLs scraped successfully")
+        
+        return results
+    
+    async def crawl_frontier(
+        self,
+        competitor_config: Dict[str, Any],
+        crawl: Optional[CrawlSettings] = None,
+        on_page: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Crawl a competitor breadth-first from its seed URLs.
+        
+        Each level of the frontier is scraped concurrently; links found on
+        its pages are normalized, filtered by the competitor's exclude
+        patterns, deduplicated and scheduled one level deeper, up to
+        crawl.depth levels and crawl.limit pages (seeds included). Only
+        links on the seeds' domains are followed.
+        
+        Args:
+            competitor_config: Competitor configuration
+            crawl: Competitor crawl settings
+            on_page: Called with each tagged page as soon as it is scraped
+        
+        Returns:
+            List of scraped pages tagged with competitor and url_type, in
+            crawl order
+        """
+        name = competitor_config.get('name', 'Unknown')
+        crawl = crawl or self.configure_competitor(competitor_config)
+        competitor = Competitor(**competitor_config)
+        
+        new_urls = competitor_config.get('new_urls', [])
+        promo_urls = competitor_config.get('promo_urls', [])
+        tagged_urls = [(url, 'new') for url in new_urls] + [(url, 'promo') for url in promo_urls]
+        
+        frontier = CrawlFrontier(
+            max_depth=crawl.depth,
+            limit=crawl.limit,
+            allowed_domains={URLValidator.get_domain(url) for url, _ in tagged_urls},
+            is_excluded=competitor.is_url_excluded
+        )
+        for url, url_type in tagged_urls:
+            frontier.add(url, 1, url_type)
+        
+        results = []
+        while len(frontier):
+            level = frontier.pop_level()
+            allowed = set(await self.filter_by_robots([url for url, _, _ in level], crawl))
+            level = [entry for entry in level if entry[0] in allowed]
+            
+            pages = await asyncio.gather(*[
+                self._scrape_tagged(url, url_type, name, on_page)
+                for url, _, url_type in level
+            ])
             
+            for (url, depth, url_type), page in zip(level, pages):
+                if not page:
+                    continue
+                results.append(page)
+                if page.get('status') == 'success':
+                    content = f"{page.get('markdown', '')}\n{page.get('html', '')}"
+                    frontier.add_links(content, url, depth, url_type)
+        
+        successful = len([r for r in results if r.get('status') == 'success'])
+        print(f"  ✅ {successful}/{len(results)} pages scraped ({frontier.discovered} URLs discovered)")
+        
+        return results
+    
+    async def crawl_sitemap(
+        self,
+        competitor_config: Dict[str, Any],
+        crawl: Optional[CrawlSettings] = None,
+        on_page: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape a competitor's seed URLs plus sitemap URLs that changed since the last run.
+        
+        Sitemaps (configured, listed in robots.txt, or /sitemap.xml) are
+        streamed into the persistent URL state table; up to crawl.limit URLs
+        that are new or have a newer lastmod than when they were last
+        scraped are then scraped alongside the seeds. URLs disallowed by
+        robots.txt and failed scrapes are recorded in the table so they do
+        not take up later runs' limit.
+        
+        Args:
+            competitor_config: Competitor configuration
+            crawl: Competitor crawl settings
+            on_page: Called with each tagged page as soon as it is scraped
+        
+        Returns:
+            List of scraped pages tagged with competitor and url_type
+        """
+        name = competitor_config.get('name', 'Unknown')
+        crawl = crawl or self.configure_competitor(competitor_config)
+        competitor = Competitor(**competitor_config)
+        store = self._get_url_state()
+        
+        new_urls = competitor_config.get('new_urls', [])
+        promo_urls = competitor_config.get('promo_urls', [])
+        seed_urls = new_urls + promo_urls
+        domain_seeds = {}
+        for url in seed_urls:
+            domain_seeds.setdefault(URLValidator.get_domain(url), url)
+        domains = set(domain_seeds)
+        
+        # Load robots.txt rules first so disallowed sitemap URLs are recorded as such
+        if self.global_settings.respect_robots_txt:
+            await asyncio.gather(*[self._get_robots(seed) for seed in domain_seeds.values()])
+        
+        sitemap_urls = [str(url) for url in competitor.sitemap_urls]
+        if not sitemap_urls:
+            for domain, seed in domain_seeds.items():
+                rules = await self._get_robots(seed)
+                sitemap_urls.extend(rules.sitemaps or [f"{urlparse(seed).scheme}://{domain}/sitemap.xml"])
+        
+        ingested = await self._ingest_sitemaps(name, sitemap_urls, domains, competitor.is_url_excluded)
+        pending = dict(store.get_pending(name, crawl.limit))
+        print(f"  🗺️ {ingested} sitemap URLs read, {len(pending)} new or modified")
+        
+        # Promotion listings rarely appear in sitemaps, so seeds are always scraped
+        promo_prefixes = [URLValidator.normalize_url(url) for url in promo_urls]
+        tagged_urls = [(url, 'new') for url in new_urls] + [(url, 'promo') for url in promo_urls]
+        
+        # Sitemap URLs that are also seeds are scraped once, as the seed
+        seeds = {URLValidator.normalize_url(url): url for url in seed_urls}
+        state_urls = {}
+        for url in pending:
+            key = URLValidator.normalize_url(url)
+            if key in seeds:
+                state_urls[seeds[key]] = url
+                continue
+            state_urls[url] = url
+            url_type = 'promo' if key.startswith(tuple(promo_prefixes)) else 'new'
+            tagged_urls.append((url, url_type))
+        
+        allowed = set(await self.filter_by_robots([url for url, _ in tagged_urls], crawl))
+        tagged_urls = [(url, url_type) for url, url_type in tagged_urls if url in allowed]
+        
+        results = await asyncio.gather(*[
+            self._scrape_tagged(url, url_type, name, on_page)
+            for url, url_type in tagged_urls
+        ])
+        
+        for (url, _), result in zip(tagged_urls, results):
+            state_url = state_urls.get(url)
+            if state_url is None:
+                continue
+            if result and result.get('status') == 'success':
+                store.mark_scraped(name, state_url, pending[state_url])
+            else:
+                store.mark_failed(name, state_url, pending[state_url])
+        results = [r for r in results if r]
+        
+        successful = len([r for r in results if r.get('status') == 'success'])
+        print(f"  ✅ {successful}/{len(tagged_urls)} URLs scraped successfully")
+        
+        return results
+    
+    def _get_url_state(self) -> URLStateStore:
+        """Get the sitemap URL state store, opening it on first use."""
+        if self._url_state is None:
+            self._url_state = URLStateStore(self.settings.data_dir / "raw" / "url_state.db")
+        return self._url_state
+    
+    async def _ingest_sitemaps(
+        self,
+        competitor: str,
+        sitemap_urls: List[str],
+        domains: Set[str],
+        is_excluded: Callable[[str], bool]
+    ) -> int:
+        """
+        Stream sitemaps into the URL state table, following sitemap indexes.
+        
+        URLs disallowed by already-loaded robots.txt rules are recorded as
+        blocked, so they are not returned as pending.
+        
+        Args:
+            competitor: Competitor name
+            sitemap_urls: Sitemap or sitemap index URLs
+            domains: Domains whose URLs are kept
+            is_excluded: Predicate for URLs matching exclusion patterns
+        
+        Returns:
+            int: Number of page URLs recorded
+        """
+        store = self._get_url_state()
+        queue = deque((url, 0) for url in sitemap_urls)
+        visited = set()
+        batches: Dict[bool, List] = {False: [], True: []}
+        total = 0
+        
+        while queue:
+            sitemap_url, depth = queue.popleft()
+            if sitemap_url in visited:
+                continue
+            visited.add(sitemap_url)
+            
+            async for kind, loc, lastmod in self._stream_sitemap(sitemap_url):
+                if kind == 'sitemap':
+                    if depth < self.SITEMAP_MAX_DEPTH:
+                        queue.append((loc, depth + 1))
+                    continue
+                
+                if URLValidator.get_domain(loc) not in domains or is_excluded(loc):
+                    continue
+                
+                blocked = self._is_disallowed(loc)
+                batch = batches[blocked]
+                batch.append((loc, lastmod))
+                if len(batch) >= self.SITEMAP_BATCH_SIZE:
+                    total += store.upsert(competitor, batch, blocked=blocked)
+                    batch.clear()
+        
+        for blocked, batch in batches.items():
+            if batch:
+                total += store.upsert(competitor, batch, blocked=blocked)
+        return total
+    
+    async def _stream_sitemap(self, url: str) -> AsyncIterator[SitemapEntry]:
+        """
+        Fetch and incrementally parse one sitemap directly from the site.
+        
+        Args:
+            url: Sitemap URL (plain or gzip-compressed XML)
+        
+        Yields:
+            Sitemap entries as they are parsed
+        """
+        await self.rate_limiter.acquire(URLValidator.get_domain(url))
+        parser = SitemapParser()
+        
+        session = await self._get_session()
+        try:
+            async with session.get(
+                url,
+                headers={'User-Agent': self.global_settings.user_agent},
+                timeout=aiohttp.ClientTimeout(total=self.SITEMAP_TIMEOUT)
+            ) as response:
+                if response.status != 200:
+                    print(f"⚠️ Could not fetch sitemap {url}: HTTP {response.status}")
+                    return
+                
+                async for chunk in response.content.iter_chunked(self.READ_CHUNK_SIZE):
+                    for entry in parser.feed(chunk):
+                        yield entry
+                for entry in parser.close():
+                    yield entry
+        
+        except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+            print(f"⚠️ Could not read sitemap {url}: {e or type(e).__name__}")
+    
+    async def crawl_competitor(
+        self,
+        competitor_config: Dict[str, Any],
+        crawl: Optional[CrawlSettings] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Crawl all seed URLs for a competitor with Firecrawl crawl jobs.
+        
+        One job is submitted per seed URL and all jobs are polled concurrently;
+        pages are yielded as soon as any job reports them. Path prefixes that
+        robots.txt disallows are sent as job excludes, so Firecrawl never
+        crawls (or bills for) them; pages matching wildcard rules are still
+        dropped when they are returned.
+        
+        Args:
+            competitor_config: Competitor configuration
+            crawl: Competitor crawl settings
+        
+        Yields:
+            Crawled pages tagged with competitor and url_type
+        """
+        name = competitor_config.get('name', 'Unknown')
+        crawl = crawl or self.configure_competitor(competitor_config)
+        exclude_patterns = competitor_config.get('exclude_patterns', [])
+        
+        new_urls = competitor_config.get('new_urls', [])
+        promo_urls = competitor_config.get('promo_urls', [])
+        tagged_urls = [(url, 'new') for url in new_urls] + [(url, 'promo') for url in promo_urls]
+        
+        allowed = set(await self.filter_by_robots([url for url, _ in tagged_urls], crawl))
+        tagged_urls = [(url, url_type) for url, url_type in tagged_urls if url in allowed]
+        
+        queue: asyncio.Queue = asyncio.Queue()
+        
+        async def pump(url: str, url_type: str) -> None:
+            try:
+                async for page in self.crawl_url(url, crawl, exclude_patterns + self._robots_excludes(url)):
+                    page['competitor'] = name
+                    page['url_type'] = url_type
+                    await queue.put(page)
+            except Exception as e:
+                print(f"❌ Error crawling {url}: {e or type(e).__name__}")
+            finally:
+                await queue.put(None)
+        
+        tasks = [asyncio.create_task(pump(url, url_type)) for url, url_type in tagged_urls]
+        remaining = len(tasks)
+        seen = set()
+        
+        try:
+            while remaining:
+                page = await queue.get()
+                if page is None:
+                    remaining -= 1
+                    continue
+                
+                # Overlapping seed crawls can discover the same page
+                key = URLValidator.normalize_url(page['url'])
+                if key in seen:
+                    continue
+                seen.add(key)
+                
+                # Keep disallowed pages out of extraction
+                if not self.is_allowed_by_robots(page['url']):
+                    continue
+                yield page
+        finally:
+            for task in tasks:
+                task.cancel()
+    
+    def _robots_excludes(self, url: str) -> List[str]:
+        """Get the robots.txt-disallowed path prefixes of a URL's domain as crawl excludes."""
+        if not self.global_settings.respect_robots_txt:
+            return []
+        
+        rules = self._robots.get(URLValidator.get_domain(url))
+        return rules.get_disallowed_prefixes() if rules else []
+    
+    async def crawl_url(
+        self,
+        url: str,
+        crawl: Optional[CrawlSettings] = None,
+        exclude_patterns: Optional[List[str]] = None
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Crawl from a seed URL with a Firecrawl crawl job.
+        
+        Args:
+            url: Seed URL
+            crawl: Crawl settings providing depth and page limit
+            exclude_patterns: URL substrings to skip
+        
+        Yields:
+            Crawled pages as they complete
+        """
+        crawl = crawl or CrawlSettings()
+        exclude_patterns = exclude_patterns or []
+        retry_policy = self._retry_policies.get(URLValidator.get_domain(url), self.default_retry_policy)
+        
+        job_id = await retry_policy.run(
+            self._submit_crawl, url, crawl, exclude_patterns,
+            description=f"crawl {url}"
+        )
+        print(f"  🕸️ Crawl job {job_id} started: {url}")
+        
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + self.CRAWL_JOB_TIMEOUT
+        seen = set()
+        
+        while True:
+            status = await retry_policy.run(
+                self._get_crawl_status, job_id,
+                description=f"crawl status {job_id}"
+            )
+            
+            # In-progress jobs report partial_data; completed jobs report data
+            documents = status.get('data') or status.get('partial_data') or []
+            for document in documents:
+                page = self._parse_document(document, url)
+                if page['url'] in seen or any(pattern in page['url'] for pattern in exclude_patterns):
+                    continue
+                
+                seen.add(page['url'])
+                if self.cache:
+                    page['content_hash'] = self.cache.put(page['url'], page)
+                yield page
+                
+                if len(seen) >= crawl.limit:
+                    return
+            
+            job_status = status.get('status')
+            if job_status == 'completed':
+                return
+            if job_status == 'failed':
+                print(f"❌ Crawl job {job_id} failed: {url}")
+                return
+            if loop.time() > deadline:
+                print(f"⚠️ Crawl job {job_id} timed out after {len(seen)} pages: {url}")
+                return
+            
+            await asyncio.sleep(self.CRAWL_POLL_INTERVAL)
+    
+    async def _submit_crawl(self, url: str, crawl: CrawlSettings, exclude_patterns: List[str]) -> str:
+        """
+        Submit a Firecrawl crawl job.
+        
+        Args:
+            url: Seed URL
+            crawl: Crawl settings providing depth and page limit
+            exclude_patterns: URL patterns to exclude
+        
+        Returns:
+            str: Crawl job ID
+        
+        Raises:
+            CircuitOpenError: If the API circuit is open
+            RetryableError: If the response status is transient
+            RuntimeError: If the job could not be submitted
+        """
+        payload = {
+            'url': url,
+            'crawlerOptions': {
+                'maxDepth': crawl.depth,
+                'limit': crawl.limit,
+                'excludes': exclude_patterns
+            },
+            'pageOptions': {
+                'onlyMainContent': True,
+                'includeHtml': 'html' in crawl.formats
+            }
+        }
+        
+        self.circuit_breakers.check('firecrawl', admit=False)
+        
+        async with self.concurrency.get('firecrawl').slot():
+            await self.rate_limiter.acquire('firecrawl')
+            self.circuit_breakers.check('firecrawl')
+            session = await self._get_session()
+            async with session.post(
+                f"{self.base_url}/crawl",
+                json=payload,
+                headers=self._get_headers(),
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    data = await response.json()
+                    if data.get('jobId'):
+                        return data['jobId']
+                
+                if is_retryable_status(response.status):
+                    raise RetryableError(
+                        f"HTTP {response.status}",
+                        status=response.status,
+                        retry_after=parse_retry_after(response.headers.get('Retry-After'))
+                    )
+                
+                raise RuntimeError(f"Crawl submission failed: HTTP {response.status}")
+    
+    async def _get_crawl_status(self, job_id: str) -> Dict[str, Any]:
+        """
+        Poll a Firecrawl crawl job.
+        
+        Args:
+            job_id: Crawl job ID
+        
+        Returns:
+            Dict with job status and any pages crawled so far
+        
+        Raises:
+            RetryableError: If the response status is transient
+            RuntimeError: If the status could not be fetched
+        """
+        async with self.concurrency.get('firecrawl').slot():
+            await self.rate_limiter.acquire('firecrawl')
+            session = await self._get_session()
+            async with session.get(
+                f"{self.base_url}/crawl/status/{job_id}",
+                headers=self._get_headers(),
+                timeout=aiohttp.ClientTimeout(total=30)
+            ) as response:
+                if response.status == 200:
+                    return await response.json()
+                
+                if is_retryable_status(response.status):
+                    raise RetryableError(
+                        f"HTTP {response.status}",
+                        status=response.status,
+                        retry_after=parse_retry_after(response.headers.get('Retry-After'))
+                    )
+                
+                raise RuntimeError(f"Crawl status failed: HTTP {response.status}")
+    
+    @staticmethod
+    def _parse_document(document: Dict[str, Any], fallback_url: str) -> Dict[str, Any]:
+        """
+        Convert a Firecrawl crawl document to a scrape result.
+        
+        Args:
+            document: Document from a crawl job
+            fallback_url: URL to use if the document has no source URL
+        
+        Returns:
+            Dict with scraped content
+        """
+        metadata = document.get('metadata') or {}
+        return {
+            'url': metadata.get('sourceURL') or document.get('url') or fallback_url,
+            'markdown': document.get('markdown') or document.get('content', ''),
+            'html': document.get('html', ''),
+            'title': metadata.get('title', ''),
+            'status': 'success'
+        }
+    
+    async def _scrape_tagged(
+        self,
+        url: str,
+        url_type: str,
+        competitor: str,
+        on_page: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Scrape a URL and tag the result.
+        
+        Args:
+            url: URL to scrape
+            url_type: URL category ('new' or 'promo')
+            competitor: Competitor name
+            on_page: Called with the tagged result once it is scraped
+        
+        Returns:
+            Tagged scrape result or None if failed
+        """
+        print(f"  📄 Scraping: {url}")
+        result = await self.scrape_url(url)
+        
+        max_pages = self._max_pages.get(URLValidator.get_domain(url), 1)
+        if result and result.get('status') == 'success' and max_pages > 1:
+            result = await self.follow_pagination(result, max_pages)
+        
+        if result:
+            result['competitor'] = competitor
+            result['url_type'] = url_type
+            if on_page:
+                on_page(result)
+        return result
+    
+    async def follow_pagination(self, first_page: Dict[str, Any], max_pages: int) -> Dict[str, Any]:
+        """
+        Fetch the remaining pages of a paginated listing and merge them.
+        
+        Numbered pages (?page=N, /page/N) are fetched concurrently in batches
+        as far as the page links reveal; listings that only expose a next or
+        load-more link are followed one page at a time. Fetching stops at
+        max_pages, at a failed page, or when a page repeats earlier content.
+        
+        Args:
+            first_page: Successful scrape result of the first page
+            max_pages: Maximum pages to fetch, including the first
+        
+        Returns:
+            Dict with the pages' content concatenated in page order, its
+            'content_hash', plus 'pages' and 'page_urls'
+        """
+        def page_content(page: Dict[str, Any]) -> str:
+            return f"{page.get('markdown', '')}\n{page.get('html', '')}"
+        
+        pages = [first_page]
+        seen_hashes = {ScrapeCache.content_hash(first_page)}
+        seen_urls = {URLValidator.normalize_url(first_page['url'])}
+        
+        def accept(page: Optional[Dict[str, Any]]) -> bool:
+            if not page or page.get('status') != 'success':
+                return False
+            digest = ScrapeCache.content_hash(page)
+            if digest in seen_hashes:
+                return False
+            seen_hashes.add(digest)
+            pages.append(page)
+            return True
+        
+        numbered = find_numbered_pages(page_content(first_page), first_page['url'])
+        if numbered:
+            template = next(iter(numbered.values()))
+            fetched = {1}
+            while len(pages) < max_pages:
+                targets = [
+                    number for number in range(2, min(max(numbered), max_pages) + 1)
+                    if number not in fetched
+                ][:max_pages - len(pages)]
+                urls = [
+                    url for url in (numbered.get(number) or page_url(template, number) for number in targets)
+                    if self.is_allowed_by_robots(url)
+                ]
+                if not urls:
+                    break
+                
+                fetched.update(targets)
+                results = await asyncio.gather(*[self.scrape_url(url) for url in urls])
+                
+                accepted = [page for page in results if accept(page)]
+                if not accepted:
+                    break
+                for page in accepted:
+                    numbered.update(find_numbered_pages(page_content(page), page['url']))
+        else:
+            page = first_page
+            while len(pages) < max_pages:
+                next_url = find_next_page(page_content(page), page['url'])
+                if not next_url or URLValidator.normalize_url(next_url) in seen_urls:
+                    break
+                seen_urls.add(URLValidator.normalize_url(next_url))
+                if not self.is_allowed_by_robots(next_url):
+                    break
+                
+                page = await self.scrape_url(next_url)
+                if not accept(page):
+                    break
+        
+        if len(pages) == 1:
+            return first_page
+        
+        print(f"  📑 Merged {len(pages)} pages: {first_page['url']}")
+        merged = dict(first_page)
+        merged['markdown'] = '\n\n'.join(page.get('markdown', '') for page in pages if page.get('markdown'))
+        merged['html'] = '\n'.join(page.get('html', '') for page in pages if page.get('html'))
+        merged['pages'] = len(pages)
+        merged['page_urls'] = [page['url'] for page in pages]
+        
+        merged['content_hash'] = ScrapeCache.content_hash(merged)
+        return merged
+    
+    async def _scrape_sequential(
+        self,
+        competitor_config: Dict[str, Any],
+        crawl: Optional[CrawlSettings] = None,
+        on_page: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Scrape a truncated URL list one at a time.
+        
+        Args:
+            competitor_config: Competitor configuration
+            crawl: Competitor crawl settings
+            on_page: Called with each tagged page as soon as it is scraped
+        
         Returns:
             List of scraped content
         """
         name = competitor_config.get('name', 'Unknown')
-        print(f"🕷️ Scraping {name}...")
         
         # Get URLs (limit to 3-5 for speed)
         new_urls = competitor_config.get('new_urls', [])[:3]
         promo_urls = competitor_config.get('promo_urls', [])[:2]
-        all_urls = new_urls + promo_urls
+        all_urls = await self.filter_by_robots(new_urls + promo_urls, crawl)
         
         results = []
         
-        # Scrape URLs with basic rate limiting
+        # Scrape URLs one by one (pacing comes from the rate limiter)
         for url in all_urls:
             print(f"  📄 Scraping: {url}")
             result = await self.scrape_url(url)
@@ -93,9 +1391,8 @@ class FirecrawlCollector:
                 result['competitor'] = name
                 result['url_type'] = 'new' if url in new_urls else 'promo'
                 results.append(result)
-            
-            # Simple rate limiting
-            await asyncio.sleep(1)
+                if on_page:
+                    on_page(result)
         
         successful = len([r for r in results if r.get('status') == 'success'])
         print(f"  ✅ {successful}/{len(all_urls)} URLs scraped successfully")
@@ -105,10 +1402,9 @@ class FirecrawlCollector:
 
 async def test_collector():
     """Test the collector with a simple URL."""
-    collector = FirecrawlCollector()
-    
-    # Test with a simple page
-    result = await collector.scrape_url("https://httpbin.org/html")
+    async with FirecrawlCollector() as collector:
+        # Test with a simple page
+        result = await collector.scrape_url("https://httpbin.org/html")
     
     if result and result.get('status') == 'success':
         print("✅ Collector test successful!")
@@ -0,0 +1,177 @@
+"""
+Breadth-first crawl frontier for the competitive intelligence system.
+
+This module extracts links from scraped pages and schedules them level by
+level up to a crawl depth and page limit, deduplicating normalized URLs with
+a Bloom filter that settles new URLs on its own, and a set of compact URL
+fingerprints consulted only when the filter reports a possible repeat.
+"""
+
+import hashlib
+import re
+from collections import deque
+from typing import Callable, Deque, Iterable, List, Optional, Set, Tuple
+from urllib.parse import urldefrag, urljoin, urlparse
+
+from src.utils.bloom_filter import BloomFilter
+from src.utils.validators import URLValidator
+
+
+# Markdown links/images and HTML href attributes
+MARKDOWN_LINK_PATTERN = re.compile(r'\]\(\s*<?([^)\s>]+)>?(?:\s+"[^"]*")?\s*\)')
+HTML_HREF_PATTERN = re.compile(r'href\s*=\s*["\']([^"\'#][^"\']*)["\']', re.IGNORECASE)
+
+# Links to files rather than pages
+SKIPPED_EXTENSIONS = (
+    '.jpg', '.jpeg', '.png', '.gif', '.webp', '.svg', '.ico',
+    '.pdf', '.zip', '.mp4', '.mp3', '.css', '.js', '.json', '.xml'
+)
+
+# (url, depth, url_type)
+FrontierEntry = Tuple[str, int, str]
+
+
+def extract_links(content: str, base_url: str) -> List[str]:
+    """
+    Extract absolute page links from markdown or HTML content.
+    
+    Args:
+        content: Page markdown or HTML
+        base_url: URL the content was fetched from
+    
+    Returns:
+        List[str]: Absolute http(s) URLs without fragments, in page order
+    """
+    links = []
+    for pattern in (MARKDOWN_LINK_PATTERN, HTML_HREF_PATTERN):
+        for match in pattern.finditer(content or ''):
+            url, _ = urldefrag(urljoin(base_url, match.group(1).strip()))
+            parsed = urlparse(url)
+            if parsed.scheme not in ('http', 'https'):
+                continue
+            if parsed.path.lower().endswith(SKIPPED_EXTENSIONS):
+                continue
+            links.append(url)
+    return links
+
+
+class CrawlFrontier:
+    """Breadth-first URL frontier with depth and page limits."""
+    
+    def __init__(
+        self,
+        max_depth: int,
+        limit: int,
+        allowed_domains: Iterable[str],
+        is_excluded: Optional[Callable[[str], bool]] = None,
+        expected_urls: int = 100000
+    ):
+        """
+        Initialize frontier.
+        
+        Args:
+            max_depth: Deepest level scheduled (seeds are depth 1)
+            limit: Maximum number of URLs scheduled in total
+            allowed_domains: Domains links may point to
+            is_excluded: Predicate for URLs matching exclusion patterns
+            expected_urls: Expected distinct discovered URLs (sizes the Bloom filter)
+        """
+        self.max_depth = max_depth
+        self.limit = limit
+        self.allowed_domains = {domain.lower() for domain in allowed_domains if domain}
+        self.is_excluded = is_excluded or (lambda url: False)
+        
+        # The Bloom filter clears new URLs; fingerprints settle its possible hits
+        self._bloom = BloomFilter(capacity=expected_urls)
+        self._fingerprints: Set[int] = set()
+        self._queue: Deque[FrontierEntry] = deque()
+        
+        self.scheduled = 0
+        self.discovered = 0
+    
+    @staticmethod
+    def _fingerprint(url: str) -> int:
+        """Get a compact 64-bit fingerprint of a normalized URL."""
+        return int.from_bytes(hashlib.blake2b(url.encode('utf-8'), digest_size=8).digest(), 'big')
+    
+    def _mark_seen(self, url: str) -> bool:
+        """
+        Record a normalized URL as seen.
+        
+        Returns:
+            bool: True if the URL had not been seen before
+        """
+        fingerprint = self._fingerprint(url)
+        
+        # Only URLs whose Bloom filter bits were all set already can be repeats
+        if not self._bloom.add(url) and fingerprint in self._fingerprints:
+            return False
+        
+        self._fingerprints.add(fingerprint)
+        return True
+    
+    def add(self, url: str, depth: int, url_type: str) -> bool:
+        """
+        Schedule a URL if it is new, in scope and within the limits.
+        
+        Args:
+            url: Absolute URL
+            depth: Crawl level of the URL (seeds are depth 1)
+            url_type: URL category inherited from the seed ('new' or 'promo')
+        
+        Returns:
+            bool: True if the URL was scheduled
+        """
+        if depth > self.max_depth or self.scheduled >= self.limit:
+            return False
+        
+        normalized = URLValidator.normalize_url(url)
+        if URLValidator.get_domain(normalized) not in self.allowed_domains:
+            return False
+        if not self._mark_seen(normalized):
+            return False
+        
+        self.discovered += 1
+        if self.is_excluded(normalized):
+            return False
+        
+        self._queue.append((url, depth, url_type))
+        self.scheduled += 1
+        return True
+    
+    def add_links(self, content: str, base_url: str, depth: int, url_type: str) -> int:
+        """
+        Schedule links found on a page one level below it.
+        
+        Args:
+            content: Page markdown or HTML
+            base_url: URL of the page
+            depth: Crawl level of the page
+            url_type: URL category of the page
+        
+        Returns:
+            int: Number of links scheduled
+        """
+        if depth >= self.max_depth:
+            return 0
+        return sum(self.add(link, depth + 1, url_type) for link in extract_links(content, base_url))
+    
+    def pop_level(self) -> List[FrontierEntry]:
+        """
+        Take every scheduled URL at the shallowest pending depth.
+        
+        Returns:
+            List[FrontierEntry]: URLs of one crawl level, in discovery order
+        """
+        if not self._queue:
+            return []
+        
+        depth = self._queue[0][1]
+        level = []
+        while self._queue and self._queue[0][1] == depth:
+            level.append(self._queue.popleft())
+        return level
+    
+    def __len__(self) -> int:
+        """Get the number of URLs waiting to be crawled."""
+        return len(self._queue)
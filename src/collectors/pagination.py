@@ -0,0 +1,140 @@
+"""
+Pagination detection for category listing pages.
+
+This module finds numbered page links (?page=N, /page/N), rel="next" links
+and load-more links on a scraped listing page, so the collector can fetch
+the rest of the listing.
+"""
+
+import re
+from typing import Dict, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urljoin, urlparse, urlunparse
+
+from src.collectors.frontier import extract_links
+
+
+# Query parameters commonly used for page numbers
+PAGE_PARAMS = ('page', 'p', 'pg', 'pagenum', 'pagenumber', 'currentpage')
+
+# Path segments like /page/3 or /page-3
+PATH_PAGE_PATTERN = re.compile(r'/page[/-](\d+)/?$', re.IGNORECASE)
+
+# <a>/<link> tags marked rel="next"
+REL_NEXT_PATTERN = re.compile(r'<(?:a|link)\b[^>]*\brel\s*=\s*["\']?next\b[^>]*>', re.IGNORECASE)
+HREF_PATTERN = re.compile(r'\bhref\s*=\s*["\']([^"\']+)["\']', re.IGNORECASE)
+
+# Markdown links and HTML attributes for "next" and "load more" controls
+NEXT_TEXT_PATTERN = re.compile(
+    r'\[\s*(?:next(?:\s+page)?|load\s+more|show\s+more|view\s+more|›|»|>)\s*\]\(\s*<?([^)\s>]+)',
+    re.IGNORECASE
+)
+LOAD_MORE_ATTR_PATTERN = re.compile(
+    r'\bdata-(?:next-url|next-page-url|load-more-url|url)\s*=\s*["\']([^"\']*(?:page|offset|start)[^"\']*)["\']',
+    re.IGNORECASE
+)
+
+
+def get_page_number(url: str) -> Optional[Tuple[str, int]]:
+    """
+    Get the page number encoded in a URL.
+    
+    Args:
+        url: Page URL
+    
+    Returns:
+        Optional[Tuple[str, int]]: (query parameter name or 'path', page number),
+            or None if the URL has no page number
+    """
+    parsed = urlparse(url)
+    for name, value in parse_qsl(parsed.query, keep_blank_values=True):
+        if name.lower() in PAGE_PARAMS and value.isdigit():
+            return name, int(value)
+    
+    match = PATH_PAGE_PATTERN.search(parsed.path)
+    if match:
+        return 'path', int(match.group(1))
+    return None
+
+
+def _listing_key(url: str) -> Tuple[str, str]:
+    """Get the host and path of a listing with any page number removed."""
+    parsed = urlparse(url)
+    path = PATH_PAGE_PATTERN.sub('', parsed.path).rstrip('/')
+    return parsed.netloc.lower(), path
+
+
+def page_url(template_url: str, page: int) -> str:
+    """
+    Build the URL of another page from a numbered page URL.
+    
+    Args:
+        template_url: URL of any numbered page of the listing
+        page: Page number to build
+    
+    Returns:
+        str: URL of the requested page
+    """
+    found = get_page_number(template_url)
+    if found is None:
+        raise ValueError(f"No page number in {template_url}")
+    
+    name, _ = found
+    parsed = urlparse(template_url)
+    if name == 'path':
+        path = PATH_PAGE_PATTERN.sub(lambda m: m.group(0).replace(m.group(1), str(page)), parsed.path)
+        return urlunparse(parsed._replace(path=path))
+    
+    query = [
+        (key, str(page) if key == name else value)
+        for key, value in parse_qsl(parsed.query, keep_blank_values=True)
+    ]
+    return urlunparse(parsed._replace(query=urlencode(query)))
+
+
+def find_numbered_pages(content: str, url: str) -> Dict[int, str]:
+    """
+    Find links to numbered pages of the same listing.
+    
+    Args:
+        content: Page markdown or HTML
+        url: URL of the page
+    
+    Returns:
+        Dict[int, str]: Page number to URL
+    """
+    listing = _listing_key(url)
+    pages = {}
+    for link in extract_links(content, url):
+        found = get_page_number(link)
+        if found and _listing_key(link) == listing:
+            pages.setdefault(found[1], link)
+    return pages
+
+
+def find_next_page(content: str, url: str) -> Optional[str]:
+    """
+    Find the link to the next page of a listing.
+    
+    Checks rel="next" links, then "Next"/"Load more" link text, then
+    load-more data attributes.
+    
+    Args:
+        content: Page markdown or HTML
+        url: URL of the page
+    
+    Returns:
+        Optional[str]: Absolute URL of the next page, if any
+    """
+    content = content or ''
+    
+    for tag in REL_NEXT_PATTERN.findall(content):
+        href = HREF_PATTERN.search(tag)
+        if href:
+            return urljoin(url, href.group(1))
+    
+    for pattern in (NEXT_TEXT_PATTERN, LOAD_MORE_ATTR_PATTERN):
+        match = pattern.search(content)
+        if match:
+            return urljoin(url, match.group(1).strip())
+    
+    return None
@@ -0,0 +1,141 @@
+"""
+Streaming sitemap parser for the competitive intelligence system.
+
+This module parses sitemap and sitemap index XML incrementally from raw
+(optionally gzip-compressed) chunks, so sitemaps with tens of thousands of
+URLs are processed without holding the document in memory.
+"""
+
+import zlib
+from datetime import datetime, timezone
+from typing import List, Optional, Tuple
+from xml.etree.ElementTree import ParseError, XMLPullParser
+
+
+# (kind, loc, lastmod) where kind is 'url' or 'sitemap'
+SitemapEntry = Tuple[str, str, Optional[str]]
+
+GZIP_MAGIC = b'\x1f\x8b'
+
+
+def normalize_lastmod(value: Optional[str]) -> Optional[str]:
+    """
+    Normalize a sitemap lastmod value to a sortable UTC timestamp.
+    
+    Args:
+        value: W3C datetime (e.g. '2024-01-15' or '2024-01-15T10:30:00+01:00')
+    
+    Returns:
+        Optional[str]: ISO-8601 UTC timestamp, or None if missing/invalid
+    """
+    if not value or not value.strip():
+        return None
+    
+    value = value.strip()
+    if value.endswith(('Z', 'z')):
+        value = value[:-1] + '+00:00'
+    
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed.astimezone(timezone.utc).strftime('%Y-%m-%dT%H:%M:%SZ')
+
+
+class SitemapParser:
+    """Incremental parser for sitemaps and sitemap indexes."""
+    
+    def __init__(self):
+        """Initialize parser."""
+        self._parser = XMLPullParser(events=('start', 'end'))
+        self._decompressor = None
+        self._started = False
+        self._root = None
+        self._loc: Optional[str] = None
+        self._lastmod: Optional[str] = None
+    
+    @staticmethod
+    def _local_name(tag: str) -> str:
+        """Strip the XML namespace from a tag."""
+        return tag.rsplit('}', 1)[-1].lower()
+    
+    def feed(self, chunk: bytes) -> List[SitemapEntry]:
+        """
+        Parse the next chunk of the sitemap.
+        
+        Args:
+            chunk: Raw bytes, gzip-compressed or plain XML
+        
+        Returns:
+            List[SitemapEntry]: Entries completed by this chunk
+        
+        Raises:
+            ValueError: If the content is not valid sitemap XML
+        """
+        if not chunk:
+            return []
+        
+        if not self._started:
+            self._started = True
+            if chunk.startswith(GZIP_MAGIC):
+                self._decompressor = zlib.decompressobj(16 + zlib.MAX_WBITS)
+        
+        if self._decompressor is not None:
+            try:
+                chunk = self._decompressor.decompress(chunk)
+            except zlib.error as e:
+                raise ValueError(f"Invalid gzip sitemap: {e}") from e
+        
+        # Syntax errors surface when parser events are read
+        try:
+            self._parser.feed(chunk)
+            return self._drain()
+        except ParseError as e:
+            raise ValueError(f"Invalid sitemap XML: {e}") from e
+    
+    def close(self) -> List[SitemapEntry]:
+        """
+        Finish parsing.
+        
+        Returns:
+            List[SitemapEntry]: Any remaining entries
+        
+        Raises:
+            ValueError: If the sitemap XML is incomplete or invalid
+        """
+        try:
+            self._parser.close()
+            return self._drain()
+        except ParseError as e:
+            raise ValueError(f"Invalid sitemap XML: {e}") from e
+    
+    def _drain(self) -> List[SitemapEntry]:
+        """Collect entries from pending parser events."""
+        entries = []
+        for event, element in self._parser.read_events():
+            name = self._local_name(element.tag)
+            
+            if event == 'start':
+                if self._root is None:
+                    self._root = element
+                if name in ('url', 'sitemap'):
+                    self._loc = None
+                    self._lastmod = None
+                continue
+            
+            # The first loc/lastmod belong to the entry; later ones come from
+            # extensions such as image:loc
+            if name == 'loc' and self._loc is None:
+                self._loc = (element.text or '').strip()
+            elif name == 'lastmod' and self._lastmod is None:
+                self._lastmod = normalize_lastmod(element.text)
+            elif name in ('url', 'sitemap'):
+                if self._loc:
+                    entries.append((name, self._loc, self._lastmod))
+                # Drop finished entries so memory stays flat
+                self._root.clear()
+        
+        return entries
@@ -0,0 +1,129 @@
+"""
+Markdown chunking for extraction.
+
+This module splits page markdown into token-budgeted chunks on section
+boundaries (headings, which on listing pages usually start a product),
+falling back to paragraphs, lines and finally fixed-size pieces, so a whole
+page can be extracted in parallel calls. Results from the chunks are merged
+and deduplicated.
+"""
+
+import re
+from typing import Any, Callable, Dict, Iterable, List
+
+
+# Headings start a new section; horizontal rules separate sections
+HEADING_PATTERN = re.compile(r'^#{1,6}\s')
+RULE_PATTERN = re.compile(r'^\s*(?:-{3,}|\*{3,}|_{3,})\s*$')
+BLANK_LINES_PATTERN = re.compile(r'\n\s*\n')
+
+
+def split_sections(markdown: str) -> List[str]:
+    """
+    Split markdown before each heading and at horizontal rules.
+    
+    Args:
+        markdown: Page markdown
+    
+    Returns:
+        List[str]: Sections in page order
+    """
+    sections = []
+    current: List[str] = []
+    for line in markdown.splitlines():
+        is_rule = RULE_PATTERN.match(line)
+        if (HEADING_PATTERN.match(line) or is_rule) and current:
+            sections.append('\n'.join(current).strip())
+            current = []
+        if not is_rule:
+            current.append(line)
+    
+    if current:
+        sections.append('\n'.join(current).strip())
+    return [section for section in sections if section]
+
+
+def split_paragraphs(markdown: str) -> List[str]:
+    """Split markdown at blank lines."""
+    return [part.strip() for part in BLANK_LINES_PATTERN.split(markdown) if part.strip()]
+
+
+def split_lines(markdown: str) -> List[str]:
+    """Split markdown into non-empty lines."""
+    return [line for line in markdown.splitlines() if line.strip()]
+
+
+# Boundaries tried in order, with the separator used to rejoin parts
+SPLITTERS = (
+    (split_sections, '\n\n'),
+    (split_paragraphs, '\n\n'),
+    (split_lines, '\n')
+)
+
+
+def _split(text: str, max_chars: int, level: int = 0) -> List[str]:
+    """Split text into pieces of at most max_chars, preferring coarser boundaries."""
+    if len(text) <= max_chars:
+        return [text]
+    
+    if level >= len(SPLITTERS):
+        return [text[start:start + max_chars] for start in range(0, len(text), max_chars)]
+    
+    splitter, separator = SPLITTERS[level]
+    parts = splitter(text)
+    if len(parts) <= 1:
+        return _split(text, max_chars, level + 1)
+    
+    # Pack neighbouring parts greedily; oversized parts are split further
+    chunks = []
+    current = ''
+    for part in parts:
+        for piece in _split(part, max_chars, level + 1):
+            if current and len(current) + len(separator) + len(piece) > max_chars:
+                chunks.append(current)
+                current = ''
+            current = f"{current}{separator}{piece}" if current else piece
+    
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+def chunk_markdown(markdown: str, max_tokens: int, chars_per_token: int = 4) -> List[str]:
+    """
+    Split markdown into chunks that fit a token budget.
+    
+    Args:
+        markdown: Page markdown
+        max_tokens: Approximate token budget per chunk
+        chars_per_token: Characters per token used to size chunks
+    
+    Returns:
+        List[str]: Chunks in page order; empty for blank content
+    """
+    markdown = (markdown or '').strip()
+    if not markdown:
+        return []
+    return _split(markdown, max(1, max_tokens * chars_per_token))
+
+
+def deduplicate(items: Iterable[Dict[str, Any]], key: Callable[[Dict[str, Any]], str]) -> List[Dict[str, Any]]:
+    """
+    Merge results from several chunks, keeping the first of each duplicate.
+    
+    Args:
+        items: Extracted items in chunk order
+        key: Function giving an item's deduplication key
+    
+    Returns:
+        List[Dict[str, Any]]: Unique items in first-seen order
+    """
+    seen = set()
+    unique = []
+    for item in items:
+        item_key = key(item)
+        if item_key in seen:
+            continue
+        seen.add(item_key)
+        unique.append(item)
+    return unique
@@ -5,28 +5,374 @@ Minimal implementation focused on core functionality.
 
 import json
 import asyncio
-from typing import Dict, Any, List, Optional
+import sqlite3
+import time
+from typing import Dict, Any, List, Optional, Callable, Tuple
 import aiohttp
 from config.settings import get_settings
+from src.extractors.chunker import chunk_markdown, deduplicate
+from src.storage.extraction_cache import ExtractionCache
+from src.utils.circuit_breaker import CircuitBreakerRegistry, CircuitOpenError
+from src.utils.concurrency import AdaptiveConcurrency
+from src.utils.rate_limiter import RateLimiter
+from src.utils.retry import RetryPolicy, RetryableError, is_retryable_status, parse_retry_after
 
 
 class ClaudeExtractor:
     """Simple Claude AI integration for data extraction."""
     
-    def __init__(self):
-        """Initialize extractor with settings."""
+    # Transport errors treated as transient
+    RETRY_ON = RetryPolicy.DEFAULT_RETRY_ON + (
+        aiohttp.ClientConnectionError,
+        aiohttp.ClientPayloadError
+    )
+    
+    MODEL = 'claude-3-haiku-20240307'
+    
+    # Bump when an extraction prompt changes so cached results are not reused
+    PROMPT_VERSION = '2'
+    
+    # Rough prompt size estimate for the tokens-per-minute budget
+    CHARS_PER_TOKEN = 4
+    
+    DNS_CACHE_TTL = 300
+    KEEPALIVE_TIMEOUT = 30
+    
+    def __init__(
+        self,
+        rate_limiter: Optional[RateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        circuit_breakers: Optional[CircuitBreakerRegistry] = None,
+        concurrency: Optional[AdaptiveConcurrency] = None,
+        cache: Optional[ExtractionCache] = None
+    ):
+        """
+        Initialize extractor with settings.
+        
+        Args:
+            rate_limiter: Shared rate limiter keyed by domain and API
+            retry_policy: Retry policy for transient API failures
+            circuit_breakers: Shared circuit breakers keyed by domain and API
+            concurrency: Shared adaptive concurrency limits keyed by API
+            cache: Extraction result cache (built from settings if omitted)
+        """
         self.settings = get_settings()
         self.api_key = self.settings.claude_api_key
-        self.base_url = "https://api.anthropic.com/v1"
+        self.base_url = self.settings.claude_base_url.rstrip('/')
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        self.rate_limiter = rate_limiter or RateLimiter()
+        if not self.rate_limiter.is_configured('claude'):
+            self.rate_limiter.configure(
+                'claude',
+                rate_per_minute=self.settings.rate_limit_per_minute,
+                burst=self.settings.max_concurrent_requests
+            )
+        
+        # Input tokens are budgeted per minute alongside the request rate
+        if not self.rate_limiter.is_configured('claude_tokens'):
+            self.rate_limiter.configure(
+                'claude_tokens',
+                rate_per_minute=self.settings.claude_tokens_per_minute,
+                burst=self.settings.claude_tokens_per_minute
+            )
+        
+        self.retry_policy = retry_policy or RetryPolicy(retry_on=self.RETRY_ON)
+        self.circuit_breakers = circuit_breakers or CircuitBreakerRegistry()
+        
+        # Claude concurrency adapts to latency and 429s up to the configured maximum
+        self.concurrency = concurrency or AdaptiveConcurrency()
+        if not self.concurrency.is_configured('claude'):
+            self.concurrency.configure(
+                'claude',
+                initial_limit=1,
+                max_limit=self.settings.max_concurrent_requests
+            )
+        
+        # Pages needing both extractions share one call when enabled
+        self.combined_extraction = self.settings.combined_extraction
+        self.combined_calls = 0
+        self.combined_products = 0
+        self.combined_promotions = 0
+        
+        # Pages are extracted in token-budgeted chunks instead of being truncated
+        self.chunk_tokens = self.settings.extraction_chunk_tokens
+        self.max_chunks = self.settings.extraction_max_chunks
+        
+        # Extraction results for unchanged pages are reused; a zero budget disables the cache
+        if cache is None and self.settings.extraction_cache_max_mb > 0:
+            cache = ExtractionCache(
+                self.settings.data_dir / "processed" / "extraction_cache.db",
+                max_bytes=int(self.settings.extraction_cache_max_mb * 1024 * 1024)
+            )
+        self.cache = cache
+    
+    async def __aenter__(self) -> "ClaudeExtractor":
+        """Open the pooled HTTP session."""
+        await self._get_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        """Close the pooled HTTP session."""
+        await self.close()
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """
+        Get the shared HTTP session, creating it on first use.
+        
+        Returns:
+            Pooled aiohttp session reused across API calls
+        """
+        if self._session is None or self._session.closed:
+            concurrency = self.concurrency.get('claude').max_limit
+            connector = aiohttp.TCPConnector(
+                limit=concurrency,
+                limit_per_host=concurrency,
+                use_dns_cache=True,
+                ttl_dns_cache=self.DNS_CACHE_TTL,
+                keepalive_timeout=self.KEEPALIVE_TIMEOUT
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+    
+    async def close(self) -> None:
+        """Close the HTTP session and the extraction cache."""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+        self._session = None
+        
+        if self.cache is not None:
+            self.cache.close()
+    
+    def _cache_get(self, content: str, kind: str, competitor: str) -> Optional[Any]:
+        """
+        Get a cached extraction result for content.
+        
+        Args:
+            content: Content sent for extraction
+            kind: Extraction type ('products', 'promotions' or 'combined')
+            competitor: Competitor named in the prompt
+        
+        Returns:
+            Cached result, or None on a miss
+        """
+        if self.cache is None:
+            return None
+        
+        try:
+            return self.cache.get(
+                ExtractionCache.content_hash(content, competitor),
+                kind,
+                self.PROMPT_VERSION,
+                self.MODEL
+            )
+        except sqlite3.Error as e:
+            print(f"  ⚠️ Extraction cache read failed: {e}")
+            return None
+    
+    def _cache_put(self, content: str, kind: str, competitor: str, result: Any) -> None:
+        """Store an extraction result for content."""
+        if self.cache is None:
+            return
+        
+        try:
+            self.cache.put(
+                ExtractionCache.content_hash(content, competitor),
+                kind,
+                self.PROMPT_VERSION,
+                self.MODEL,
+                result
+            )
+        except sqlite3.Error as e:
+            print(f"  ⚠️ Extraction cache write failed: {e}")
+    
+    @classmethod
+    def estimate_tokens(cls, text: str) -> int:
+        """
+        Estimate the number of tokens in a prompt.
+        
+        Args:
+            text: Prompt text
+        
+        Returns:
+            int: Approximate token count
+        """
+        return max(1, len(text) // cls.CHARS_PER_TOKEN)
+    
+    def should_combine(self, kinds: List[str]) -> bool:
+        """
+        Check whether a page's extractions should share one combined call.
+        
+        Args:
+            kinds: Extraction types the page needs ('products', 'promotions')
+        
+        Returns:
+            bool: True if the page needs both and combined extraction is enabled
+        """
+        return self.combined_extraction and 'products' in kinds and 'promotions' in kinds
+    
+    async def extract_many(
+        self,
+        pages: List[Dict[str, Any]],
+        competitor: str,
+        on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Run extractions for many pages concurrently.
+        
+        Pages are extracted under a semaphore sized to the adaptive Claude
+        concurrency bound; the request and token rate limits pace the calls.
+        Pages needing both extraction types use one combined call (see
+        should_combine).
+        
+        Args:
+            pages: Pages with 'url', 'content' and 'extract', the extraction
+                types to run ('products' and/or 'promotions')
+            competitor: Competitor name
+            on_result: Called with each page's result as soon as it finishes
+        
+        Returns:
+            List of results in input order, each with the page 'url' and its
+            'products' and 'promotions'
+        """
+        semaphore = asyncio.Semaphore(self.concurrency.get('claude').max_limit)
+        
+        async def extract_page(page: Dict[str, Any]) -> Dict[str, Any]:
+            content = page.get('content', '')
+            kinds = page.get('extract', [])
+            
+            async def products() -> List[Dict[str, Any]]:
+                return await self.extract_products(content, competitor) if 'products' in kinds else []
+            
+            async def promotions() -> List[Dict[str, Any]]:
+                return await self.extract_promotions(content, competitor) if 'promotions' in kinds else []
+            
+            async with semaphore:
+                if self.should_combine(kinds):
+                    found_products, found_promotions = await self.extract_combined(content, competitor)
+                else:
+                    found_products, found_promotions = await asyncio.gather(products(), promotions())
+            
+            result = {
+                'url': page.get('url', ''),
+                'products': found_products,
+                'promotions': found_promotions
+            }
+            if on_result:
+                on_result(result)
+            return result
+        
+        return await asyncio.gather(*[extract_page(page) for page in pages])
+    
+    def _chunk(self, content: str) -> List[str]:
+        """
+        Split content into extraction chunks within the token budget.
+        
+        Args:
+            content: Scraped content (markdown/html)
+        
+        Returns:
+            List[str]: Chunks in page order, at most max_chunks
+        """
+        chunks = chunk_markdown(content, self.chunk_tokens, self.CHARS_PER_TOKEN)
+        if len(chunks) > self.max_chunks:
+            print(f"  ⚠️ Extracting the first {self.max_chunks} of {len(chunks)} chunks")
+            chunks = chunks[:self.max_chunks]
+        return chunks
+    
+    @staticmethod
+    def _product_key(product: Dict[str, Any]) -> str:
+        """Get a product's deduplication key (the fields of Product.get_unique_key)."""
+        url_or_name = product.get('product_url') or str(product.get('product_name', '')).strip().lower()
+        return f"{product.get('competitor')}:{url_or_name}"
+    
+    @staticmethod
+    def _promotion_key(promotion: Dict[str, Any]) -> str:
+        """Get a promotion's deduplication key (the fields of Promotion.get_unique_key)."""
+        title = str(promotion.get('promo_title', '')).lower()
+        return f"{promotion.get('competitor')}:{promotion.get('promo_url')}:{title}"
     
     async def extract_products(self, content: str, competitor: str) -> List[Dict[str, Any]]:
         """
         Extract product data from content.
         
+        Long content is split into chunks that are extracted in parallel;
+        products found in more than one chunk are kept once.
+        
         Args:
             content: Scraped content (markdown/html)
             competitor: Competitor name
             
+        Returns:
+            List of extracted products
+        """
+        chunks = self._chunk(content)
+        results = await asyncio.gather(*[self._extract_products_chunk(chunk, competitor) for chunk in chunks])
+        products = deduplicate((product for found in results for product in found), self._product_key)
+        
+        suffix = f" from {len(chunks)} chunks" if len(chunks) > 1 else ""
+        print(f"  📦 Extracted {len(products)} products{suffix}")
+        return products
+    
+    async def extract_promotions(self, content: str, competitor: str) -> List[Dict[str, Any]]:
+        """
+        Extract promotion data from content.
+        
+        Long content is split into chunks that are extracted in parallel;
+        promotions found in more than one chunk are kept once.
+        
+        Args:
+            content: Scraped content (markdown/html)
+            competitor: Competitor name
+            
+        Returns:
+            List of extracted promotions
+        """
+        chunks = self._chunk(content)
+        results = await asyncio.gather(*[self._extract_promotions_chunk(chunk, competitor) for chunk in chunks])
+        promotions = deduplicate((promo for found in results for promo in found), self._promotion_key)
+        
+        suffix = f" from {len(chunks)} chunks" if len(chunks) > 1 else ""
+        print(f"  🎯 Extracted {len(promotions)} promotions{suffix}")
+        return promotions
+    
+    async def extract_combined(
+        self,
+        content: str,
+        competitor: str
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Extract products and promotions from content with combined calls.
+        
+        Long content is split into chunks that are extracted in parallel;
+        items found in more than one chunk are kept once.
+        
+        Args:
+            content: Scraped content (markdown/html)
+            competitor: Competitor name
+            
+        Returns:
+            Tuple of extracted products and extracted promotions
+        """
+        chunks = self._chunk(content)
+        results = await asyncio.gather(*[self._extract_combined_chunk(chunk, competitor) for chunk in chunks])
+        products = deduplicate((product for found, _ in results for product in found), self._product_key)
+        promotions = deduplicate((promo for _, found in results for promo in found), self._promotion_key)
+        
+        self.combined_products += len(products)
+        self.combined_promotions += len(promotions)
+        suffix = f" from {len(chunks)} chunks" if len(chunks) > 1 else ""
+        print(f"  🧩 Extracted {len(products)} products and {len(promotions)} promotions{suffix}")
+        return products, promotions
+    
+    async def _extract_products_chunk(self, chunk: str, competitor: str) -> List[Dict[str, Any]]:
+        """
+        Extract product data from one chunk of content.
+        
+        Args:
+            chunk: Chunk of scraped content (markdown/html)
+            competitor: Competitor name
+            
         Returns:
             List of extracted products
         """
@@ -44,11 +390,15 @@ Return ONLY a JSON array of products. Each product should have:
 Only extract products that are clearly listed with names and prices. Skip navigation, headers, footers.
 
 Content:
-{content[:3000]}
+{chunk}
 
 Return only valid JSON array:
 """
         
+        cached = self._cache_get(chunk, 'products', competitor)
+        if cached is not None:
+            return cached
+        
         try:
             response = await self._call_claude(prompt)
             if response:
@@ -66,7 +416,7 @@ Return only valid JSON array:
                         if not product.get('brand'):
                             product['brand'] = competitor
                     
-                    print(f"  📦 Extracted {len(products)} products")
+                    self._cache_put(chunk, 'products', competitor, products)
                     return products
                     
         except json.JSONDecodeError as e:
@@ -76,12 +426,12 @@ Return only valid JSON array:
         
         return []
     
-    async def extract_promotions(self, content: str, competitor: str) -> List[Dict[str, Any]]:
+    async def _extract_promotions_chunk(self, chunk: str, competitor: str) -> List[Dict[str, Any]]:
         """
-        Extract promotion data from content.
+        Extract promotion data from one chunk of content.
         
         Args:
-            content: Scraped content (markdown/html)
+            chunk: Chunk of scraped content (markdown/html)
             competitor: Competitor name
             
         Returns:
@@ -101,11 +451,15 @@ Return ONLY a JSON array of promotions. Each promotion should have:
 Only extract clear promotional offers, sales, discounts. Skip regular products.
 
 Content:
-{content[:3000]}
+{chunk}
 
 Return only valid JSON array:
 """
         
+        cached = self._cache_get(chunk, 'promotions', competitor)
+        if cached is not None:
+            return cached
+        
         try:
             response = await self._call_claude(prompt)
             if response:
@@ -121,7 +475,7 @@ Return only valid JSON array:
                     for promo in promotions:
                         promo['competitor'] = competitor
                     
-                    print(f"  🎯 Extracted {len(promotions)} promotions")
+                    self._cache_put(chunk, 'promotions', competitor, promotions)
                     return promotions
                     
         except json.JSONDecodeError as e:
@@ -131,9 +485,90 @@ Return only valid JSON array:
         
         return []
     
+    async def _extract_combined_chunk(
+        self,
+        chunk: str,
+        competitor: str
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Extract products and promotions from one chunk of content in one call.
+        
+        Args:
+            chunk: Chunk of scraped content (markdown/html)
+            competitor: Competitor name
+            
+        Returns:
+            Tuple of extracted products and extracted promotions
+        """
+        prompt = f"""
+Extract product and promotion information from this {competitor} webpage content.
+
+Return ONLY a JSON object with two arrays, "products" and "promotions".
+
+Each product should have:
+- product_name: string
+- brand: string (or "{competitor}" if not specified)
+- category: string (furniture, home_decor, bedding, etc.)
+- price: number (extract numeric value only, no currency symbols)
+- product_url: string (if found in content)
+- image_url: string (if found)
+
+Each promotion should have:
+- promo_title: string
+- promo_type: string (percentage_off, dollar_off, free_shipping, clearance, etc.)
+- discount_value: number (percentage or dollar amount)
+- promo_code: string (if any)
+- promo_url: string (if found)
+- description: string (brief description)
+
+Only extract products that are clearly listed with names and prices, and clear
+promotional offers, sales and discounts. Skip navigation, headers, footers.
+Use an empty array when a page has none of either.
+
+Content:
+{chunk}
+
+Return only valid JSON object:
+"""
+        
+        cached = self._cache_get(chunk, 'combined', competitor)
+        if cached is not None:
+            return cached.get('products', []), cached.get('promotions', [])
+        
+        try:
+            response = await self._call_claude(prompt)
+            if response:
+                # Try to parse JSON from response
+                json_start = response.find('{')
+                json_end = response.rfind('}') + 1
+                
+                if json_start >= 0 and json_end > json_start:
+                    data = json.loads(response[json_start:json_end])
+                    products = data.get('products') or []
+                    promotions = data.get('promotions') or []
+                    
+                    # Add competitor info
+                    for product in products:
+                        product['competitor'] = competitor
+                        if not product.get('brand'):
+                            product['brand'] = competitor
+                    for promo in promotions:
+                        promo['competitor'] = competitor
+                    
+                    self._cache_put(chunk, 'combined', competitor, {'products': products, 'promotions': promotions})
+                    self.combined_calls += 1
+                    return products, promotions
+                    
+        except json.JSONDecodeError as e:
+            print(f"  ❌ JSON parsing error: {e}")
+        except Exception as e:
+            print(f"  ❌ Combined extraction error: {e}")
+        
+        return [], []
+    
     async def _call_claude(self, prompt: str) -> Optional[str]:
         """
-        Make API call to Claude.
+        Make API call to Claude, retrying transient failures.
         
         Args:
             prompt: Prompt to send
@@ -141,6 +576,32 @@ Return only valid JSON array:
         Returns:
             Response text or None if failed
         """
+        try:
+            return await self.retry_policy.run(self._call_claude_once, prompt, description="Claude API call")
+        
+        except RetryableError as e:
+            print(f"  ❌ Claude API error: {e}")
+        except CircuitOpenError as e:
+            print(f"  ⛔ Skipping Claude call: {e}")
+        except Exception as e:
+            print(f"  ❌ Claude API call error: {e or type(e).__name__}")
+        
+        return None
+    
+    async def _call_claude_once(self, prompt: str) -> Optional[str]:
+        """
+        Make a single API call to Claude.
+        
+        Args:
+            prompt: Prompt to send
+        
+        Returns:
+            Response text or None if failed
+        
+        Raises:
+            RetryableError: If the response status is transient
+            CircuitOpenError: If the Claude circuit is open
+        """
         headers = {
             'x-api-key': self.api_key,
             'Content-Type': 'application/json',
@@ -148,7 +609,7 @@ Return only valid JSON array:
         }
         
         payload = {
-            'model': 'claude-3-haiku-20240307',
+            'model': self.MODEL,
             'max_tokens': 2000,
             'messages': [
                 {
@@ -158,23 +619,61 @@ Return only valid JSON array:
             ]
         }
         
-        try:
-            async with aiohttp.ClientSession() as session:
-                async with session.post(
-                    f"{self.base_url}/messages",
-                    json=payload,
-                    headers=headers,
-                    timeout=aiohttp.ClientTimeout(total=30)
-                ) as response:
-                    if response.status == 200:
-                        data = await response.json()
-                        if data.get('content') and len(data['content']) > 0:
-                            return data['content'][0].get('text', '')
-                    else:
-                        print(f"  ❌ Claude API error: HTTP {response.status}")
-                        
-        except Exception as e:
-            print(f"  ❌ Claude API call error: {e}")
+        # Fail fast while the API is known to be down
+        self.circuit_breakers.check('claude', admit=False)
+        
+        limit = self.concurrency.get('claude')
+        async with limit.slot():
+            await self.rate_limiter.acquire('claude')
+            await self.rate_limiter.acquire('claude_tokens', tokens=self.estimate_tokens(prompt))
+            
+            # The circuit may have opened while this call was queued
+            self.circuit_breakers.check('claude')
+            started_at = time.monotonic()
+            try:
+                text = await self._post_messages(payload, headers)
+            except self.RETRY_ON as e:
+                self.circuit_breakers.record_failure('claude')
+                limit.record_failure(e)
+                raise
+            limit.record_success(time.monotonic() - started_at)
+        
+        self.circuit_breakers.record_success('claude')
+        return text
+    
+    async def _post_messages(self, payload: Dict[str, Any], headers: Dict[str, str]) -> Optional[str]:
+        """
+        Send a Messages API request and parse the response.
+        
+        Args:
+            payload: Request body
+            headers: Request headers
+        
+        Returns:
+            Response text or None if failed
+        
+        Raises:
+            RetryableError: If the response status is transient
+        """
+        session = await self._get_session()
+        async with session.post(
+            f"{self.base_url}/messages",
+            json=payload,
+            headers=headers,
+            timeout=aiohttp.ClientTimeout(total=30)
+        ) as response:
+            if response.status == 200:
+                data = await response.json()
+                if data.get('content') and len(data['content']) > 0:
+                    return data['content'][0].get('text', '')
+            elif is_retryable_status(response.status):
+                raise RetryableError(
+                    f"HTTP {response.status}",
+                    status=response.status,
+                    retry_after=parse_retry_after(response.headers.get('Retry-After'))
+                )
+            else:
+                print(f"  ❌ Claude API error: HTTP {response.status}")
         
         return None
 
@@ -196,8 +695,9 @@ async def test_extractor():
     Use code CHAIR20 for 20% off dining chairs
     """
     
-    products = await extractor.extract_products(sample_content, "Test Store")
-    promotions = await extractor.extract_promotions(sample_content, "Test Store")
+    async with extractor:
+        products = await extractor.extract_products(sample_content, "Test Store")
+        promotions = await extractor.extract_promotions(sample_content, "Test Store")
     
     print(f"✅ Test complete: {len(products)} products, {len(promotions)} promotions")
     return len(products) > 0 or len(promotions) > 0
@@ -46,6 +46,79 @@ class CrawlSettings(BaseModel):
         ge=0,
         le=10
     )
+    
+    backoff_base: float = Field(
+        default=1.0,
+        description="Initial retry backoff delay in seconds",
+        ge=0.1,
+        le=60.0
+    )
+    
+    backoff_max: float = Field(
+        default=30.0,
+        description="Maximum retry backoff delay in seconds",
+        ge=1.0,
+        le=300.0
+    )
+    
+    max_pages: int = Field(
+        default=1,
+        description="Maximum pages fetched per paginated listing (1 disables pagination)",
+        ge=1,
+        le=100
+    )
+    
+    mode: str = Field(
+        default="scrape",
+        description=(
+            "Collection mode: 'scrape' seed URLs only, 'crawl' with Firecrawl crawl jobs, "
+            "'frontier' to follow links breadth-first up to depth and limit, or 'sitemap' "
+            "to scrape sitemap URLs that are new or modified since the last run"
+        )
+    )
+    
+    engine: str = Field(
+        default="firecrawl",
+        description=(
+            "Fetch engine: 'firecrawl' for every page or 'direct' to fetch pages straight "
+            "from the site, falling back to Firecrawl for JavaScript-rendered pages"
+        )
+    )
+    
+    formats: List[str] = Field(
+        default_factory=lambda: ["markdown"],
+        description="Page formats to request from Firecrawl ('markdown', 'html')",
+        min_items=1
+    )
+    
+    @validator('mode')
+    def validate_mode(cls, v):
+        """Validate collection mode."""
+        valid_modes = ['scrape', 'crawl', 'frontier', 'sitemap']
+        if v.lower() not in valid_modes:
+            raise ValueError(f"Crawl mode must be one of: {valid_modes}")
+        return v.lower()
+    
+    @validator('engine')
+    def validate_engine(cls, v):
+        """Validate fetch engine."""
+        valid_engines = ['firecrawl', 'direct']
+        if v.lower() not in valid_engines:
+            raise ValueError(f"Engine must be one of: {valid_engines}")
+        return v.lower()
+    
+    @validator('formats')
+    def validate_formats(cls, v):
+        """Validate requested page formats."""
+        valid_formats = ['markdown', 'html']
+        cleaned = []
+        for fmt in v:
+            fmt = fmt.strip().lower()
+            if fmt not in valid_formats:
+                raise ValueError(f"Format must be one of: {valid_formats}")
+            if fmt not in cleaned:
+                cleaned.append(fmt)
+        return cleaned
 
 
 class Competitor(BaseModel):
@@ -125,6 +198,16 @@ class Competitor(BaseModel):
         description="URL patterns to exclude from crawling"
     )
     
+    direct_fetch_patterns: List[str] = Field(
+        default_factory=list,
+        description="URL patterns fetched directly instead of through Firecrawl"
+    )
+    
+    sitemap_urls: List[HttpUrl] = Field(
+        default_factory=list,
+        description="Sitemap or sitemap index URLs (defaults to robots.txt entries or /sitemap.xml)"
+    )
+    
     class Config:
         """Pydantic configuration."""
         validate_assignment = True
@@ -252,12 +335,83 @@ class GlobalSettings(BaseModel):
         le=20
     )
     
+    adaptive_concurrency: bool = Field(
+        default=True,
+        description="Grow per-API concurrency while requests are healthy and cut it on 429s, timeouts and latency spikes"
+    )
+    
+    max_concurrent_requests: int = Field(
+        default=20,
+        description="Upper bound for adaptive per-API concurrency",
+        ge=1,
+        le=100
+    )
+    
+    max_response_mb: float = Field(
+        default=10.0,
+        description="Maximum scrape response body size in MB before aborting",
+        ge=0.1,
+        le=500.0
+    )
+    
+    circuit_failure_threshold: int = Field(
+        default=5,
+        description="Consecutive failures before a domain or API circuit opens",
+        ge=1,
+        le=100
+    )
+    
+    circuit_cooldown_seconds: float = Field(
+        default=60.0,
+        description="Seconds an open circuit fails fast before probing again",
+        ge=1.0,
+        le=3600.0
+    )
+    
+    hedge_requests: bool = Field(
+        default=False,
+        description="Send a duplicate scrape when the first one is slower than usual"
+    )
+    
+    hedge_percentile: float = Field(
+        default=95.0,
+        description="Recent scrape latency percentile after which a request is hedged",
+        ge=50.0,
+        le=99.9
+    )
+    
+    hedge_delay: float = Field(
+        default=10.0,
+        description="Hedge delay in seconds until enough latencies are recorded",
+        ge=0.5,
+        le=120.0
+    )
+    
+    hedge_budget: float = Field(
+        default=0.1,
+        description="Maximum hedged requests as a fraction of scrapes",
+        ge=0.0,
+        le=1.0
+    )
+    
     rate_limit_per_minute: int = Field(
         default=60,
         description="Rate limit per minute",
         ge=1,
         le=1000
     )
+    
+    def get_max_concurrency(self) -> int:
+        """
+        Get the highest concurrency allowed per API.
+        
+        Returns:
+            int: Adaptive upper bound, or the fixed concurrent_requests limit
+                when adaptive concurrency is disabled
+        """
+        if not self.adaptive_concurrency:
+            return self.concurrent_requests
+        return max(self.max_concurrent_requests, self.concurrent_requests)
 
 
 class CompetitorConfig(BaseModel):
@@ -0,0 +1,313 @@
+"""
+Local stand-in Anthropic Messages API server for extractor load testing.
+
+Serves POST /v1/messages with canned or rule-generated JSON product and
+promotion arrays, configurable latency, per-token generation time,
+reported token counts and rate-limit responses.
+
+Usage:
+    python -m src.simulators.anthropic_server --port 8766 --tokens-per-minute 50000
+    CLAUDE_BASE_URL=http://localhost:8766/v1 python scripts/run_pipeline.py
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import re
+import time
+import uuid
+from collections import deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+
+from aiohttp import web
+from pydantic import BaseModel, Field
+
+from src.simulators.common import FaultProfile, LatencyProfile, ServerStats, run_app, simulate_latency
+
+
+PRODUCT_LINE = re.compile(
+    r'^#*\s*\[?(?P<name>[^\]\n$]+?)\]?(?:\((?P<url>[^)\s]+)\))?\s*-\s*\$(?P<price>\d[\d,]*(?:\.\d{1,2})?)\s*$'
+)
+IMAGE_LINE = re.compile(r'!\[[^\]]*\]\((?P<url>[^)\s]+)\)')
+PERCENT_OFF = re.compile(r'(?P<value>\d{1,3})%\s*off', re.IGNORECASE)
+DOLLAR_OFF = re.compile(r'\$(?P<value>\d[\d,]*)\s*off', re.IGNORECASE)
+PROMO_CODE = re.compile(r'\bcode\s+(?P<code>[A-Z0-9]{3,})\b', re.IGNORECASE)
+
+
+class FakeAnthropicSettings(BaseModel):
+    """Behaviour of the fake Anthropic server."""
+    
+    latency: LatencyProfile = Field(
+        default_factory=lambda: LatencyProfile(distribution="lognormal", median=1.0, spread=0.5)
+    )
+    faults: FaultProfile = Field(default_factory=FaultProfile)
+    
+    output_tokens_per_second: float = Field(
+        default=0.0,
+        description="Simulated generation speed; 0 disables per-token delay",
+        ge=0.0
+    )
+    
+    chars_per_token: float = Field(
+        default=4.0,
+        description="Characters per token used for reported token counts",
+        gt=0.0
+    )
+    
+    tokens_per_minute: Optional[int] = Field(
+        default=None,
+        description="Input token budget per minute before answering HTTP 429",
+        ge=1
+    )
+    
+    canned_response: Optional[Path] = Field(
+        default=None,
+        description="JSON file with 'products' and 'promotions' arrays to return verbatim"
+    )
+    
+    seed: Optional[int] = Field(
+        default=None,
+        description="Random seed for latency and fault injection"
+    )
+
+
+def extract_prompt_content(prompt: str) -> str:
+    """
+    Get the page content embedded in an extraction prompt.
+    
+    Args:
+        prompt: Extraction prompt
+    
+    Returns:
+        str: Content section, or the whole prompt if not found
+    """
+    match = re.search(r'Content:\n(?P<content>.*?)\n\s*Return only valid JSON', prompt, re.DOTALL)
+    return match.group('content') if match else prompt
+
+
+def rule_products(content: str) -> List[Dict[str, Any]]:
+    """
+    Generate products from listing lines like '## [Name](url) - $price'.
+    
+    Args:
+        content: Page content
+    
+    Returns:
+        List of product dictionaries
+    """
+    products = []
+    lines = content.splitlines()
+    for i, line in enumerate(lines):
+        match = PRODUCT_LINE.match(line.strip())
+        if not match:
+            continue
+        
+        image = None
+        if i + 1 < len(lines):
+            image_match = IMAGE_LINE.search(lines[i + 1])
+            image = image_match.group('url') if image_match else None
+        
+        products.append({
+            'product_name': match.group('name').strip(),
+            'brand': '',
+            'category': 'furniture',
+            'price': float(match.group('price').replace(',', '')),
+            'product_url': match.group('url') or '',
+            'image_url': image or ''
+        })
+    return products
+
+
+def rule_promotions(content: str) -> List[Dict[str, Any]]:
+    """
+    Generate promotions from lines mentioning discounts or promo codes.
+    
+    Args:
+        content: Page content
+    
+    Returns:
+        List of promotion dictionaries
+    """
+    promotions = []
+    for line in content.splitlines():
+        text = line.strip().lstrip('#').strip()
+        percent = PERCENT_OFF.search(text)
+        dollar = DOLLAR_OFF.search(text)
+        free_shipping = 'free shipping' in text.lower()
+        if not (percent or dollar or free_shipping):
+            continue
+        
+        code = PROMO_CODE.search(text)
+        if percent:
+            promo_type, value = 'percentage_off', float(percent.group('value'))
+        elif dollar:
+            promo_type, value = 'dollar_off', float(dollar.group('value').replace(',', ''))
+        else:
+            promo_type, value = 'free_shipping', 0
+        
+        promotions.append({
+            'promo_title': text[:120],
+            'promo_type': promo_type,
+            'discount_value': value,
+            'promo_code': code.group('code').upper() if code else '',
+            'promo_url': '',
+            'description': text[:200]
+        })
+    return promotions
+
+
+class FakeAnthropicServer:
+    """aiohttp application emulating the Anthropic Messages API."""
+    
+    def __init__(self, settings: Optional[FakeAnthropicSettings] = None):
+        """
+        Initialize fake server.
+        
+        Args:
+            settings: Server behaviour (defaults used if omitted)
+        """
+        self.settings = settings or FakeAnthropicSettings()
+        self.rng = random.Random(self.settings.seed)
+        self.stats = ServerStats()
+        self._token_window: Deque[Tuple[float, int]] = deque()
+        
+        self.canned: Optional[Dict[str, Any]] = None
+        if self.settings.canned_response:
+            with open(self.settings.canned_response, 'r', encoding='utf-8') as f:
+                self.canned = json.load(f)
+    
+    def create_app(self) -> web.Application:
+        """
+        Build the aiohttp application.
+        
+        Returns:
+            web.Application: Application serving the fake API
+        """
+        app = web.Application()
+        app.router.add_post('/v1/messages', self.handle_messages)
+        app.router.add_get('/_stats', self.handle_stats)
+        return app
+    
+    def count_tokens(self, text: str) -> int:
+        """Estimate the token count of a text."""
+        return max(1, int(len(text) / self.settings.chars_per_token))
+    
+    def build_reply(self, prompt: str) -> str:
+        """
+        Build the assistant text for an extraction prompt.
+        
+        Args:
+            prompt: Extraction prompt
+        
+        Returns:
+            str: JSON array text, or a JSON object with both arrays for
+                combined product and promotion prompts
+        """
+        lowered = prompt.lower()
+        if 'product and promotion information' in lowered:
+            if self.canned is not None:
+                return json.dumps({kind: self.canned.get(kind, []) for kind in ('products', 'promotions')})
+            content = extract_prompt_content(prompt)
+            return json.dumps({'products': rule_products(content), 'promotions': rule_promotions(content)})
+        
+        kind = 'promotions' if 'promotion information' in lowered else 'products'
+        if self.canned is not None:
+            return json.dumps(self.canned.get(kind, []))
+        
+        content = extract_prompt_content(prompt)
+        items = rule_promotions(content) if kind == 'promotions' else rule_products(content)
+        return json.dumps(items)
+    
+    def _over_token_budget(self, tokens: int) -> bool:
+        """Record input tokens and check the per-minute budget."""
+        if not self.settings.tokens_per_minute:
+            return False
+        
+        now = time.monotonic()
+        while self._token_window and now - self._token_window[0][0] > 60:
+            self._token_window.popleft()
+        
+        used = sum(count for _, count in self._token_window)
+        if used + tokens > self.settings.tokens_per_minute:
+            return True
+        self._token_window.append((now, tokens))
+        return False
+    
+    async def handle_messages(self, request: web.Request) -> web.Response:
+        """Handle POST /v1/messages."""
+        self.stats.increment('messages_requests')
+        payload = await request.json()
+        prompt = "\n".join(
+            message.get('content', '') if isinstance(message.get('content'), str) else json.dumps(message.get('content'))
+            for message in payload.get('messages', [])
+        )
+        input_tokens = self.count_tokens(prompt)
+        
+        if self._over_token_budget(input_tokens):
+            self.stats.increment('http_429')
+            return self.settings.faults.fault_response(429)
+        
+        await simulate_latency(self.settings.latency, self.rng)
+        status = self.settings.faults.pick_fault(self.rng)
+        if status is not None:
+            self.stats.increment(f'http_{status}')
+            return self.settings.faults.fault_response(status)
+        
+        text = self.build_reply(prompt)
+        output_tokens = self.count_tokens(text)
+        if self.settings.output_tokens_per_second > 0:
+            await asyncio.sleep(output_tokens / self.settings.output_tokens_per_second)
+        
+        self.stats.increment('input_tokens', input_tokens)
+        self.stats.increment('output_tokens', output_tokens)
+        return web.json_response({
+            'id': f"msg_fake_{uuid.uuid4().hex[:24]}",
+            'type': 'message',
+            'role': 'assistant',
+            'model': payload.get('model', ''),
+            'content': [{'type': 'text', 'text': text}],
+            'stop_reason': 'end_turn',
+            'usage': {'input_tokens': input_tokens, 'output_tokens': output_tokens}
+        })
+    
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        """Handle GET /_stats."""
+        return web.json_response(self.stats.to_dict())
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run a local fake Anthropic Messages server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8766)
+    parser.add_argument('--latency', default='lognormal', help="fixed, uniform, exponential or lognormal")
+    parser.add_argument('--latency-median', type=float, default=1.0)
+    parser.add_argument('--latency-spread', type=float, default=0.5)
+    parser.add_argument('--output-tokens-per-second', type=float, default=0.0)
+    parser.add_argument('--tokens-per-minute', type=int, default=None)
+    parser.add_argument('--rate-429', type=float, default=0.0)
+    parser.add_argument('--rate-5xx', type=float, default=0.0)
+    parser.add_argument('--canned-response', type=Path, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the fake Anthropic server from the command line."""
+    args = parse_args(argv)
+    settings = FakeAnthropicSettings(
+        latency=LatencyProfile(distribution=args.latency, median=args.latency_median, spread=args.latency_spread),
+        faults=FaultProfile(rate_limit_rate=args.rate_429, server_error_rate=args.rate_5xx),
+        output_tokens_per_second=args.output_tokens_per_second,
+        tokens_per_minute=args.tokens_per_minute,
+        canned_response=args.canned_response,
+        seed=args.seed
+    )
+    print(f"🧪 Fake Anthropic API at http://{args.host}:{args.port}/v1")
+    run_app(FakeAnthropicServer(settings).create_app(), args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
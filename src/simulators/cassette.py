@@ -0,0 +1,242 @@
+"""
+HTTP record/replay cassettes for deterministic end-to-end benchmarks.
+
+In record mode a local proxy forwards every Firecrawl and Claude request to
+the real upstream API and stores the request/response pairs with their
+timings in a gzip-compressed JSON-lines cassette. In replay mode a local
+server answers the same requests from the cassette, with original or scaled
+timings, so pipeline runs can be compared without network access.
+"""
+
+import asyncio
+import gzip
+import hashlib
+import json
+import time
+from collections import defaultdict, deque
+from pathlib import Path
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+import aiohttp
+from aiohttp import web
+
+
+# Response headers worth replaying
+KEPT_HEADERS = ('Content-Type', 'Retry-After')
+
+# Request headers never forwarded by the recording proxy
+HOP_HEADERS = {'host', 'content-length', 'transfer-encoding', 'connection'}
+
+
+def request_key(service: str, method: str, path: str, body: bytes) -> Tuple[str, str, str, str]:
+    """
+    Build the lookup key for a request.
+    
+    JSON bodies are canonicalized so key order does not matter.
+    
+    Args:
+        service: Upstream service name ('firecrawl', 'claude')
+        method: HTTP method
+        path: Request path including query string
+        body: Raw request body
+    
+    Returns:
+        tuple: (service, method, path, body hash)
+    """
+    try:
+        canonical = json.dumps(json.loads(body), sort_keys=True, separators=(',', ':')).encode('utf-8')
+    except ValueError:
+        canonical = body
+    return service, method.upper(), path, hashlib.sha256(canonical).hexdigest()[:16]
+
+
+class Cassette:
+    """Ordered collection of recorded HTTP interactions."""
+    
+    def __init__(self, entries: Optional[List[Dict[str, Any]]] = None):
+        """
+        Initialize cassette.
+        
+        Args:
+            entries: Recorded interactions
+        """
+        self.entries: List[Dict[str, Any]] = entries or []
+    
+    @classmethod
+    def load(cls, path: Path) -> "Cassette":
+        """
+        Load a cassette file.
+        
+        Args:
+            path: Cassette path (.jsonl.gz)
+        
+        Returns:
+            Cassette: Loaded cassette
+        """
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            return cls([json.loads(line) for line in f if line.strip()])
+    
+    def save(self, path: Path) -> None:
+        """
+        Write the cassette to disk.
+        
+        Args:
+            path: Cassette path (.jsonl.gz)
+        """
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        with gzip.open(path, 'wt', encoding='utf-8') as f:
+            for entry in self.entries:
+                f.write(json.dumps(entry, separators=(',', ':')) + "\n")
+    
+    def add(self, key: Tuple[str, str, str, str], status: int, headers: Dict[str, str], body: str, elapsed: float) -> None:
+        """Record one interaction."""
+        service, method, path, body_hash = key
+        self.entries.append({
+            'service': service,
+            'method': method,
+            'path': path,
+            'body_hash': body_hash,
+            'status': status,
+            'headers': headers,
+            'body': body,
+            'elapsed': round(elapsed, 4)
+        })
+    
+    def index(self) -> Dict[Tuple[str, str, str, str], Deque[Dict[str, Any]]]:
+        """
+        Group interactions by request key in recorded order.
+        
+        Returns:
+            dict: Request key to queue of recorded responses
+        """
+        grouped: Dict[Tuple[str, str, str, str], Deque[Dict[str, Any]]] = defaultdict(deque)
+        for entry in self.entries:
+            key = (entry['service'], entry['method'], entry['path'], entry['body_hash'])
+            grouped[key].append(entry)
+        return grouped
+
+
+class CassetteServer:
+    """Local record/replay endpoints standing in for upstream APIs."""
+    
+    def __init__(self, path: Path, mode: str = 'replay', speed: float = 1.0):
+        """
+        Initialize cassette server.
+        
+        Args:
+            path: Cassette file path
+            mode: 'record' to proxy and capture, 'replay' to serve the cassette
+            speed: Replay timing multiplier (1.0 original, 0 instant)
+        """
+        if mode not in ('record', 'replay'):
+            raise ValueError("Cassette mode must be 'record' or 'replay'")
+        
+        self.path = Path(path)
+        self.mode = mode
+        self.speed = speed
+        self.cassette = Cassette.load(self.path) if mode == 'replay' else Cassette()
+        self.replay_index = self.cassette.index() if mode == 'replay' else {}
+        self.misses = 0
+        self.started = False
+        self._runners: List[web.AppRunner] = []
+        self._session: Optional[aiohttp.ClientSession] = None
+    
+    async def start(self, upstreams: Dict[str, str]) -> Dict[str, str]:
+        """
+        Start one local endpoint per upstream service.
+        
+        Args:
+            upstreams: Service name to upstream base URL
+        
+        Returns:
+            dict: Service name to local base URL to use instead
+        """
+        if self.mode == 'record':
+            self._session = aiohttp.ClientSession()
+        
+        local_urls = {}
+        for service, base_url in upstreams.items():
+            origin, prefix = self._split_base_url(base_url)
+            app = web.Application(client_max_size=64 * 1024 * 1024)
+            handler = self._make_record_handler(service, origin) if self.mode == 'record' else self._make_replay_handler(service)
+            app.router.add_route('*', '/{tail:.*}', handler)
+            
+            runner = web.AppRunner(app, access_log=None)
+            await runner.setup()
+            site = web.TCPSite(runner, '127.0.0.1', 0)
+            await site.start()
+            self._runners.append(runner)
+            
+            port = runner.addresses[0][1]
+            local_urls[service] = f"http://127.0.0.1:{port}{prefix}"
+        
+        self.started = True
+        action = "Recording to" if self.mode == 'record' else "Replaying from"
+        print(f"📼 {action} cassette {self.path}")
+        return local_urls
+    
+    async def stop(self) -> None:
+        """Stop all endpoints and save the cassette when recording."""
+        if not self.started:
+            return
+        self.started = False
+        
+        for runner in self._runners:
+            await runner.cleanup()
+        self._runners = []
+        
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
+        
+        if self.mode == 'record':
+            self.cassette.save(self.path)
+            print(f"📼 Saved {len(self.cassette.entries)} interactions to {self.path}")
+    
+    @staticmethod
+    def _split_base_url(base_url: str) -> Tuple[str, str]:
+        """Split a base URL into origin and path prefix."""
+        parsed = urlparse(base_url)
+        return f"{parsed.scheme}://{parsed.netloc}", parsed.path.rstrip('/')
+    
+    def _make_record_handler(self, service: str, origin: str):
+        """Build a proxy handler that forwards and records requests."""
+        async def handler(request: web.Request) -> web.Response:
+            body = await request.read()
+            headers = {k: v for k, v in request.headers.items() if k.lower() not in HOP_HEADERS}
+            
+            start = time.monotonic()
+            async with self._session.request(
+                request.method,
+                f"{origin}{request.path_qs}",
+                data=body or None,
+                headers=headers
+            ) as upstream:
+                response_body = await upstream.read()
+                elapsed = time.monotonic() - start
+                kept = {k: upstream.headers[k] for k in KEPT_HEADERS if k in upstream.headers}
+            
+            key = request_key(service, request.method, request.path_qs, body)
+            self.cassette.add(key, upstream.status, kept, response_body.decode('utf-8', errors='replace'), elapsed)
+            return web.Response(status=upstream.status, body=response_body, headers=kept)
+        
+        return handler
+    
+    def _make_replay_handler(self, service: str):
+        """Build a handler that answers requests from the cassette."""
+        async def handler(request: web.Request) -> web.Response:
+            body = await request.read()
+            queue = self.replay_index.get(request_key(service, request.method, request.path_qs, body))
+            if not queue:
+                self.misses += 1
+                return web.json_response({'error': 'No recorded interaction'}, status=404)
+            
+            # Serve repeats in recorded order, then keep serving the last one
+            entry = queue.popleft() if len(queue) > 1 else queue[0]
+            if self.speed > 0:
+                await asyncio.sleep(entry['elapsed'] * self.speed)
+            return web.Response(status=entry['status'], body=entry['body'].encode('utf-8'), headers=entry['headers'])
+        
+        return handler
@@ -0,0 +1,170 @@
+"""
+Shared building blocks for local stand-in API servers.
+
+This module provides latency and fault injection profiles used by the fake
+Firecrawl and Anthropic servers for offline load testing.
+"""
+
+import asyncio
+import math
+import random
+from typing import Dict, Optional
+
+from aiohttp import web
+from pydantic import BaseModel, Field, validator
+
+
+class LatencyProfile(BaseModel):
+    """Response latency distribution."""
+    
+    distribution: str = Field(
+        default="lognormal",
+        description="Latency distribution: fixed, uniform, exponential or lognormal"
+    )
+    
+    median: float = Field(
+        default=0.5,
+        description="Median latency in seconds (lower bound for uniform)",
+        ge=0.0
+    )
+    
+    spread: float = Field(
+        default=0.6,
+        description="Sigma for lognormal, upper bound for uniform",
+        ge=0.0
+    )
+    
+    max_latency: float = Field(
+        default=30.0,
+        description="Latency cap in seconds",
+        ge=0.0
+    )
+    
+    @validator('distribution')
+    def validate_distribution(cls, v):
+        """Validate latency distribution name."""
+        valid = ['fixed', 'uniform', 'exponential', 'lognormal']
+        if v.lower() not in valid:
+            raise ValueError(f"Distribution must be one of: {valid}")
+        return v.lower()
+    
+    def sample(self, rng: random.Random) -> float:
+        """
+        Draw a latency value.
+        
+        Args:
+            rng: Random number generator
+        
+        Returns:
+            float: Latency in seconds
+        """
+        if self.distribution == 'fixed':
+            value = self.median
+        elif self.distribution == 'uniform':
+            value = rng.uniform(self.median, max(self.median, self.spread))
+        elif self.distribution == 'exponential':
+            value = rng.expovariate(math.log(2) / self.median) if self.median > 0 else 0.0
+        else:
+            value = rng.lognormvariate(math.log(self.median), self.spread) if self.median > 0 else 0.0
+        return min(value, self.max_latency)
+
+
+class FaultProfile(BaseModel):
+    """Injected error rates."""
+    
+    rate_limit_rate: float = Field(
+        default=0.0,
+        description="Fraction of requests answered with HTTP 429",
+        ge=0.0,
+        le=1.0
+    )
+    
+    server_error_rate: float = Field(
+        default=0.0,
+        description="Fraction of requests answered with HTTP 5xx",
+        ge=0.0,
+        le=1.0
+    )
+    
+    retry_after: Optional[float] = Field(
+        default=1.0,
+        description="Retry-After seconds sent with 429 responses",
+        ge=0.0
+    )
+    
+    def pick_fault(self, rng: random.Random) -> Optional[int]:
+        """
+        Decide whether to fail a request.
+        
+        Args:
+            rng: Random number generator
+        
+        Returns:
+            Optional[int]: HTTP status to fail with, or None to succeed
+        """
+        roll = rng.random()
+        if roll < self.rate_limit_rate:
+            return 429
+        if roll < self.rate_limit_rate + self.server_error_rate:
+            return rng.choice([500, 502, 503])
+        return None
+    
+    def fault_response(self, status: int) -> web.Response:
+        """
+        Build the error response for an injected fault.
+        
+        Args:
+            status: HTTP status code
+        
+        Returns:
+            web.Response: Error response
+        """
+        headers = {}
+        if status == 429 and self.retry_after is not None:
+            headers['Retry-After'] = f"{self.retry_after:g}"
+        return web.json_response({'error': f'Injected HTTP {status}'}, status=status, headers=headers)
+
+
+class ServerStats:
+    """Request counters exposed by fake servers."""
+    
+    def __init__(self):
+        """Initialize counters."""
+        self.counts: Dict[str, int] = {}
+    
+    def increment(self, key: str, amount: int = 1) -> None:
+        """Increment a counter."""
+        self.counts[key] = self.counts.get(key, 0) + amount
+    
+    def to_dict(self) -> Dict[str, int]:
+        """Get a snapshot of all counters."""
+        return dict(self.counts)
+
+
+async def simulate_latency(profile: LatencyProfile, rng: random.Random) -> float:
+    """
+    Sleep for a latency drawn from a profile.
+    
+    Args:
+        profile: Latency distribution
+        rng: Random number generator
+    
+    Returns:
+        float: Seconds slept
+    """
+    delay = profile.sample(rng)
+    if delay > 0:
+        await asyncio.sleep(delay)
+    return delay
+
+
+def run_app(app: web.Application, host: str, port: int) -> None:
+    """
+    Serve an application until interrupted.
+    
+    Args:
+        app: aiohttp application
+        host: Interface to bind
+        port: Port to bind
+    """
+    web.run_app(app, host=host, port=port, print=lambda msg: print(f"🧪 {msg}"))
@@ -0,0 +1,301 @@
+"""
+Local stand-in Firecrawl server for offline load testing.
+
+Serves the /scrape, /crawl and /crawl/status endpoints used by
+FirecrawlCollector with recorded or synthetic markdown pages, configurable
+latency, injected 429/5xx errors and tunable payload sizes.
+
+Usage:
+    python -m src.simulators.firecrawl_server --port 8765 --rate-429 0.05
+    FIRECRAWL_BASE_URL=http://localhost:8765/v0 python scripts/run_pipeline.py
+"""
+
+import argparse
+import random
+import time
+import uuid
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import urlparse
+
+from aiohttp import web
+from pydantic import BaseModel, Field
+
+from src.simulators.common import FaultProfile, LatencyProfile, ServerStats, run_app, simulate_latency
+from src.storage.scrape_cache import ScrapeCache
+
+
+ADJECTIVES = ['Modern', 'Mid-Century', 'Rustic', 'Coastal', 'Industrial', 'Boucle', 'Oak', 'Marble', 'Linen', 'Velvet']
+NOUNS = ['Sofa', 'Dining Table', 'Armchair', 'Bed Frame', 'Rug', 'Pendant Light', 'Nightstand', 'Bookshelf', 'Duvet Cover', 'Mirror']
+
+
+class FakeFirecrawlSettings(BaseModel):
+    """Behaviour of the fake Firecrawl server."""
+    
+    latency: LatencyProfile = Field(default_factory=LatencyProfile)
+    faults: FaultProfile = Field(default_factory=FaultProfile)
+    
+    page_size_kb: float = Field(
+        default=20.0,
+        description="Approximate synthetic markdown size per page in KB",
+        ge=0.0
+    )
+    
+    products_per_page: int = Field(
+        default=24,
+        description="Products listed on each synthetic page",
+        ge=0
+    )
+    
+    crawl_page_interval: float = Field(
+        default=0.2,
+        description="Seconds between crawl job pages becoming available",
+        ge=0.0
+    )
+    
+    recorded_dir: Optional[Path] = Field(
+        default=None,
+        description="Scrape cache directory with recorded pages to serve"
+    )
+    
+    seed: Optional[int] = Field(
+        default=None,
+        description="Random seed for latency and fault injection"
+    )
+
+
+def synthetic_page(url: str, products_per_page: int = 24, page_size_kb: float = 20.0) -> Tuple[str, str]:
+    """
+    Generate a deterministic product listing page for a URL.
+    
+    Args:
+        url: Page URL (seeds the generator)
+        products_per_page: Number of products to list
+        page_size_kb: Approximate target markdown size in KB
+    
+    Returns:
+        tuple: (title, markdown)
+    """
+    rng = random.Random(url)
+    parsed = urlparse(url)
+    origin = f"{parsed.scheme or 'https'}://{parsed.netloc or 'example.com'}"
+    title = parsed.path.strip('/').replace('/', ' ').replace('-', ' ').title() or "Home"
+    
+    lines = [f"# {title}", ""]
+    for i in range(products_per_page):
+        name = f"{rng.choice(ADJECTIVES)} {rng.choice(NOUNS)}"
+        slug = name.lower().replace(' ', '-')
+        price = rng.randrange(49, 3999)
+        lines.extend([
+            f"## [{name}]({origin}/products/{slug}-{i}/) - ${price:,}",
+            f"![{name}]({origin}/images/{slug}-{i}.jpg)",
+            ""
+        ])
+    
+    markdown = "\n".join(lines)
+    target = int(page_size_kb * 1024)
+    filler = "Designed for everyday living with sustainably sourced materials. "
+    if len(markdown) < target:
+        markdown += "\n" + filler * ((target - len(markdown)) // len(filler) + 1)
+    return title, markdown
+
+
+def markdown_to_html(title: str, markdown: str) -> str:
+    """
+    Wrap markdown in a minimal HTML document.
+    
+    Args:
+        title: Page title
+        markdown: Page markdown
+    
+    Returns:
+        str: HTML document
+    """
+    paragraphs = "".join(f"<p>{line}</p>" for line in markdown.splitlines() if line)
+    return f"<html><head><title>{title}</title></head><body>{paragraphs}</body></html>"
+
+
+class FakeFirecrawlServer:
+    """aiohttp application emulating the Firecrawl v0 API."""
+    
+    def __init__(self, settings: Optional[FakeFirecrawlSettings] = None):
+        """
+        Initialize fake server.
+        
+        Args:
+            settings: Server behaviour (defaults used if omitted)
+        """
+        self.settings = settings or FakeFirecrawlSettings()
+        self.rng = random.Random(self.settings.seed)
+        self.stats = ServerStats()
+        self.jobs: Dict[str, Dict[str, Any]] = {}
+        self.recorded = None
+        if self.settings.recorded_dir:
+            self.recorded = ScrapeCache(self.settings.recorded_dir, ttl_seconds=float('inf'))
+    
+    def create_app(self) -> web.Application:
+        """
+        Build the aiohttp application.
+        
+        Returns:
+            web.Application: Application serving the fake API
+        """
+        app = web.Application()
+        app.router.add_post('/v0/scrape', self.handle_scrape)
+        app.router.add_post('/v0/crawl', self.handle_crawl)
+        app.router.add_get('/v0/crawl/status/{job_id}', self.handle_crawl_status)
+        app.router.add_get('/_stats', self.handle_stats)
+        return app
+    
+    def get_page(self, url: str) -> Dict[str, Any]:
+        """
+        Get page content for a URL, preferring recorded pages.
+        
+        Args:
+            url: Page URL
+        
+        Returns:
+            Dict with title, markdown and html
+        """
+        if self.recorded:
+            cached = self.recorded.get(url)
+            if cached:
+                self.stats.increment('recorded_pages')
+                return {'title': cached.get('title', ''), 'markdown': cached.get('markdown', ''), 'html': cached.get('html', '')}
+        
+        self.stats.increment('synthetic_pages')
+        title, markdown = synthetic_page(url, self.settings.products_per_page, self.settings.page_size_kb)
+        return {'title': title, 'markdown': markdown, 'html': markdown_to_html(title, markdown)}
+    
+    async def _inject(self, endpoint: str) -> Optional[web.Response]:
+        """
+        Apply latency and maybe an injected fault to a request.
+        
+        Args:
+            endpoint: Endpoint name used for counters
+        
+        Returns:
+            Optional[web.Response]: Fault response, or None to proceed
+        """
+        self.stats.increment(f'{endpoint}_requests')
+        await simulate_latency(self.settings.latency, self.rng)
+        
+        status = self.settings.faults.pick_fault(self.rng)
+        if status is not None:
+            self.stats.increment(f'http_{status}')
+            return self.settings.faults.fault_response(status)
+        return None
+    
+    async def handle_scrape(self, request: web.Request) -> web.Response:
+        """Handle POST /v0/scrape."""
+        fault = await self._inject('scrape')
+        if fault is not None:
+            return fault
+        
+        payload = await request.json()
+        url = payload.get('url', '')
+        formats = payload.get('formats') or ['markdown']
+        page = self.get_page(url)
+        
+        data = {'metadata': {'title': page['title'], 'sourceURL': url}}
+        for fmt in formats:
+            if fmt in ('markdown', 'html'):
+                data[fmt] = page[fmt]
+        return web.json_response({'success': True, 'data': data})
+    
+    async def handle_crawl(self, request: web.Request) -> web.Response:
+        """Handle POST /v0/crawl."""
+        fault = await self._inject('crawl')
+        if fault is not None:
+            return fault
+        
+        payload = await request.json()
+        url = payload.get('url', '').rstrip('/')
+        options = payload.get('crawlerOptions') or {}
+        limit = int(options.get('limit', 10))
+        excludes = options.get('excludes') or []
+        
+        urls = [f"{url}/"] + [f"{url}/page-{i}/" for i in range(1, limit)]
+        job_id = uuid.uuid4().hex
+        self.jobs[job_id] = {
+            'urls': [u for u in urls if not any(pattern in u for pattern in excludes)],
+            'include_html': bool((payload.get('pageOptions') or {}).get('includeHtml')),
+            'started_at': time.monotonic()
+        }
+        return web.json_response({'success': True, 'jobId': job_id})
+    
+    async def handle_crawl_status(self, request: web.Request) -> web.Response:
+        """Handle GET /v0/crawl/status/{job_id}."""
+        fault = await self._inject('crawl_status')
+        if fault is not None:
+            return fault
+        
+        job = self.jobs.get(request.match_info['job_id'])
+        if job is None:
+            return web.json_response({'error': 'Job not found'}, status=404)
+        
+        elapsed = time.monotonic() - job['started_at']
+        interval = self.settings.crawl_page_interval
+        done = len(job['urls']) if interval == 0 else min(len(job['urls']), int(elapsed / interval))
+        documents = [self._crawl_document(url, job['include_html']) for url in job['urls'][:done]]
+        
+        if done >= len(job['urls']):
+            return web.json_response({'status': 'completed', 'current': done, 'total': done, 'data': documents})
+        return web.json_response({
+            'status': 'active',
+            'current': done,
+            'total': len(job['urls']),
+            'data': None,
+            'partial_data': documents
+        })
+    
+    async def handle_stats(self, request: web.Request) -> web.Response:
+        """Handle GET /_stats."""
+        return web.json_response(self.stats.to_dict())
+    
+    def _crawl_document(self, url: str, include_html: bool) -> Dict[str, Any]:
+        """Build a crawl job document for a URL."""
+        page = self.get_page(url)
+        document = {
+            'markdown': page['markdown'],
+            'metadata': {'title': page['title'], 'sourceURL': url}
+        }
+        if include_html:
+            document['html'] = page['html']
+        return document
+
+
+def parse_args(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    """Parse command line arguments."""
+    parser = argparse.ArgumentParser(description="Run a local fake Firecrawl server")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--latency', default='lognormal', help="fixed, uniform, exponential or lognormal")
+    parser.add_argument('--latency-median', type=float, default=0.5)
+    parser.add_argument('--latency-spread', type=float, default=0.6)
+    parser.add_argument('--rate-429', type=float, default=0.0)
+    parser.add_argument('--rate-5xx', type=float, default=0.0)
+    parser.add_argument('--page-size-kb', type=float, default=20.0)
+    parser.add_argument('--products-per-page', type=int, default=24)
+    parser.add_argument('--recorded-dir', type=Path, default=None)
+    parser.add_argument('--seed', type=int, default=None)
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Run the fake Firecrawl server from the command line."""
+    args = parse_args(argv)
+    settings = FakeFirecrawlSettings(
+        latency=LatencyProfile(distribution=args.latency, median=args.latency_median, spread=args.latency_spread),
+        faults=FaultProfile(rate_limit_rate=args.rate_429, server_error_rate=args.rate_5xx),
+        page_size_kb=args.page_size_kb,
+        products_per_page=args.products_per_page,
+        recorded_dir=args.recorded_dir,
+        seed=args.seed
+    )
+    print(f"🧪 Fake Firecrawl API at http://{args.host}:{args.port}/v0")
+    run_app(FakeFirecrawlServer(settings).create_app(), args.host, args.port)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,204 @@
+"""
+Persistent extraction cache for the competitive intelligence system.
+
+This module stores Claude extraction results in SQLite keyed by a hash of
+the normalized page content, the extraction type, the prompt template
+version and the model, so unchanged pages reuse their products and
+promotions instead of paying for another API call. Least recently used
+entries are evicted once the cache exceeds its size budget.
+"""
+
+import hashlib
+import json
+import re
+import sqlite3
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
+
+class ExtractionCache:
+    """SQLite-backed cache of extraction results with a size budget."""
+    
+    # Eviction frees space down to this fraction of the budget
+    EVICT_TARGET = 0.9
+    
+    def __init__(self, db_path: Path, max_bytes: Optional[int] = None):
+        """
+        Initialize cache.
+        
+        Args:
+            db_path: SQLite database file
+            max_bytes: Budget for stored results (None for unlimited)
+        """
+        self.db_path = Path(db_path)
+        self.max_bytes = max_bytes
+        self._conn: Optional[sqlite3.Connection] = None
+        self._total_bytes = 0
+        
+        self.hits = 0
+        self.misses = 0
+        self.evicted = 0
+    
+    @staticmethod
+    def content_hash(content: str, scope: str = "") -> str:
+        """
+        Hash page content with whitespace normalized.
+        
+        Args:
+            content: Page content sent for extraction
+            scope: Other prompt input the result depends on (e.g. competitor name)
+        
+        Returns:
+            str: Hex digest of the normalized content
+        """
+        normalized = WHITESPACE_PATTERN.sub(' ', content or '').strip()
+        return hashlib.sha256(f"{scope}\0{normalized}".encode('utf-8')).hexdigest()
+    
+    def _connect(self) -> sqlite3.Connection:
+        """Open the database on first use."""
+        if self._conn is None:
+            self.db_path.parent.mkdir(parents=True, exist_ok=True)
+            self._conn = sqlite3.connect(str(self.db_path))
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute(
+                """
+                CREATE TABLE IF NOT EXISTS extractions (
+                    content_hash TEXT NOT NULL,
+                    kind TEXT NOT NULL,
+                    prompt_version TEXT NOT NULL,
+                    model TEXT NOT NULL,
+                    result TEXT NOT NULL,
+                    size INTEGER NOT NULL,
+                    created_at REAL NOT NULL,
+                    used_at REAL NOT NULL,
+                    PRIMARY KEY (content_hash, kind, prompt_version, model)
+                )
+                """
+            )
+            self._conn.execute("CREATE INDEX IF NOT EXISTS extractions_used_at ON extractions (used_at)")
+            self._conn.commit()
+            self._total_bytes = self._conn.execute("SELECT COALESCE(SUM(size), 0) FROM extractions").fetchone()[0]
+        return self._conn
+    
+    def get(self, content_hash: str, kind: str, prompt_version: str, model: str) -> Optional[Any]:
+        """
+        Get a stored extraction result.
+        
+        Args:
+            content_hash: Hash from content_hash()
+            kind: Extraction type (e.g. 'products', 'promotions', 'combined')
+            prompt_version: Version of the prompt template
+            model: Model that produced the result
+        
+        Returns:
+            Stored result, or None on a miss
+        """
+        conn = self._connect()
+        key = (content_hash, kind, str(prompt_version), model)
+        row = conn.execute(
+            "SELECT result FROM extractions WHERE content_hash = ? AND kind = ? AND prompt_version = ? AND model = ?",
+            key
+        ).fetchone()
+        
+        if row is None:
+            self.misses += 1
+            return None
+        
+        try:
+            result = json.loads(row[0])
+        except ValueError:
+            self.misses += 1
+            return None
+        
+        conn.execute(
+            "UPDATE extractions SET used_at = ? WHERE content_hash = ? AND kind = ? AND prompt_version = ? AND model = ?",
+            (time.time(),) + key
+        )
+        conn.commit()
+        self.hits += 1
+        return result
+    
+    def put(self, content_hash: str, kind: str, prompt_version: str, model: str, result: Any) -> None:
+        """
+        Store an extraction result, evicting old entries if over budget.
+        
+        Args:
+            content_hash: Hash from content_hash()
+            kind: Extraction type
+            prompt_version: Version of the prompt template
+            model: Model that produced the result
+            result: JSON-serializable products and/or promotions
+        """
+        conn = self._connect()
+        key = (content_hash, kind, str(prompt_version), model)
+        data = json.dumps(result, ensure_ascii=False)
+        size = len(data.encode('utf-8'))
+        now = time.time()
+        
+        previous = conn.execute(
+            "SELECT size FROM extractions WHERE content_hash = ? AND kind = ? AND prompt_version = ? AND model = ?",
+            key
+        ).fetchone()
+        conn.execute(
+            """
+            INSERT OR REPLACE INTO extractions
+                (content_hash, kind, prompt_version, model, result, size, created_at, used_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            """,
+            key + (data, size, now, now)
+        )
+        conn.commit()
+        self._total_bytes += size - (previous[0] if previous else 0)
+        
+        if self.max_bytes is not None and self._total_bytes > self.max_bytes:
+            self.evict()
+    
+    def evict(self) -> int:
+        """
+        Remove least recently used entries until the cache fits its budget.
+        
+        Returns:
+            int: Number of entries removed
+        """
+        if self.max_bytes is None or self._total_bytes <= self.max_bytes:
+            return 0
+        
+        conn = self._connect()
+        target = self.max_bytes * self.EVICT_TARGET
+        doomed = []
+        freed = 0
+        for rowid, size in conn.execute("SELECT rowid, size FROM extractions ORDER BY used_at"):
+            if self._total_bytes - freed <= target:
+                break
+            doomed.append((rowid,))
+            freed += size
+        
+        conn.executemany("DELETE FROM extractions WHERE rowid = ?", doomed)
+        conn.commit()
+        self._total_bytes -= freed
+        self.evicted += len(doomed)
+        return len(doomed)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Get cache counters.
+        
+        Returns:
+            dict: Hits, misses, evicted entries and stored bytes
+        """
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'evicted': self.evicted,
+            'total_bytes': self._total_bytes
+        }
+    
+    def close(self) -> None:
+        """Close the database connection; it is reopened on next use."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
@@ -0,0 +1,339 @@
+"""
+On-disk scrape cache and raw page store for the competitive intelligence system.
+
+Scrapes are stored under data/raw as compressed content-addressed blobs
+(keyed by a hash of the page content, so identical pages are stored once)
+plus a small index entry per normalized URL pointing at the latest blob and
+recording the fetch history. Re-runs within the TTL skip the network, past
+versions stay available for re-extraction, and a size-budget compactor
+evicts the least recently used blobs.
+"""
+
+import gzip
+import hashlib
+import json
+import os
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from src.utils.validators import URLValidator
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+# Errors that mean a blob is unreadable
+BLOB_ERRORS = (OSError, ValueError, EOFError) + ((zstandard.ZstdError,) if zstandard else ())
+
+
+class ScrapeCache:
+    """Compressed content-addressed scrape cache with history and a size budget."""
+    
+    # Scrape result fields persisted in a content blob
+    CONTENT_FIELDS = ('markdown', 'html', 'title')
+    
+    # Blob suffixes by codec; zstd is used for new blobs when available
+    BLOB_SUFFIXES = ('.json.zst', '.json.gz', '.json')
+    
+    # Fetches remembered per URL
+    MAX_HISTORY = 100
+    
+    # Compaction frees space down to this fraction of the budget
+    COMPACT_TARGET = 0.9
+    
+    def __init__(self, cache_dir: Path, ttl_seconds: float = 12 * 3600, max_bytes: Optional[int] = None):
+        """
+        Initialize cache.
+        
+        Args:
+            cache_dir: Root directory for index entries and content blobs
+            ttl_seconds: How long a cached scrape stays fresh
+            max_bytes: Disk budget for content blobs (None for unlimited)
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self.index_dir = self.cache_dir / "index"
+        self.content_dir = self.cache_dir / "content"
+        self.index_dir.mkdir(parents=True, exist_ok=True)
+        self.content_dir.mkdir(parents=True, exist_ok=True)
+        
+        self.hits = 0
+        self.misses = 0
+    
+    @staticmethod
+    def url_key(url: str) -> str:
+        """
+        Get the index key for a URL.
+        
+        Args:
+            url: Page URL
+        
+        Returns:
+            str: Hash of the normalized URL
+        """
+        normalized = URLValidator.normalize_url(url)
+        return hashlib.sha256(normalized.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def content_hash(result: Dict[str, Any]) -> str:
+        """
+        Get the content hash for a scrape result.
+        
+        Args:
+            result: Scrape result dictionary
+        
+        Returns:
+            str: Hash of the page content fields
+        """
+        digest = hashlib.sha256()
+        for field in ScrapeCache.CONTENT_FIELDS:
+            digest.update((result.get(field) or '').encode('utf-8'))
+            digest.update(b'\0')
+        return digest.hexdigest()
+    
+    def get(self, url: str, fields: Optional[List[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Get a fresh cached scrape for a URL.
+        
+        Args:
+            url: Page URL
+            fields: Content fields that must be present (e.g. ['html']) for
+                the entry to count as a hit
+        
+        Returns:
+            Optional[Dict[str, Any]]: Cached scrape result or None on miss
+        """
+        content, digest = self._load(url)
+        if content is None or any(not content.get(field) for field in fields or []):
+            self.misses += 1
+            return None
+        
+        self.hits += 1
+        return {
+            'url': url,
+            **content,
+            'status': 'success',
+            'cached': True,
+            'content_hash': digest
+        }
+    
+    def put(self, url: str, result: Dict[str, Any]) -> Optional[str]:
+        """
+        Store a successful scrape.
+        
+        Fields missing from the result (e.g. HTML on a markdown-only scrape)
+        are carried over from a fresh existing entry for the same URL.
+        
+        Args:
+            url: Page URL
+            result: Scrape result dictionary
+        
+        Returns:
+            Optional[str]: Content hash, or None if the result was not cached
+        """
+        if result.get('status') != 'success':
+            return None
+        
+        previous, _ = self._load(url)
+        content = {
+            field: result.get(field) or (previous or {}).get(field) or ''
+            for field in self.CONTENT_FIELDS
+        }
+        
+        digest = self.content_hash(content)
+        if self._blob_path(digest) is None:
+            self._write_blob(digest, content)
+        
+        index_path = self.index_dir / f"{self.url_key(url)}.json"
+        fetched_at = time.time()
+        history = (self._read_json(index_path) or {}).get('history', [])
+        history.append({'fetched_at': fetched_at, 'content_hash': digest})
+        
+        self._write_json(index_path, {
+            'url': URLValidator.normalize_url(url),
+            'content_hash': digest,
+            'fetched_at': fetched_at,
+            'history': history[-self.MAX_HISTORY:]
+        })
+        return digest
+    
+    def get_history(self, url: str) -> List[Dict[str, Any]]:
+        """
+        Get the stored fetches of a URL, oldest first.
+        
+        Args:
+            url: Page URL
+        
+        Returns:
+            List[Dict[str, Any]]: Entries with 'fetched_at' and 'content_hash'
+                whose content is still stored
+        """
+        entry = self._read_json(self.index_dir / f"{self.url_key(url)}.json") or {}
+        return [
+            item for item in entry.get('history', [])
+            if self._blob_path(item['content_hash']) is not None
+        ]
+    
+    def get_content(self, content_hash: str) -> Optional[Dict[str, Any]]:
+        """
+        Load stored page content by hash, regardless of age.
+        
+        Args:
+            content_hash: Hash from put() or get_history()
+        
+        Returns:
+            Optional[Dict[str, Any]]: Content fields, or None if evicted
+        """
+        path = self._blob_path(content_hash)
+        return self._read_blob(path) if path else None
+    
+    def _load(self, url: str) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+        """
+        Load the fresh content blob for a URL.
+        
+        Args:
+            url: Page URL
+        
+        Returns:
+            tuple: (content, content_hash), or (None, None) if missing or stale
+        """
+        entry = self._read_json(self.index_dir / f"{self.url_key(url)}.json")
+        if not entry or not entry.get('content_hash'):
+            return None, None
+        if time.time() - entry.get('fetched_at', 0) > self.ttl_seconds:
+            return None, None
+        
+        path = self._blob_path(entry['content_hash'])
+        content = self._read_blob(path) if path else None
+        if content is None:
+            return None, None
+        
+        # Reads count as use for LRU eviction
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return content, entry['content_hash']
+    
+    def compact(self) -> Dict[str, int]:
+        """
+        Evict least recently used blobs until the store fits its disk budget.
+        
+        Index entries and history items pointing at evicted blobs are
+        removed or updated.
+        
+        Returns:
+            dict: Blobs and bytes removed, and bytes remaining
+        """
+        blobs = []
+        for path in self.content_dir.iterdir():
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            blobs.append((stat.st_mtime, stat.st_size, path))
+        
+        total = sum(size for _, size, _ in blobs)
+        if self.max_bytes is None or total <= self.max_bytes:
+            return {'removed': 0, 'freed_bytes': 0, 'total_bytes': total}
+        
+        target = self.max_bytes * self.COMPACT_TARGET
+        removed: Set[str] = set()
+        freed = 0
+        for _, size, path in sorted(blobs, key=lambda blob: blob[0]):
+            if total - freed <= target:
+                break
+            try:
+                path.unlink()
+            except OSError:
+                continue
+            freed += size
+            removed.add(path.name.split('.', 1)[0])
+        
+        if removed:
+            self._prune_index(removed)
+        return {'removed': len(removed), 'freed_bytes': freed, 'total_bytes': total - freed}
+    
+    def _prune_index(self, removed: Set[str]) -> None:
+        """Drop references to evicted blobs from the index."""
+        for index_path in self.index_dir.glob('*.json'):
+            entry = self._read_json(index_path)
+            if entry is None:
+                continue
+            
+            history = [item for item in entry.get('history', []) if item['content_hash'] not in removed]
+            current_removed = entry.get('content_hash') in removed
+            if not current_removed and len(history) == len(entry.get('history', [])):
+                continue
+            
+            if current_removed and not history:
+                index_path.unlink()
+                continue
+            
+            if current_removed:
+                entry['content_hash'] = None
+            entry['history'] = history
+            self._write_json(index_path, entry)
+    
+    def get_stats(self) -> Dict[str, int]:
+        """Get cache hit/miss counters."""
+        return {'hits': self.hits, 'misses': self.misses}
+    
+    def _blob_path(self, digest: str) -> Optional[Path]:
+        """Get the path of a stored blob in any supported format."""
+        for suffix in self.BLOB_SUFFIXES:
+            path = self.content_dir / f"{digest}{suffix}"
+            if path.exists():
+                return path
+        return None
+    
+    def _write_blob(self, digest: str, content: Dict[str, Any]) -> None:
+        """Write a compressed content blob atomically."""
+        data = json.dumps(content, ensure_ascii=False).encode('utf-8')
+        if zstandard is not None:
+            path = self.content_dir / f"{digest}.json.zst"
+            data = zstandard.ZstdCompressor().compress(data)
+        else:
+            path = self.content_dir / f"{digest}.json.gz"
+            data = gzip.compress(data)
+        
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+        with open(tmp_path, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_path, path)
+    
+    @staticmethod
+    def _read_blob(path: Path) -> Optional[Dict[str, Any]]:
+        """Read a content blob, returning None if missing, corrupt or unsupported."""
+        try:
+            with open(path, 'rb') as f:
+                data = f.read()
+            if path.name.endswith('.zst'):
+                if zstandard is None:
+                    return None
+                data = zstandard.ZstdDecompressor().decompress(data)
+            elif path.name.endswith('.gz'):
+                data = gzip.decompress(data)
+            return json.loads(data.decode('utf-8'))
+        except BLOB_ERRORS:
+            return None
+    
+    @staticmethod
+    def _read_json(path: Path) -> Optional[Dict[str, Any]]:
+        """Read a JSON file, returning None if missing or corrupt."""
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+    
+    @staticmethod
+    def _write_json(path: Path, data: Dict[str, Any]) -> None:
+        """Write a JSON file atomically."""
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
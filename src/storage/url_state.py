@@ -0,0 +1,173 @@
+"""
+Persistent URL state table for incremental crawling.
+
+This module stores every sitemap URL seen per competitor with its lastmod
+and the lastmod it was last scraped at, in SQLite under data/raw, so each
+run only scrapes URLs that are new or modified since the previous one.
+URLs disallowed by robots.txt and URLs that keep failing are recorded too,
+so they cannot crowd new and modified URLs out of each run's limit.
+"""
+
+import sqlite3
+import time
+from pathlib import Path
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+class URLStateStore:
+    """SQLite-backed sitemap URL state per competitor."""
+    
+    # Failed scrapes at the same lastmod before a URL waits for a new lastmod
+    MAX_FAILURES = 3
+    
+    def __init__(self, db_path: Path):
+        """
+        Initialize store.
+        
+        Args:
+            db_path: SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.db_path))
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS url_state (
+                competitor TEXT NOT NULL,
+                url TEXT NOT NULL,
+                lastmod TEXT,
+                first_seen REAL NOT NULL,
+                last_seen REAL NOT NULL,
+                scraped_at REAL,
+                scraped_lastmod TEXT,
+                failures INTEGER NOT NULL DEFAULT 0,
+                failed_lastmod TEXT,
+                blocked INTEGER NOT NULL DEFAULT 0,
+                PRIMARY KEY (competitor, url)
+            )
+            """
+        )
+        self._conn.commit()
+    
+    def upsert(
+        self,
+        competitor: str,
+        entries: Iterable[Tuple[str, Optional[str]]],
+        blocked: bool = False
+    ) -> int:
+        """
+        Record sitemap URLs and their lastmod values.
+        
+        Args:
+            competitor: Competitor name
+            entries: (url, lastmod) pairs
+            blocked: Whether robots.txt currently disallows the URLs
+        
+        Returns:
+            int: Number of entries written
+        """
+        now = time.time()
+        rows = [(competitor, url, lastmod, now, now, int(blocked)) for url, lastmod in entries]
+        self._conn.executemany(
+            """
+            INSERT INTO url_state (competitor, url, lastmod, first_seen, last_seen, blocked)
+            VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT (competitor, url) DO UPDATE SET
+                lastmod = COALESCE(excluded.lastmod, url_state.lastmod),
+                last_seen = excluded.last_seen,
+                blocked = excluded.blocked
+            """,
+            rows
+        )
+        self._conn.commit()
+        return len(rows)
+    
+    def get_pending(self, competitor: str, limit: int) -> List[Tuple[str, Optional[str]]]:
+        """
+        Get URLs that are new or modified since they were last scraped.
+        
+        URLs disallowed by robots.txt are skipped, as are URLs that failed
+        MAX_FAILURES times at their current lastmod; URLs that failed fewer
+        times come after the ones not yet tried.
+        
+        Args:
+            competitor: Competitor name
+            limit: Maximum URLs returned (most recently modified first)
+        
+        Returns:
+            List[Tuple[str, Optional[str]]]: (url, lastmod) pairs
+        """
+        cursor = self._conn.execute(
+            """
+            SELECT url, lastmod FROM url_state
+            WHERE competitor = ?
+              AND NOT blocked
+              AND (scraped_at IS NULL OR lastmod > COALESCE(scraped_lastmod, ''))
+              AND NOT (failed_lastmod IS lastmod AND failures >= ?)
+            ORDER BY
+                CASE WHEN failed_lastmod IS lastmod THEN failures ELSE 0 END,
+                lastmod IS NULL, lastmod DESC, first_seen
+            LIMIT ?
+            """,
+            (competitor, self.MAX_FAILURES, limit)
+        )
+        return cursor.fetchall()
+    
+    def mark_scraped(self, competitor: str, url: str, lastmod: Optional[str]) -> None:
+        """
+        Record that a URL was scraped at its current lastmod.
+        
+        Args:
+            competitor: Competitor name
+            url: Scraped URL
+            lastmod: lastmod the URL had when it was scraped
+        """
+        self._conn.execute(
+            """
+            UPDATE url_state SET scraped_at = ?, scraped_lastmod = ?, failures = 0, failed_lastmod = NULL
+            WHERE competitor = ? AND url = ?
+            """,
+            (time.time(), lastmod, competitor, url)
+        )
+        self._conn.commit()
+    
+    def mark_failed(self, competitor: str, url: str, lastmod: Optional[str]) -> None:
+        """
+        Record a failed scrape of a URL at its current lastmod.
+        
+        Args:
+            competitor: Competitor name
+            url: URL that could not be scraped
+            lastmod: lastmod the URL had when the scrape failed
+        """
+        self._conn.execute(
+            """
+            UPDATE url_state SET
+                failures = CASE WHEN failed_lastmod IS ? THEN failures + 1 ELSE 1 END,
+                failed_lastmod = ?
+            WHERE competitor = ? AND url = ?
+            """,
+            (lastmod, lastmod, competitor, url)
+        )
+        self._conn.commit()
+    
+    def get_stats(self, competitor: str) -> Dict[str, int]:
+        """
+        Get URL counts for a competitor.
+        
+        Args:
+            competitor: Competitor name
+        
+        Returns:
+            dict: Total known URLs and URLs never scraped
+        """
+        total, unscraped = self._conn.execute(
+            "SELECT COUNT(*), SUM(scraped_at IS NULL) FROM url_state WHERE competitor = ?",
+            (competitor,)
+        ).fetchone()
+        return {'total': total, 'unscraped': unscraped or 0}
+    
+    def close(self) -> None:
+        """Close the database connection."""
+        self._conn.close()
@@ -0,0 +1,73 @@
+"""
+Bloom filter for the competitive intelligence system.
+
+This module provides a compact probabilistic set used to deduplicate large
+numbers of discovered URLs with a fixed memory footprint.
+"""
+
+import hashlib
+import math
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter over strings."""
+    
+    def __init__(self, capacity: int = 100000, error_rate: float = 0.01):
+        """
+        Initialize Bloom filter.
+        
+        Args:
+            capacity: Expected number of items
+            error_rate: Target false-positive rate at capacity
+        """
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        if not 0 < error_rate < 1:
+            raise ValueError("Error rate must be between 0 and 1")
+        
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.num_bits = max(8, int(math.ceil(-capacity * math.log(error_rate) / (math.log(2) ** 2))))
+        self.num_hashes = max(1, int(round(self.num_bits / capacity * math.log(2))))
+        self._bits = bytearray((self.num_bits + 7) // 8)
+        self.count = 0
+    
+    def _positions(self, item: str):
+        """Get the bit positions for an item using double hashing."""
+        digest = hashlib.blake2b(item.encode('utf-8'), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], 'big')
+        h2 = int.from_bytes(digest[8:], 'big') | 1
+        for i in range(self.num_hashes):
+            yield (h1 + i * h2) % self.num_bits
+    
+    def add(self, item: str) -> bool:
+        """
+        Add an item.
+        
+        Args:
+            item: Item to add
+        
+        Returns:
+            bool: True if the item was definitely not present before
+        """
+        added = False
+        for position in self._positions(item):
+            byte, bit = divmod(position, 8)
+            if not self._bits[byte] & (1 << bit):
+                self._bits[byte] |= 1 << bit
+                added = True
+        
+        if added:
+            self.count += 1
+        return added
+    
+    def __contains__(self, item: str) -> bool:
+        """Check whether an item may have been added (false positives possible)."""
+        return all(
+            self._bits[position // 8] & (1 << (position % 8))
+            for position in self._positions(item)
+        )
+    
+    def __len__(self) -> int:
+        """Get the number of distinct items added (approximate)."""
+        return self.count
@@ -0,0 +1,185 @@
+"""
+Circuit breaker utilities for the competitive intelligence system.
+
+This module provides per-domain and per-API circuit breakers that open after
+consecutive failures, fail fast during a cooldown and then half-open to probe
+whether the upstream has recovered.
+"""
+
+import time
+from typing import Any, Dict
+
+
+class CircuitOpenError(Exception):
+    """Request rejected because the circuit for its key is open."""
+
+
+class CircuitBreaker:
+    """Consecutive-failure circuit breaker for one domain or API."""
+    
+    CLOSED = 'closed'
+    OPEN = 'open'
+    HALF_OPEN = 'half_open'
+    
+    def __init__(self, failure_threshold: int = 5, cooldown_seconds: float = 60.0):
+        """
+        Initialize circuit breaker.
+        
+        Args:
+            failure_threshold: Consecutive failures that open the circuit
+            cooldown_seconds: How long the circuit stays open before probing
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self.opened_at = 0.0
+        self.times_opened = 0
+        self.rejected = 0
+        self._probe_started_at = None
+    
+    def allow_request(self) -> bool:
+        """
+        Check whether a request may proceed.
+        
+        An open circuit moves to half-open once the cooldown has passed and
+        then admits a single probe request (or another one if the previous
+        probe never reported back within the cooldown).
+        
+        Returns:
+            bool: True if the request may proceed
+        """
+        now = time.monotonic()
+        if self.state == self.OPEN and now - self.opened_at >= self.cooldown_seconds:
+            self.state = self.HALF_OPEN
+        
+        if self.state == self.CLOSED:
+            return True
+        
+        if self.state == self.HALF_OPEN and (
+            self._probe_started_at is None or now - self._probe_started_at >= self.cooldown_seconds
+        ):
+            self._probe_started_at = now
+            return True
+        
+        self.rejected += 1
+        return False
+    
+    def is_open(self) -> bool:
+        """
+        Check whether a request would be rejected, without admitting one.
+        
+        Unlike allow_request, this never moves the circuit to half-open or
+        uses up the probe, so it can be called before a request has waited
+        for its rate limit and connection slot.
+        
+        Returns:
+            bool: True if the circuit is rejecting requests
+        """
+        now = time.monotonic()
+        if self.state == self.OPEN:
+            return now - self.opened_at < self.cooldown_seconds
+        if self.state == self.HALF_OPEN:
+            return self._probe_started_at is not None and now - self._probe_started_at < self.cooldown_seconds
+        return False
+    
+    def record_success(self) -> None:
+        """Record a successful request, closing the circuit."""
+        self.state = self.CLOSED
+        self.consecutive_failures = 0
+        self._probe_started_at = None
+    
+    def record_failure(self) -> None:
+        """Record a failed request, opening the circuit if needed."""
+        self.consecutive_failures += 1
+        self._probe_started_at = None
+        
+        if self.state == self.HALF_OPEN or self.consecutive_failures >= self.failure_threshold:
+            if self.state != self.OPEN:
+                self.times_opened += 1
+            self.state = self.OPEN
+            self.opened_at = time.monotonic()
+    
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the breaker state.
+        
+        Returns:
+            dict: State, consecutive failures, times opened and rejected requests
+        """
+        return {
+            'state': self.state,
+            'consecutive_failures': self.consecutive_failures,
+            'times_opened': self.times_opened,
+            'rejected': self.rejected
+        }
+
+
+class CircuitBreakerRegistry:
+    """Circuit breakers keyed by domain or upstream API."""
+    
+    def __init__(self, failure_threshold: int = 5, cooldown_seconds: float = 60.0):
+        """
+        Initialize registry.
+        
+        Args:
+            failure_threshold: Consecutive failures that open a circuit
+            cooldown_seconds: How long an open circuit fails fast
+        """
+        self.failure_threshold = failure_threshold
+        self.cooldown_seconds = cooldown_seconds
+        self._breakers: Dict[str, CircuitBreaker] = {}
+    
+    def get(self, key: str) -> CircuitBreaker:
+        """Get the breaker for a key, creating it if needed."""
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = CircuitBreaker(self.failure_threshold, self.cooldown_seconds)
+            self._breakers[key] = breaker
+        return breaker
+    
+    def check(self, key: str, admit: bool = True) -> None:
+        """
+        Fail fast if the circuit for a key is open.
+        
+        Args:
+            key: Domain name or API identifier
+            admit: Admit the request (using up a half-open probe); pass False
+                for an early check that a later check right before sending
+                repeats
+        
+        Raises:
+            CircuitOpenError: If the circuit rejects the request
+        """
+        if not key:
+            return
+        
+        breaker = self.get(key)
+        if admit:
+            allowed = breaker.allow_request()
+        else:
+            allowed = not breaker.is_open()
+            if not allowed:
+                breaker.rejected += 1
+        
+        if not allowed:
+            raise CircuitOpenError(f"Circuit open for {key}")
+    
+    def record_success(self, key: str) -> None:
+        """Record a successful request for a key."""
+        if key:
+            self.get(key).record_success()
+    
+    def record_failure(self, key: str) -> None:
+        """Record a failed request for a key."""
+        if key:
+            self.get(key).record_failure()
+    
+    def get_summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the state of every breaker.
+        
+        Returns:
+            dict: Key to breaker state snapshot
+        """
+        return {key: breaker.get_state() for key, breaker in sorted(self._breakers.items())}
@@ -0,0 +1,319 @@
+"""
+Adaptive concurrency limits for the competitive intelligence system.
+
+This module provides per-API concurrency limits that grow additively while
+requests are fast and healthy and shrink multiplicatively on rate limiting,
+timeouts, latency spikes or a high error rate (AIMD), so each upstream runs
+as wide as it currently allows without triggering 429 storms.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Any, AsyncIterator, Deque, Dict, List, Optional
+
+
+# Statuses that mean the upstream is overloaded rather than broken
+CONGESTION_STATUSES = (429, 503)
+
+
+def is_congestion(error: BaseException) -> bool:
+    """
+    Check whether a failure signals upstream overload.
+    
+    Args:
+        error: Exception raised by a request
+    
+    Returns:
+        bool: True for timeouts and rate limiting/overload statuses
+    """
+    if isinstance(error, asyncio.TimeoutError):
+        return True
+    return getattr(error, 'status', None) in CONGESTION_STATUSES
+
+
+class AdaptiveLimit:
+    """AIMD concurrency limit for one upstream API."""
+    
+    # Smoothing factor for the baseline latency
+    LATENCY_ALPHA = 0.1
+    
+    # Successful requests needed before latency spikes are judged
+    MIN_LATENCY_SAMPLES = 10
+    
+    # Recent outcomes used for the error rate
+    ERROR_WINDOW = 20
+    
+    # Decisions kept for the run summary
+    MAX_DECISIONS = 200
+    
+    def __init__(
+        self,
+        initial_limit: int,
+        min_limit: int = 1,
+        max_limit: int = 20,
+        decrease_factor: float = 0.5,
+        latency_spike_factor: float = 3.0,
+        max_error_rate: float = 0.2
+    ):
+        """
+        Initialize adaptive limit.
+        
+        Args:
+            initial_limit: Starting number of concurrent requests
+            min_limit: Lowest limit a decrease can reach
+            max_limit: Highest limit an increase can reach
+            decrease_factor: Multiplier applied to the limit on congestion
+            latency_spike_factor: Latency above this multiple of the baseline
+                counts as congestion
+            max_error_rate: Share of recent requests that may fail before the
+                limit is cut
+        """
+        if min_limit < 1 or max_limit < min_limit:
+            raise ValueError("Limits must satisfy 1 <= min_limit <= max_limit")
+        if not 0 < decrease_factor < 1:
+            raise ValueError("Decrease factor must be between 0 and 1")
+        
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.limit = min(max(initial_limit, min_limit), max_limit)
+        self.decrease_factor = decrease_factor
+        self.latency_spike_factor = latency_spike_factor
+        self.max_error_rate = max_error_rate
+        
+        self.in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._healthy_streak = 0
+        self._outcomes: Deque[bool] = deque(maxlen=self.ERROR_WINDOW)
+        self._baseline_latency: Optional[float] = None
+        self._latency_samples = 0
+        self._last_decrease_at: Optional[float] = None
+        self._started_at = time.monotonic()
+        
+        self.increases = 0
+        self.decreases = 0
+        self.peak_limit = self.limit
+        self.lowest_limit = self.limit
+        self.decisions: Deque[Dict[str, Any]] = deque(maxlen=self.MAX_DECISIONS)
+    
+    async def acquire(self) -> None:
+        """Wait for a free slot under the current limit and take it."""
+        while self.in_flight >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            except asyncio.CancelledError:
+                # Pass on a wakeup this waiter can no longer use
+                if waiter.done() and not waiter.cancelled():
+                    self._wake()
+                raise
+        self.in_flight += 1
+    
+    def try_acquire(self) -> bool:
+        """
+        Take a slot only if one is free and nobody is queued for it.
+        
+        Returns:
+            bool: True if a slot was taken (give it back with release())
+        """
+        if self.in_flight >= self.limit or any(not waiter.done() for waiter in self._waiters):
+            return False
+        self.in_flight += 1
+        return True
+    
+    def release(self) -> None:
+        """Give back a slot and wake waiters that now fit."""
+        self.in_flight -= 1
+        self._wake()
+    
+    @asynccontextmanager
+    async def slot(self) -> AsyncIterator[None]:
+        """Hold a concurrency slot for the duration of a request."""
+        await self.acquire()
+        try:
+            yield
+        finally:
+            self.release()
+    
+    def _wake(self) -> None:
+        """Wake as many waiters as there are free slots."""
+        free = self.limit - self.in_flight
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+    
+    def record_success(self, latency: float) -> None:
+        """
+        Record a completed request.
+        
+        The limit grows by one after a full window (the current limit) of
+        consecutive healthy requests, or is cut if the latency is a spike.
+        
+        Args:
+            latency: Request duration in seconds
+        """
+        self._outcomes.append(True)
+        
+        baseline = self._baseline_latency
+        if (
+            baseline is not None
+            and self._latency_samples >= self.MIN_LATENCY_SAMPLES
+            and latency > baseline * self.latency_spike_factor
+        ):
+            self._decrease(f"latency spike {latency:.1f}s (baseline {baseline:.1f}s)")
+            return
+        
+        # Spikes stay out of the baseline so it tracks healthy latency
+        if baseline is None:
+            self._baseline_latency = latency
+        else:
+            self._baseline_latency = baseline + self.LATENCY_ALPHA * (latency - baseline)
+        self._latency_samples += 1
+        
+        self._healthy_streak += 1
+        if self._healthy_streak >= self.limit and self.limit < self.max_limit:
+            self._change(self.limit + 1, 'increase', 'healthy window')
+            self._healthy_streak = 0
+    
+    def record_failure(self, error: BaseException) -> None:
+        """
+        Record a failed request.
+        
+        Congestion signals cut the limit immediately; other failures cut it
+        once the recent error rate exceeds the threshold.
+        
+        Args:
+            error: Exception raised by the request
+        """
+        self._outcomes.append(False)
+        self._healthy_streak = 0
+        
+        if is_congestion(error):
+            status = getattr(error, 'status', None)
+            self._decrease(f"HTTP {status}" if status else 'timeout')
+            return
+        
+        failures = self._outcomes.count(False)
+        if len(self._outcomes) >= self.ERROR_WINDOW // 2 and failures / len(self._outcomes) > self.max_error_rate:
+            self._decrease(f"error rate {failures}/{len(self._outcomes)}")
+    
+    def _decrease(self, reason: str) -> None:
+        """Cut the limit multiplicatively, at most once per baseline latency."""
+        self._healthy_streak = 0
+        now = time.monotonic()
+        
+        # Requests already in flight report the same overload; count it once
+        window = self._baseline_latency or 1.0
+        if self._last_decrease_at is not None and now - self._last_decrease_at < window:
+            return
+        
+        self._last_decrease_at = now
+        new_limit = max(self.min_limit, int(self.limit * self.decrease_factor))
+        if new_limit < self.limit:
+            self._change(new_limit, 'decrease', reason)
+    
+    def _change(self, new_limit: int, action: str, reason: str) -> None:
+        """Apply and record a limit change."""
+        self.decisions.append({
+            'at': round(time.monotonic() - self._started_at, 3),
+            'action': action,
+            'from': self.limit,
+            'to': new_limit,
+            'reason': reason
+        })
+        
+        if action == 'increase':
+            self.increases += 1
+        else:
+            self.decreases += 1
+        
+        self.limit = new_limit
+        self.peak_limit = max(self.peak_limit, new_limit)
+        self.lowest_limit = min(self.lowest_limit, new_limit)
+        self._wake()
+    
+    def get_state(self) -> Dict[str, Any]:
+        """
+        Get a snapshot of the limit state.
+        
+        Returns:
+            dict: Current, lowest and peak limits, change counts and baseline latency
+        """
+        return {
+            'limit': self.limit,
+            'lowest_limit': self.lowest_limit,
+            'peak_limit': self.peak_limit,
+            'increases': self.increases,
+            'decreases': self.decreases,
+            'baseline_latency': self._baseline_latency
+        }
+
+
+class AdaptiveConcurrency:
+    """Adaptive concurrency limits keyed by upstream API."""
+    
+    def __init__(self, initial_limit: int = 5, min_limit: int = 1, max_limit: int = 20):
+        """
+        Initialize registry.
+        
+        Args:
+            initial_limit: Starting limit for keys that were never configured
+            min_limit: Lowest limit for keys that were never configured
+            max_limit: Highest limit for keys that were never configured
+        """
+        self.initial_limit = initial_limit
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self._limits: Dict[str, AdaptiveLimit] = {}
+    
+    def configure(self, key: str, initial_limit: int, max_limit: int, min_limit: int = 1) -> None:
+        """
+        Set the limits for a key, replacing any existing limit.
+        
+        Args:
+            key: API identifier (e.g. 'firecrawl', 'claude')
+            initial_limit: Starting number of concurrent requests
+            max_limit: Highest limit an increase can reach (equal to the
+                initial limit for a fixed limit)
+            min_limit: Lowest limit a decrease can reach
+        """
+        self._limits[key] = AdaptiveLimit(initial_limit, min_limit=min(min_limit, max_limit), max_limit=max_limit)
+    
+    def is_configured(self, key: str) -> bool:
+        """Check whether a key has a limit."""
+        return key in self._limits
+    
+    def get(self, key: str) -> AdaptiveLimit:
+        """Get the limit for a key, creating a default one if needed."""
+        limit = self._limits.get(key)
+        if limit is None:
+            limit = AdaptiveLimit(self.initial_limit, self.min_limit, self.max_limit)
+            self._limits[key] = limit
+        return limit
+    
+    def get_summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Get the state of every limit.
+        
+        Returns:
+            dict: Key to limit state snapshot
+        """
+        return {key: limit.get_state() for key, limit in sorted(self._limits.items())}
+    
+    def get_decisions(self, key: str) -> List[Dict[str, Any]]:
+        """
+        Get the recorded limit changes for a key.
+        
+        Args:
+            key: API identifier
+        
+        Returns:
+            List[Dict[str, Any]]: Changes in order, with seconds since the limit
+                was created, action, old and new limit, and reason
+        """
+        limit = self._limits.get(key)
+        return list(limit.decisions) if limit else []
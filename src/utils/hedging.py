@@ -0,0 +1,151 @@
+"""
+Request hedging utilities for the competitive intelligence system.
+
+This module tracks recent request latencies and races a duplicate request
+against a slow one once it passes a latency percentile, with a budget that
+bounds how many extra requests hedging may add.
+"""
+
+import asyncio
+import math
+from collections import deque
+from typing import Any, Awaitable, Callable, Deque, Optional
+
+
+class HedgeUnavailableError(Exception):
+    """A hedge could not be sent without waiting for capacity."""
+
+
+class LatencyTracker:
+    """Sliding window of recent request latencies."""
+    
+    def __init__(self, window: int = 200, min_samples: int = 20):
+        """
+        Initialize tracker.
+        
+        Args:
+            window: Number of recent latencies kept
+            min_samples: Samples required before percentiles are reported
+        """
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window)
+    
+    def record(self, seconds: float) -> None:
+        """Record a request latency in seconds."""
+        self._samples.append(seconds)
+    
+    def percentile(self, percent: float) -> Optional[float]:
+        """
+        Get a latency percentile over the window.
+        
+        Args:
+            percent: Percentile between 0 and 100
+        
+        Returns:
+            Optional[float]: Latency in seconds, or None if too few samples
+        """
+        if len(self._samples) < self.min_samples:
+            return None
+        
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, max(0, math.ceil(percent / 100 * len(ordered)) - 1))
+        return ordered[index]
+
+
+class HedgeBudget:
+    """Caps hedged requests to a fraction of primary requests."""
+    
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10.0):
+        """
+        Initialize budget.
+        
+        Args:
+            ratio: Hedges allowed per primary request (e.g. 0.1 = 10%)
+            max_tokens: Maximum saved-up hedges
+        """
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = 1.0
+        self.requests = 0
+        self.hedges = 0
+        self.hedges_won = 0
+        self.hedges_skipped = 0
+    
+    def record_request(self) -> None:
+        """Credit the budget for a primary request."""
+        self.requests += 1
+        # Rounding keeps repeated fractional credits from drifting below 1.0
+        self.tokens = min(self.max_tokens, round(self.tokens + self.ratio, 9))
+    
+    def try_acquire(self) -> bool:
+        """
+        Spend budget on a hedge.
+        
+        Returns:
+            bool: True if a hedge may be sent
+        """
+        if self.tokens < 1.0:
+            return False
+        self.tokens -= 1.0
+        self.hedges += 1
+        return True
+    
+    def refund(self) -> None:
+        """Give back the budget of a hedge that was not sent."""
+        self.tokens = min(self.max_tokens, self.tokens + 1.0)
+        self.hedges -= 1
+        self.hedges_skipped += 1
+
+
+async def run_hedged(
+    primary: Callable[[], Awaitable[Any]],
+    hedge: Callable[[], Awaitable[Any]],
+    delay: float,
+    budget: HedgeBudget
+) -> Any:
+    """
+    Run a request, racing a duplicate if it is still pending after a delay.
+    
+    The first request to succeed wins and the other is cancelled. If one
+    request fails, the other is still awaited; only when both fail is the
+    primary's error raised. A hedge that raises HedgeUnavailableError was
+    never sent, so its budget is refunded.
+    
+    Args:
+        primary: Starts the original request
+        hedge: Starts the duplicate request
+        delay: Seconds to wait before hedging
+        budget: Hedge budget shared across requests
+    
+    Returns:
+        Any: Result of the first successful request
+    """
+    budget.record_request()
+    primary_task = asyncio.ensure_future(primary())
+    tasks = [primary_task]
+    
+    try:
+        done, _ = await asyncio.wait(tasks, timeout=delay)
+        if done or not budget.try_acquire():
+            return await primary_task
+        
+        hedge_task = asyncio.ensure_future(hedge())
+        tasks.append(hedge_task)
+        pending = set(tasks)
+        
+        while pending:
+            done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                if task.exception() is None:
+                    if task is hedge_task:
+                        budget.hedges_won += 1
+                    return task.result()
+                if isinstance(task.exception(), HedgeUnavailableError):
+                    budget.refund()
+        
+        return primary_task.result()
+    
+    finally:
+        for task in tasks:
+            if not task.done():
+                task.cancel()
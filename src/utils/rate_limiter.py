@@ -0,0 +1,174 @@
+"""
+Async rate limiting utilities for the competitive intelligence system.
+
+This module provides a token-bucket rate limiter keyed by target domain or
+upstream API, so requests to different competitors proceed in parallel while
+each key stays within its own request budget.
+"""
+
+import asyncio
+import time
+from typing import Dict, Optional
+
+
+class TokenBucket:
+    """Async token bucket with FIFO reservations."""
+    
+    def __init__(self, rate: float, capacity: float = 1.0):
+        """
+        Initialize token bucket.
+        
+        Args:
+            rate: Refill rate in tokens per second
+            capacity: Maximum number of tokens (burst size)
+        """
+        if rate <= 0:
+            raise ValueError("Rate must be positive")
+        if capacity <= 0:
+            raise ValueError("Capacity must be positive")
+        
+        self.rate = rate
+        self.capacity = capacity
+        self.tokens = capacity
+        self.updated_at = time.monotonic()
+        self._lock = asyncio.Lock()
+    
+    def _refill(self) -> None:
+        """Add tokens accrued since the last update."""
+        now = time.monotonic()
+        elapsed = now - self.updated_at
+        self.tokens = min(self.capacity, self.tokens + elapsed * self.rate)
+        self.updated_at = now
+    
+    async def acquire(self, tokens: float = 1.0) -> float:
+        """
+        Take tokens from the bucket, waiting until they are available.
+        
+        Tokens are reserved immediately (the balance may go negative), so
+        concurrent callers are served in arrival order without busy-waiting.
+        
+        Args:
+            tokens: Number of tokens to take
+        
+        Returns:
+            float: Seconds spent waiting
+        """
+        async with self._lock:
+            self._refill()
+            self.tokens -= tokens
+            wait_time = max(0.0, -self.tokens / self.rate)
+        
+        if wait_time > 0:
+            await asyncio.sleep(wait_time)
+        return wait_time
+    
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """
+        Take tokens only if they are available without waiting.
+        
+        Args:
+            tokens: Number of tokens to take
+        
+        Returns:
+            bool: True if the tokens were taken
+        """
+        if not self.available(tokens):
+            return False
+        self.tokens -= tokens
+        return True
+    
+    def available(self, tokens: float = 1.0) -> bool:
+        """Check whether tokens can be taken without waiting."""
+        self._refill()
+        return self.tokens >= tokens
+
+
+class RateLimiter:
+    """Token-bucket rate limiter keyed by domain or upstream API."""
+    
+    def __init__(self, default_rate_per_minute: int = 60, default_burst: float = 1.0):
+        """
+        Initialize rate limiter.
+        
+        Args:
+            default_rate_per_minute: Budget for keys that were never configured
+            default_burst: Burst size for keys that were never configured
+        """
+        self.default_rate_per_minute = default_rate_per_minute
+        self.default_burst = default_burst
+        self._buckets: Dict[str, TokenBucket] = {}
+    
+    def configure(
+        self,
+        key: str,
+        rate_per_minute: Optional[float] = None,
+        min_interval: Optional[float] = None,
+        burst: float = 1.0
+    ) -> None:
+        """
+        Set the budget for a key, replacing any existing bucket.
+        
+        Args:
+            key: Domain name or API identifier (e.g. 'firecrawl', 'claude')
+            rate_per_minute: Allowed requests per minute
+            min_interval: Minimum delay between requests in seconds
+                (alternative to rate_per_minute)
+            burst: Number of requests allowed back-to-back
+        """
+        if min_interval is not None:
+            rate = 1.0 / min_interval
+        elif rate_per_minute is not None:
+            rate = rate_per_minute / 60.0
+        else:
+            raise ValueError("Either rate_per_minute or min_interval is required")
+        
+        self._buckets[key] = TokenBucket(rate=rate, capacity=burst)
+    
+    def is_configured(self, key: str) -> bool:
+        """Check whether a key has a bucket."""
+        return key in self._buckets
+    
+    def _get_bucket(self, key: str) -> TokenBucket:
+        """Get the bucket for a key, creating a default one if needed."""
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = TokenBucket(
+                rate=self.default_rate_per_minute / 60.0,
+                capacity=self.default_burst
+            )
+            self._buckets[key] = bucket
+        return bucket
+    
+    async def acquire(self, key: Optional[str], tokens: float = 1.0) -> float:
+        """
+        Wait until a request for the key fits within its budget.
+        
+        Args:
+            key: Domain name or API identifier; None skips limiting
+            tokens: Cost of the request in tokens
+        
+        Returns:
+            float: Seconds spent waiting
+        """
+        if not key:
+            return 0.0
+        return await self._get_bucket(key).acquire(tokens)
+    
+    def try_acquire(self, *keys: str) -> bool:
+        """
+        Take one token from each key's bucket only if all have one available now.
+        
+        Used for optional requests that should be skipped rather than delayed.
+        
+        Args:
+            keys: Domain names or API identifiers
+        
+        Returns:
+            bool: True if every bucket had a token (and one was taken from each)
+        """
+        buckets = [self._get_bucket(key) for key in keys if key]
+        if not all(bucket.available() for bucket in buckets):
+            return False
+        for bucket in buckets:
+            bucket.try_acquire()
+        return True
@@ -0,0 +1,161 @@
+"""
+Retry utilities for the competitive intelligence system.
+
+This module provides a retry policy with exponential backoff, full jitter
+and Retry-After support for transient failures in scrapes and LLM calls.
+"""
+
+import asyncio
+import random
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Optional, Tuple, Type
+
+
+# HTTP statuses worth retrying (rate limits, timeouts, server errors, overload)
+RETRYABLE_STATUSES = frozenset({408, 425, 429, 500, 502, 503, 504, 529})
+
+
+class RetryableError(Exception):
+    """Transient failure that may succeed if the request is retried."""
+    
+    def __init__(self, message: str, status: Optional[int] = None, retry_after: Optional[float] = None):
+        """
+        Initialize retryable error.
+        
+        Args:
+            message: Error description
+            status: HTTP status code, if any
+            retry_after: Server-requested delay in seconds, if any
+        """
+        super().__init__(message)
+        self.status = status
+        self.retry_after = retry_after
+
+
+def is_retryable_status(status: int) -> bool:
+    """
+    Check if an HTTP status indicates a transient failure.
+    
+    Args:
+        status: HTTP status code
+    
+    Returns:
+        bool: True if the request should be retried
+    """
+    return status in RETRYABLE_STATUSES
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value.
+    
+    Args:
+        value: Header value (delay in seconds or an HTTP date)
+    
+    Returns:
+        Optional[float]: Delay in seconds or None if missing/invalid
+    """
+    if not value:
+        return None
+    
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+class RetryPolicy:
+    """Exponential backoff retry policy with full jitter."""
+    
+    DEFAULT_RETRY_ON: Tuple[Type[BaseException], ...] = (
+        RetryableError,
+        asyncio.TimeoutError,
+        ConnectionError
+    )
+    
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 1.0,
+        max_delay: float = 30.0,
+        max_retry_after: float = 120.0,
+        jitter: bool = True,
+        retry_on: Optional[Tuple[Type[BaseException], ...]] = None
+    ):
+        """
+        Initialize retry policy.
+        
+        Args:
+            max_retries: Retry attempts after the first try
+            base_delay: Backoff delay for the first retry in seconds
+            max_delay: Upper bound on the backoff delay in seconds
+            max_retry_after: Upper bound on a server-requested delay in seconds
+            jitter: Randomize delays to avoid synchronized retries
+            retry_on: Exception types treated as transient
+        """
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.max_retry_after = max_retry_after
+        self.jitter = jitter
+        self.retry_on = retry_on or self.DEFAULT_RETRY_ON
+    
+    def get_delay(self, attempt: int, retry_after: Optional[float] = None) -> float:
+        """
+        Get the delay before the next attempt.
+        
+        Args:
+            attempt: Zero-based index of the retry
+            retry_after: Server-requested delay in seconds, if any
+        
+        Returns:
+            float: Delay in seconds
+        """
+        if retry_after is not None:
+            return min(retry_after, self.max_retry_after)
+        
+        delay = min(self.max_delay, self.base_delay * (2 ** attempt))
+        if self.jitter:
+            delay = random.uniform(0, delay)
+        return delay
+    
+    async def run(self, func: Callable[..., Awaitable[Any]], *args: Any, description: str = "request", **kwargs: Any) -> Any:
+        """
+        Call an async function, retrying transient failures.
+        
+        Args:
+            func: Async function to call
+            *args: Positional arguments for func
+            description: Label used in retry messages
+            **kwargs: Keyword arguments for func
+        
+        Returns:
+            Any: Result of the first successful call
+        
+        Raises:
+            Exception: The last transient error once retries are exhausted,
+                or any non-transient error immediately
+        """
+        attempt = 0
+        while True:
+            try:
+                return await func(*args, **kwargs)
+            except self.retry_on as e:
+                if attempt >= self.max_retries:
+                    raise
+                
+                delay = self.get_delay(attempt, getattr(e, 'retry_after', None))
+                attempt += 1
+                print(f"  ⏳ Retrying {description} in {delay:.1f}s ({attempt}/{self.max_retries}): {e or type(e).__name__}")
+                await asyncio.sleep(delay)
@@ -0,0 +1,226 @@
+"""
+robots.txt utilities for the competitive intelligence system.
+
+This module parses robots.txt into precompiled allow/disallow matchers with
+crawl-delay support, and caches raw robots.txt bodies on disk so each domain
+is fetched at most once per TTL.
+"""
+
+import json
+import os
+import re
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Pattern, Tuple
+from urllib.parse import urlparse
+
+
+class RobotsRules:
+    """Precompiled robots.txt rules for one user agent."""
+    
+    def __init__(
+        self,
+        rules: Optional[List[Tuple[str, bool]]] = None,
+        crawl_delay: Optional[float] = None,
+        sitemaps: Optional[List[str]] = None
+    ):
+        """
+        Initialize rules.
+        
+        Args:
+            rules: (path pattern, allow) pairs from the matching group
+            crawl_delay: Requested delay between requests in seconds
+            sitemaps: Sitemap URLs listed in robots.txt
+        """
+        self.crawl_delay = crawl_delay
+        self.sitemaps = sitemaps or []
+        self._rules = [(pattern, allow) for pattern, allow in rules or [] if pattern]
+        
+        # Longest pattern wins and allow wins ties, so check in that order
+        compiled = [
+            (len(pattern), allow, self._compile(pattern))
+            for pattern, allow in rules or []
+            if pattern
+        ]
+        compiled.sort(key=lambda rule: (rule[0], rule[1]), reverse=True)
+        self._matchers: List[Tuple[bool, Pattern]] = [(allow, regex) for _, allow, regex in compiled]
+    
+    @staticmethod
+    def _compile(pattern: str) -> Pattern:
+        """
+        Compile a robots.txt path pattern.
+        
+        Args:
+            pattern: Path pattern with optional '*' wildcards and '$' anchor
+        
+        Returns:
+            Pattern: Regex matching the start of a path
+        """
+        anchored = pattern.endswith('$')
+        if anchored:
+            pattern = pattern[:-1]
+        regex = '.*'.join(re.escape(part) for part in pattern.split('*'))
+        return re.compile(regex + ('$' if anchored else ''))
+    
+    @classmethod
+    def parse(cls, body: str, user_agent: str) -> "RobotsRules":
+        """
+        Parse robots.txt for a user agent.
+        
+        The most specific group whose name appears in the user agent string is
+        used, falling back to the '*' group. Sitemap lines are collected
+        regardless of group.
+        
+        Args:
+            body: robots.txt content
+            user_agent: User agent string requests are sent with
+        
+        Returns:
+            RobotsRules: Rules that apply to the user agent
+        """
+        user_agent = (user_agent or '').lower()
+        groups: Dict[str, Dict] = {}
+        sitemaps: List[str] = []
+        current_agents: List[str] = []
+        in_rules = False
+        
+        for line in (body or '').splitlines():
+            line = line.split('#', 1)[0].strip()
+            if ':' not in line:
+                continue
+            
+            field, value = (part.strip() for part in line.split(':', 1))
+            field = field.lower()
+            
+            # Sitemap lines apply to every group
+            if field == 'sitemap':
+                if value:
+                    sitemaps.append(value)
+            elif field == 'user-agent':
+                # A user-agent line after rules starts a new group
+                if in_rules:
+                    current_agents = []
+                    in_rules = False
+                agent = value.lower()
+                current_agents.append(agent)
+                groups.setdefault(agent, {'rules': [], 'crawl_delay': None})
+            elif field in ('allow', 'disallow'):
+                in_rules = True
+                for agent in current_agents:
+                    groups[agent]['rules'].append((value, field == 'allow'))
+            elif field == 'crawl-delay':
+                in_rules = True
+                try:
+                    delay = float(value)
+                except ValueError:
+                    continue
+                for agent in current_agents:
+                    groups[agent]['crawl_delay'] = delay
+        
+        matching = [agent for agent in groups if agent != '*' and agent in user_agent]
+        if matching:
+            group = groups[max(matching, key=len)]
+        elif '*' in groups:
+            group = groups['*']
+        else:
+            return cls(sitemaps=sitemaps)
+        
+        return cls(group['rules'], group['crawl_delay'], sitemaps)
+    
+    def can_fetch(self, url: str) -> bool:
+        """
+        Check whether a URL may be crawled.
+        
+        Args:
+            url: Absolute URL or path
+        
+        Returns:
+            bool: True if no rule disallows the URL
+        """
+        parsed = urlparse(url)
+        path = parsed.path or '/'
+        if parsed.query:
+            path += f"?{parsed.query}"
+        
+        for allow, regex in self._matchers:
+            if regex.match(path):
+                return allow
+        return True
+
+
+    def get_disallowed_prefixes(self) -> List[str]:
+        """
+        Get literal path prefixes that may not be crawled at all.
+        
+        Wildcard and '$'-anchored rules, and disallowed prefixes that an
+        allow rule reopens part of, are left out, so excluding every URL
+        under a returned prefix never drops an allowed page.
+        
+        Returns:
+            List[str]: Disallowed path prefixes, in robots.txt order
+        """
+        allowed = [pattern for pattern, allow in self._rules if allow]
+        prefixes = []
+        for pattern, allow in self._rules:
+            if allow or '*' in pattern or pattern.endswith('$') or pattern in prefixes:
+                continue
+            if any(allow_pattern.startswith(pattern) for allow_pattern in allowed):
+                continue
+            prefixes.append(pattern)
+        return prefixes
+
+
+class RobotsCache:
+    """On-disk cache of raw robots.txt bodies keyed by domain."""
+    
+    def __init__(self, cache_dir: Path, ttl_seconds: float = 24 * 3600):
+        """
+        Initialize cache.
+        
+        Args:
+            cache_dir: Directory for cached robots.txt entries
+            ttl_seconds: How long a cached robots.txt stays fresh
+        """
+        self.cache_dir = Path(cache_dir)
+        self.ttl_seconds = ttl_seconds
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+    
+    def _path(self, domain: str) -> Path:
+        """Get the cache file for a domain."""
+        safe_domain = re.sub(r'[^a-z0-9.-]', '_', domain.lower())
+        return self.cache_dir / f"{safe_domain}.json"
+    
+    def get(self, domain: str) -> Optional[str]:
+        """
+        Get a fresh cached robots.txt body.
+        
+        Args:
+            domain: Domain name
+        
+        Returns:
+            Optional[str]: robots.txt content (empty if the site has none),
+                or None on miss
+        """
+        try:
+            with open(self._path(domain), 'r', encoding='utf-8') as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        
+        if time.time() - entry.get('fetched_at', 0) > self.ttl_seconds:
+            return None
+        return entry.get('body', '')
+    
+    def put(self, domain: str, body: str) -> None:
+        """
+        Store a robots.txt body.
+        
+        Args:
+            domain: Domain name
+            body: robots.txt content
+        """
+        path = self._path(domain)
+        tmp_path = path.with_suffix(f".{os.getpid()}.tmp")
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({'domain': domain, 'body': body, 'fetched_at': time.time()}, f, ensure_ascii=False)
+        os.replace(tmp_path, path)
@@ -0,0 +1,203 @@
+"""
+Deadline-aware competitor scheduling for the pipeline.
+
+This module splits the pipeline time budget across competitors weighted by
+priority, runs them highest priority first, and sheds URLs from a competitor
+when its projected run time exceeds its share of the remaining budget.
+"""
+
+import math
+import time
+from typing import Any, Callable, Dict, List
+
+
+# Competitor priority runs from 1 (highest) to 5 (lowest)
+LOWEST_PRIORITY = 5
+
+# Crawl modes that discover pages beyond the configured URLs
+DISCOVERY_MODES = ('crawl', 'frontier', 'sitemap')
+
+# CrawlSettings.limit default
+DEFAULT_CRAWL_LIMIT = 50
+
+
+class DeadlineScheduler:
+    """Allocates a pipeline deadline across competitors by priority."""
+    
+    # Weight of the latest competitor's observed pace in the running estimate
+    PACE_SMOOTHING = 0.5
+    
+    def __init__(
+        self,
+        deadline_seconds: float,
+        seconds_per_page: float,
+        reserve_seconds: float = 0.0,
+        clock: Callable[[], float] = time.monotonic
+    ):
+        """
+        Initialize scheduler.
+        
+        Args:
+            deadline_seconds: Total pipeline time budget
+            seconds_per_page: Initial estimate of time to scrape and extract one page
+            reserve_seconds: Time held back at the end for export
+            clock: Monotonic time source
+        """
+        self.deadline_seconds = deadline_seconds
+        self.seconds_per_page = seconds_per_page
+        self.reserve_seconds = reserve_seconds
+        self._clock = clock
+        self._started = clock()
+        
+        self.shed_pages = 0
+        self.skipped: List[str] = []
+        self.timed_out: List[str] = []
+    
+    @staticmethod
+    def get_priority(competitor_config: Dict[str, Any]) -> int:
+        """Get a competitor's priority (1=highest), clamped to the valid range."""
+        priority = competitor_config.get('priority') or 1
+        return min(max(int(priority), 1), LOWEST_PRIORITY)
+    
+    @classmethod
+    def get_weight(cls, competitor_config: Dict[str, Any]) -> int:
+        """Get a competitor's share weight (5 for priority 1 down to 1 for priority 5)."""
+        return LOWEST_PRIORITY + 1 - cls.get_priority(competitor_config)
+    
+    @classmethod
+    def order(cls, competitors: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Order competitors highest priority first.
+        
+        Args:
+            competitors: Competitor configurations
+        
+        Returns:
+            List[Dict[str, Any]]: Competitors sorted by priority, keeping
+                configuration order within a priority
+        """
+        return sorted(competitors, key=cls.get_priority)
+    
+    @staticmethod
+    def get_planned_pages(competitor_config: Dict[str, Any]) -> int:
+        """
+        Get the most pages a competitor's configuration would scrape.
+        
+        crawl.limit means something different in each discovery mode: crawl
+        jobs apply it per seed URL, a frontier crawl counts the seeds within
+        it, and a sitemap crawl scrapes up to that many pages on top of the
+        seeds.
+        
+        Args:
+            competitor_config: Competitor configuration
+        
+        Returns:
+            int: Projected page count
+        """
+        urls = len(competitor_config.get('new_urls', [])) + len(competitor_config.get('promo_urls', []))
+        crawl = competitor_config.get('crawl') or {}
+        mode = crawl.get('mode')
+        limit = crawl.get('limit', DEFAULT_CRAWL_LIMIT)
+        
+        if mode == 'crawl':
+            return urls * limit
+        if mode == 'frontier':
+            return limit if urls else 0
+        if mode == 'sitemap':
+            return urls + limit
+        return urls
+    
+    def elapsed(self) -> float:
+        """Get seconds since the scheduler started."""
+        return self._clock() - self._started
+    
+    def remaining(self) -> float:
+        """Get seconds left for competitor work before the deadline."""
+        return max(self.deadline_seconds - self.reserve_seconds - self.elapsed(), 0.0)
+    
+    def plan(self, competitor_config: Dict[str, Any], pending: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Allocate time to a competitor and shed URLs that would not fit.
+        
+        Args:
+            competitor_config: Competitor about to run
+            pending: Competitors still to run after it
+        
+        Returns:
+            dict: Time budget ('budget_seconds'), the (possibly trimmed)
+                configuration ('config'), and pages kept ('pages') and shed ('shed')
+        """
+        weights = self.get_weight(competitor_config) + sum(self.get_weight(c) for c in pending)
+        budget = self.remaining() * self.get_weight(competitor_config) / weights
+        
+        pages = self.get_planned_pages(competitor_config)
+        fits = int(budget / self.seconds_per_page) if self.seconds_per_page > 0 else pages
+        if pages <= fits:
+            return {'config': competitor_config, 'budget_seconds': budget, 'pages': pages, 'shed': 0}
+        
+        config = self._trim(competitor_config, fits)
+        kept = self.get_planned_pages(config) if fits else 0
+        self.shed_pages += pages - kept
+        if not kept:
+            self.skipped.append(competitor_config.get('name', 'Unknown'))
+        return {'config': config, 'budget_seconds': budget, 'pages': kept, 'shed': pages - kept}
+    
+    @staticmethod
+    def _trim(competitor_config: Dict[str, Any], pages: int) -> Dict[str, Any]:
+        """Keep the first pages of a competitor, splitting new and promo URLs proportionally."""
+        new_urls = list(competitor_config.get('new_urls', []))
+        promo_urls = list(competitor_config.get('promo_urls', []))
+        total = len(new_urls) + len(promo_urls)
+        config = dict(competitor_config)
+        
+        # Seeds are kept first; the limit (at least 1) gets whatever budget is left
+        crawl = dict(competitor_config.get('crawl') or {})
+        mode = crawl.get('mode')
+        if mode in DISCOVERY_MODES:
+            seeds = min(pages, total)
+            if mode == 'crawl':
+                crawl['limit'] = max(pages // seeds, 1) if seeds else 1
+            elif mode == 'sitemap':
+                crawl['limit'] = max(pages - seeds, 1)
+            else:
+                crawl['limit'] = max(pages, 1)
+            config['crawl'] = crawl
+            pages = seeds
+        
+        keep_new = min(len(new_urls), math.ceil(pages * len(new_urls) / total)) if total else 0
+        keep_promo = min(len(promo_urls), pages - keep_new)
+        config['new_urls'] = new_urls[:keep_new]
+        config['promo_urls'] = promo_urls[:keep_promo]
+        return config
+    
+    def record(self, pages: int, seconds: float) -> None:
+        """
+        Update the per-page estimate from a finished competitor.
+        
+        Args:
+            pages: Pages the competitor processed
+            seconds: Time the competitor took
+        """
+        if pages <= 0:
+            return
+        observed = seconds / pages
+        self.seconds_per_page += self.PACE_SMOOTHING * (observed - self.seconds_per_page)
+    
+    def record_timeout(self, competitor_config: Dict[str, Any]) -> None:
+        """Record a competitor cancelled at the end of its time budget."""
+        self.timed_out.append(competitor_config.get('name', 'Unknown'))
+    
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        Get scheduling statistics.
+        
+        Returns:
+            dict: Elapsed time, shed pages and cut-short competitors
+        """
+        return {
+            'elapsed_seconds': self.elapsed(),
+            'deadline_seconds': self.deadline_seconds,
+            'shed_pages': self.shed_pages,
+            'skipped': list(self.skipped),
+            'timed_out': list(self.timed_out)
+        }
@@ -8,7 +8,7 @@ and other validation tasks throughout the pipeline.
 import re
 import validators
 from typing import Optional, List, Tuple
-from urllib.parse import urlparse
+from urllib.parse import urljoin, urlparse
 import requests
 from datetime import datetime
 
@@ -288,6 +288,68 @@ class TextValidator:
             
         except Exception:
             return ""
+    
+    @staticmethod
+    def html_to_markdown(html: str, base_url: str = "") -> str:
+        """
+        Convert HTML to simple markdown, keeping headings, lists, links and images.
+        
+        Navigation, header, footer and form elements are dropped, similar to
+        Firecrawl's main-content mode.
+        
+        Args:
+            html: HTML content
+            base_url: URL the HTML was fetched from, for resolving relative links
+            
+        Returns:
+            str: Markdown text
+        """
+        try:
+            from bs4 import BeautifulSoup
+            soup = BeautifulSoup(html, 'html.parser')
+            
+            # Remove non-content elements
+            for element in soup(["script", "style", "noscript", "svg", "iframe", "template",
+                                 "nav", "header", "footer", "form"]):
+                element.decompose()
+            
+            for image in soup.find_all('img'):
+                src = image.get('src') or image.get('data-src')
+                if src:
+                    alt = TextValidator.clean_text(image.get('alt', ''))
+                    image.replace_with(f" ![{alt}]({urljoin(base_url, src)}) ")
+                else:
+                    image.decompose()
+            
+            for link in soup.find_all('a'):
+                href = link.get('href', '')
+                text = TextValidator.clean_text(link.get_text(' '))
+                if text and href and not href.startswith(('#', 'javascript:', 'mailto:', 'tel:')):
+                    link.replace_with(f" [{text}]({urljoin(base_url, href)}) ")
+            
+            for level in range(1, 7):
+                for heading in soup.find_all(f'h{level}'):
+                    text = TextValidator.clean_text(heading.get_text(' '))
+                    heading.replace_with(f"\n\n{'#' * level} {text}\n\n")
+            
+            for item in soup.find_all('li'):
+                item.insert_before('\n- ')
+            for line_break in soup.find_all('br'):
+                line_break.replace_with('\n')
+            for block in soup.find_all(['p', 'div', 'section', 'article', 'main', 'ul', 'ol', 'table', 'tr']):
+                block.insert_before('\n')
+                block.insert_after('\n')
+            
+            # Clean each line and collapse runs of blank lines
+            lines = []
+            for line in soup.get_text().split('\n'):
+                line = TextValidator.clean_text(line)
+                if line or (lines and lines[-1]):
+                    lines.append(line)
+            return '\n'.join(lines).strip()
+            
+        except Exception:
+            return ""
 
 
 class DataQualityValidator:
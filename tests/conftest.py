@@ -0,0 +1,93 @@
+"""
+Shared fixtures for tests against the local fake Firecrawl and Anthropic servers.
+"""
+
+import mimetypes
+
+import pytest
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.collectors.firecrawl_collector import FirecrawlCollector
+from src.extractors.claude_extractor import ClaudeExtractor
+from src.models.competitor import GlobalSettings
+from src.simulators.anthropic_server import FakeAnthropicServer, FakeAnthropicSettings
+from src.simulators.common import LatencyProfile
+from src.simulators.firecrawl_server import FakeFirecrawlServer, FakeFirecrawlSettings
+from src.utils.rate_limiter import RateLimiter
+
+
+@pytest.fixture(autouse=True)
+def settings_env(monkeypatch, tmp_path):
+    """Provide required settings, disable on-disk caches and keep data directories in a temp dir."""
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setenv("FIRECRAWL_API_KEY", "test")
+    monkeypatch.setenv("CLAUDE_API_KEY", "test")
+    monkeypatch.setenv("SUPABASE_URL", "https://example.supabase.co")
+    monkeypatch.setenv("SUPABASE_SERVICE_ROLE_KEY", "test")
+    monkeypatch.setenv("SCRAPE_CACHE_TTL_HOURS", "0")
+    monkeypatch.setenv("EXTRACTION_CACHE_MAX_MB", "0")
+
+
+def fixed_latency(seconds: float = 0.0) -> LatencyProfile:
+    """Build a latency profile that always takes the same time."""
+    return LatencyProfile(distribution="fixed", median=seconds)
+
+
+def site_route(body: str):
+    """Serve a site file, with {origin} replaced by the test server's origin (pages are HTML)."""
+    async def handle(request):
+        content_type = mimetypes.guess_type(request.path)[0] or 'text/html'
+        return web.Response(text=body.format(origin=f"http://{request.host}"), content_type=content_type)
+    return handle
+
+
+@pytest.fixture
+def fake_firecrawl():
+    """Factory for fake Firecrawl servers with no latency."""
+    def build(server_class=FakeFirecrawlServer, **settings) -> FakeFirecrawlServer:
+        settings.setdefault('latency', fixed_latency())
+        return server_class(FakeFirecrawlSettings(**settings))
+    return build
+
+
+@pytest.fixture
+def fake_anthropic():
+    """Factory for fake Anthropic servers with fixed latency."""
+    def build(server_class=FakeAnthropicServer, latency: float = 0.0, **settings) -> FakeAnthropicServer:
+        return server_class(FakeAnthropicSettings(latency=fixed_latency(latency), **settings))
+    return build
+
+
+@pytest.fixture
+def run_collector():
+    """Runner serving the fake Firecrawl API (and site files) to a test coroutine given a collector."""
+    async def run(server, test, site=None, **global_settings):
+        rate_limiter = RateLimiter()
+        rate_limiter.configure('firecrawl', rate_per_minute=60000, burst=100)
+        
+        app = server.create_app()
+        for path, body in (site or {}).items():
+            app.router.add_get(path, site_route(body))
+        
+        async with TestServer(app) as test_server:
+            collector = FirecrawlCollector(
+                GlobalSettings(**{'respect_robots_txt': False, **global_settings}),
+                rate_limiter=rate_limiter
+            )
+            collector.base_url = str(test_server.make_url("/v0"))
+            async with collector:
+                return await test(collector)
+    return run
+
+
+@pytest.fixture
+def run_extractor():
+    """Runner serving the fake Messages API to a test coroutine given an extractor."""
+    async def run(server, test):
+        async with TestServer(server.create_app()) as test_server:
+            extractor = ClaudeExtractor()
+            extractor.base_url = str(test_server.make_url("/v1"))
+            async with extractor:
+                return await test(extractor)
+    return run
@@ -0,0 +1,147 @@
+"""
+Unit tests for HTTP record/replay cassettes.
+"""
+
+import asyncio
+import json
+
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.simulators.cassette import Cassette, CassetteServer, request_key
+
+
+SCRAPE = {'url': "https://example.com/new/", 'formats': ["markdown"]}
+
+
+def serve(handler) -> TestServer:
+    """Build a test server routing every request to a cassette handler."""
+    app = web.Application()
+    app.router.add_route('*', '/{tail:.*}', handler)
+    return TestServer(app)
+
+
+class TestCassette:
+    """Test cases for Cassette."""
+    
+    def test_request_key_ignores_json_key_order(self):
+        """Test that equivalent JSON bodies produce the same key."""
+        key_a = request_key("firecrawl", "post", "/v0/scrape", b'{"url": "https://a.com", "formats": ["markdown"]}')
+        key_b = request_key("firecrawl", "POST", "/v0/scrape", b'{"formats": ["markdown"], "url": "https://a.com"}')
+        
+        assert key_a == key_b
+    
+    def test_save_and_load(self, tmp_path):
+        """Test that a cassette round-trips through disk."""
+        cassette = Cassette()
+        key = request_key("claude", "POST", "/v1/messages", b'{"model": "haiku"}')
+        cassette.add(key, 200, {'Content-Type': 'application/json'}, '{"content": []}', 1.23456)
+        
+        path = tmp_path / "run.jsonl.gz"
+        cassette.save(path)
+        loaded = Cassette.load(path)
+        
+        assert loaded.entries == cassette.entries
+        assert loaded.entries[0]['elapsed'] == 1.2346
+    
+    def test_index_preserves_order(self):
+        """Test that repeated requests replay in recorded order."""
+        cassette = Cassette()
+        key = request_key("firecrawl", "GET", "/v0/crawl/status/abc", b'')
+        cassette.add(key, 200, {}, '{"status": "active"}', 0.1)
+        cassette.add(key, 200, {}, '{"status": "completed"}', 0.1)
+        
+        queue = cassette.index()[key]
+        
+        assert [entry['body'] for entry in queue] == ['{"status": "active"}', '{"status": "completed"}']
+
+
+class TestCassetteServer:
+    """Test cases for the record proxy and replay handlers."""
+    
+    def record(self, fake_firecrawl, path, payloads):
+        """Send payloads to /v0/scrape through the record proxy and save the cassette."""
+        recorder = CassetteServer(path, mode='record')
+        
+        async def run():
+            async with TestServer(fake_firecrawl().create_app()) as upstream, aiohttp.ClientSession() as session:
+                recorder._session = session
+                origin = str(upstream.make_url('')).rstrip('/')
+                async with serve(recorder._make_record_handler('firecrawl', origin)) as proxy:
+                    responses = []
+                    for payload in payloads:
+                        async with session.post(proxy.make_url('/v0/scrape'), json=payload) as response:
+                            responses.append((response.status, response.headers.get('Content-Type'), await response.json()))
+                    return responses
+        
+        responses = asyncio.run(run())
+        recorder.cassette.save(path)
+        return recorder, responses
+    
+    def replay(self, path, requests):
+        """Send (method, path, payload) requests to the replay handler of a saved cassette."""
+        player = CassetteServer(path, mode='replay', speed=0)
+        
+        async def run():
+            async with serve(player._make_replay_handler('firecrawl')) as server, aiohttp.ClientSession() as session:
+                responses = []
+                for method, request_path, payload in requests:
+                    async with session.request(method, server.make_url(request_path), json=payload) as response:
+                        responses.append((response.status, await response.json()))
+                return responses
+        
+        return player, asyncio.run(run())
+    
+    def test_record_proxies_and_captures(self, fake_firecrawl, tmp_path):
+        """Test that the proxy returns the upstream response and records it under the request key."""
+        path = tmp_path / "run.jsonl.gz"
+        recorder, responses = self.record(fake_firecrawl, path, [SCRAPE])
+        
+        status, content_type, data = responses[0]
+        assert status == 200
+        assert content_type.startswith('application/json')
+        assert data['success'] and data['data']['markdown']
+        
+        entry = recorder.cassette.entries[0]
+        key = request_key('firecrawl', 'POST', '/v0/scrape', json.dumps(SCRAPE).encode('utf-8'))
+        assert (entry['service'], entry['method'], entry['path'], entry['body_hash']) == key
+        assert entry['status'] == 200
+        assert json.loads(entry['body']) == data
+        assert 'Content-Type' in entry['headers']
+    
+    def test_replay_serves_recording(self, fake_firecrawl, tmp_path):
+        """Test that replay answers a recorded request, whatever its JSON key order."""
+        path = tmp_path / "run.jsonl.gz"
+        _, recorded = self.record(fake_firecrawl, path, [SCRAPE])
+        
+        reordered = dict(reversed(list(SCRAPE.items())))
+        player, responses = self.replay(path, [('POST', '/v0/scrape', reordered)])
+        
+        assert responses == [(200, recorded[0][2])]
+        assert player.misses == 0
+    
+    def test_replay_serves_repeats_in_order(self, tmp_path):
+        """Test that repeated requests replay in recorded order, then repeat the last response."""
+        path = tmp_path / "run.jsonl.gz"
+        cassette = Cassette()
+        key = request_key("firecrawl", "GET", "/v0/crawl/status/abc", b'')
+        cassette.add(key, 200, {'Content-Type': 'application/json'}, '{"status": "active"}', 0.1)
+        cassette.add(key, 200, {'Content-Type': 'application/json'}, '{"status": "completed"}', 0.1)
+        cassette.save(path)
+        
+        _, responses = self.replay(path, [('GET', '/v0/crawl/status/abc', None)] * 3)
+        
+        assert [data['status'] for _, data in responses] == ['active', 'completed', 'completed']
+    
+    def test_replay_miss(self, fake_firecrawl, tmp_path):
+        """Test that an unrecorded request gets a 404 and counts as a miss."""
+        path = tmp_path / "run.jsonl.gz"
+        self.record(fake_firecrawl, path, [SCRAPE])
+        
+        other = {**SCRAPE, 'url': "https://example.com/sale/"}
+        player, responses = self.replay(path, [('POST', '/v0/scrape', other), ('POST', '/v1/scrape', SCRAPE)])
+        
+        assert [status for status, _ in responses] == [404, 404]
+        assert responses[0][1] == {'error': 'No recorded interaction'}
+        assert player.misses == 2
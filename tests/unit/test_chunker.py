@@ -0,0 +1,96 @@
+"""
+Unit tests for extraction chunking.
+"""
+
+from src.extractors.chunker import chunk_markdown, deduplicate, split_sections
+
+
+def listing(count):
+    """Build a listing page with one heading per product."""
+    products = "\n\n".join(
+        f"## [Product {i}](https://example.com/p/{i}) - ${i}99\n"
+        f"![Product {i}](https://example.com/i/{i}.jpg)\n"
+        f"Description of product {i}"
+        for i in range(count)
+    )
+    return f"# New Arrivals\n\n{products}\n"
+
+
+class TestSplitSections:
+    """Test cases for section splitting."""
+    
+    def test_splits_before_headings(self):
+        """Test that each heading starts a section."""
+        sections = split_sections("# Title\nintro\n## A\ntext a\n## B\ntext b")
+        
+        assert sections == ["# Title\nintro", "## A\ntext a", "## B\ntext b"]
+    
+    def test_horizontal_rules_separate_sections(self):
+        """Test that rules split sections and are dropped."""
+        sections = split_sections("first\n---\nsecond")
+        
+        assert sections == ["first", "second"]
+
+
+class TestChunkMarkdown:
+    """Test cases for chunk_markdown."""
+    
+    def test_short_content_is_one_chunk(self):
+        """Test that content within the budget is not split."""
+        assert chunk_markdown("## Sofa - $899", max_tokens=100) == ["## Sofa - $899"]
+    
+    def test_blank_content(self):
+        """Test that blank content yields no chunks."""
+        assert chunk_markdown("  \n ", max_tokens=100) == []
+    
+    def test_chunks_respect_budget_and_keep_products_whole(self):
+        """Test that chunks fit the budget and never split a product section."""
+        markdown = listing(30)
+        
+        chunks = chunk_markdown(markdown, max_tokens=100)
+        
+        assert len(chunks) > 1
+        assert all(len(chunk) <= 400 for chunk in chunks)
+        for i in range(30):
+            holding = [chunk for chunk in chunks if f"[Product {i}]" in chunk]
+            assert len(holding) == 1
+            assert f"Description of product {i}" in holding[0]
+    
+    def test_covers_whole_page(self):
+        """Test that every product line appears in some chunk."""
+        markdown = listing(50)
+        
+        chunks = chunk_markdown(markdown, max_tokens=200)
+        
+        assert sum(chunk.count("## [Product") for chunk in chunks) == 50
+    
+    def test_oversized_section_falls_back_to_lines(self):
+        """Test that a section larger than the budget is split on lines."""
+        markdown = "## Big\n" + "\n".join(f"line {i} " + "x" * 30 for i in range(20))
+        
+        chunks = chunk_markdown(markdown, max_tokens=25)
+        
+        assert all(len(chunk) <= 100 for chunk in chunks)
+        assert "line 19" in chunks[-1]
+    
+    def test_unbroken_text_is_hard_split(self):
+        """Test that text without boundaries is split at the budget."""
+        chunks = chunk_markdown("x" * 1000, max_tokens=50)
+        
+        assert [len(chunk) for chunk in chunks] == [200] * 5
+
+
+class TestDeduplicate:
+    """Test cases for deduplicate."""
+    
+    def test_keeps_first_occurrence(self):
+        """Test that duplicates across chunks are dropped in order."""
+        items = [
+            {'product_url': 'https://example.com/a', 'price': 10},
+            {'product_url': 'https://example.com/b', 'price': 20},
+            {'product_url': 'https://example.com/a', 'price': 11}
+        ]
+        
+        unique = deduplicate(items, key=lambda item: item['product_url'])
+        
+        assert unique == items[:2]
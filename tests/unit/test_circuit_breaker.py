@@ -0,0 +1,95 @@
+"""
+Unit tests for per-domain circuit breakers.
+"""
+
+import time
+
+import pytest
+
+from src.utils.circuit_breaker import CircuitBreaker, CircuitBreakerRegistry, CircuitOpenError
+
+
+class TestCircuitBreaker:
+    """Test cases for CircuitBreaker."""
+    
+    def test_opens_after_threshold(self):
+        """Test that consecutive failures open the circuit."""
+        breaker = CircuitBreaker(failure_threshold=2, cooldown_seconds=60)
+        breaker.record_failure()
+        assert breaker.allow_request()
+        
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert not breaker.allow_request()
+        assert breaker.rejected == 1
+    
+    def test_success_resets_failures(self):
+        """Test that a success clears the failure streak."""
+        breaker = CircuitBreaker(failure_threshold=2)
+        breaker.record_failure()
+        breaker.record_success()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.CLOSED
+    
+    def test_half_open_admits_single_probe(self):
+        """Test that only one probe passes after the cooldown."""
+        breaker = CircuitBreaker(failure_threshold=1, cooldown_seconds=0.05)
+        breaker.record_failure()
+        time.sleep(0.06)
+        
+        assert breaker.allow_request()
+        assert breaker.state == CircuitBreaker.HALF_OPEN
+        assert not breaker.allow_request()
+        
+        breaker.record_success()
+        assert breaker.state == CircuitBreaker.CLOSED
+    
+    def test_failed_probe_reopens(self):
+        """Test that a failed probe opens the circuit again."""
+        breaker = CircuitBreaker(failure_threshold=3, cooldown_seconds=0.05)
+        for _ in range(3):
+            breaker.record_failure()
+        time.sleep(0.06)
+        
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state == CircuitBreaker.OPEN
+        assert breaker.times_opened == 2
+
+
+class TestCircuitBreakerRegistry:
+    """Test cases for CircuitBreakerRegistry."""
+    
+    def test_keys_are_independent(self):
+        """Test that one failing domain does not block another."""
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        registry.record_failure("a.example.com")
+        
+        with pytest.raises(CircuitOpenError):
+            registry.check("a.example.com")
+        registry.check("b.example.com")
+    
+    def test_summary(self):
+        """Test that the summary reports every breaker."""
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        registry.record_failure("claude")
+        registry.record_success("firecrawl")
+        
+        summary = registry.get_summary()
+        assert summary["claude"]["state"] == "open"
+        assert summary["firecrawl"]["times_opened"] == 0
+    
+    def test_early_check_keeps_probe(self):
+        """Test that a non-admitting check leaves the half-open probe for the real check."""
+        registry = CircuitBreakerRegistry(failure_threshold=1, cooldown_seconds=0.05)
+        registry.record_failure("claude")
+        
+        with pytest.raises(CircuitOpenError):
+            registry.check("claude", admit=False)
+        time.sleep(0.06)
+        
+        registry.check("claude", admit=False)
+        registry.check("claude")
+        with pytest.raises(CircuitOpenError):
+            registry.check("claude", admit=False)
+        assert registry.get("claude").rejected == 2
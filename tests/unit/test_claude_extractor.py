@@ -0,0 +1,214 @@
+"""
+Unit tests for the Claude extractor against the local fake Messages server.
+"""
+
+import asyncio
+
+from src.extractors.claude_extractor import ClaudeExtractor
+from src.simulators.anthropic_server import FakeAnthropicServer
+from src.simulators.common import FaultProfile
+from src.utils.circuit_breaker import CircuitBreakerRegistry
+from src.utils.retry import RetryPolicy
+
+
+def listing(count):
+    """Build a listing page with one heading per product."""
+    products = "\n\n".join(
+        f"## [Product {i}](https://example.com/p/{i}) - ${i + 1}99\n"
+        f"![Product {i}](https://example.com/i/{i}.jpg)\n"
+        f"Description of product {i} " + "x" * 200
+        for i in range(count)
+    )
+    return f"# New Arrivals\n\n{products}\n"
+
+
+class TestChunkedExtraction:
+    """Test cases for chunked extraction."""
+    
+    def test_extracts_every_chunk(self, fake_anthropic, run_extractor):
+        """Test that a long page is extracted in several calls and nothing is lost."""
+        server = fake_anthropic()
+        
+        async def test(extractor):
+            extractor.chunk_tokens = 250
+            return await extractor.extract_products(listing(20), "Acme")
+        
+        products = asyncio.run(run_extractor(server, test))
+        
+        assert server.stats.counts['messages_requests'] > 1
+        assert [p['product_name'] for p in products] == [f"Product {i}" for i in range(20)]
+        assert all(p['competitor'] == "Acme" for p in products)
+    
+    def test_duplicates_across_chunks_are_dropped(self, fake_anthropic, run_extractor):
+        """Test that a product repeated in another chunk is kept once."""
+        server = fake_anthropic()
+        repeated = listing(10) + "\n## Footer\n" + "y" * 900 + "\n\n## [Product 0](https://example.com/p/0) - $199\n"
+        
+        async def test(extractor):
+            extractor.chunk_tokens = 250
+            return await extractor.extract_products(repeated, "Acme")
+        
+        products = asyncio.run(run_extractor(server, test))
+        
+        assert [p['product_name'] for p in products] == [f"Product {i}" for i in range(10)]
+    
+    def test_keys_without_urls_use_names(self):
+        """Test that products without URLs are told apart by name."""
+        sofa = {'competitor': 'Acme', 'product_name': 'Oak Sofa', 'product_url': ''}
+        chair = {'competitor': 'Acme', 'product_name': 'Oak Chair', 'product_url': ''}
+        
+        assert ClaudeExtractor._product_key(sofa) != ClaudeExtractor._product_key(chair)
+        assert ClaudeExtractor._product_key(dict(sofa, product_name=' oak sofa')) == ClaudeExtractor._product_key(sofa)
+
+
+class CountingServer(FakeAnthropicServer):
+    """Fake server that records peak in-flight requests and client connections."""
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize counters."""
+        super().__init__(*args, **kwargs)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.peers = set()
+    
+    async def handle_messages(self, request):
+        """Count the request while it is being answered."""
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.peers.add(request.transport.get_extra_info('peername'))
+        try:
+            return await super().handle_messages(request)
+        finally:
+            self.in_flight -= 1
+
+
+class TestExtractMany:
+    """Test cases for concurrent page extraction."""
+    
+    PAGES = [
+        {'url': f"https://example.com/new/{i}", 'content': f"## [Sofa {i}](https://example.com/p/{i}) - $899", 'extract': ['products']}
+        for i in range(8)
+    ]
+    
+    def test_results_in_input_order(self, fake_anthropic, run_extractor):
+        """Test that every page is extracted and results keep input order."""
+        seen = []
+        
+        async def test(extractor):
+            return await extractor.extract_many(self.PAGES, "Acme", on_result=seen.append)
+        
+        results = asyncio.run(run_extractor(fake_anthropic(), test))
+        
+        assert [result['url'] for result in results] == [page['url'] for page in self.PAGES]
+        assert [result['products'][0]['product_name'] for result in results] == [f"Sofa {i}" for i in range(8)]
+        assert all(result['promotions'] == [] for result in results)
+        assert len(seen) == 8
+    
+    def test_concurrency_is_bounded(self, fake_anthropic, run_extractor):
+        """Test that in-flight calls never exceed the Claude concurrency limit."""
+        server = fake_anthropic(CountingServer, latency=0.05)
+        
+        async def test(extractor):
+            extractor.concurrency.configure('claude', initial_limit=2, max_limit=2)
+            return await extractor.extract_many(self.PAGES, "Acme")
+        
+        asyncio.run(run_extractor(server, test))
+        
+        assert server.stats.counts['messages_requests'] == 8
+        assert server.peak_in_flight == 2
+    
+    def test_session_is_pooled(self, fake_anthropic, run_extractor):
+        """Test that calls reuse one session and its kept-alive connections."""
+        server = fake_anthropic(CountingServer)
+        
+        async def test(extractor):
+            extractor.concurrency.configure('claude', initial_limit=2, max_limit=2)
+            session = await extractor._get_session()
+            await extractor.extract_many(self.PAGES, "Acme")
+            return session is await extractor._get_session()
+        
+        assert asyncio.run(run_extractor(server, test))
+        assert len(server.peers) <= 2
+
+
+class TestCombinedExtraction:
+    """Test cases for combined product and promotion calls."""
+    
+    MIXED = """# New Arrivals
+## [Oak Sofa](https://example.com/products/oak-sofa/) - $1,299
+## Modern Chair - $249
+## Sale: 20% Off All Chairs
+Use code CHAIR20 at checkout
+"""
+    
+    def extract(self, run_extractor, server, pages, combined=True):
+        """Extract pages against the server with combined extraction on or off."""
+        async def test(extractor):
+            extractor.combined_extraction = combined
+            results = await extractor.extract_many(pages, "Acme")
+            return extractor, results
+        
+        return asyncio.run(run_extractor(server, test))
+    
+    def test_mixed_page_uses_one_call(self, fake_anthropic, run_extractor):
+        """Test that a page needing both extractions makes one combined call."""
+        server = fake_anthropic()
+        pages = [{'url': "https://example.com/new/", 'content': self.MIXED, 'extract': ['products', 'promotions']}]
+        
+        extractor, results = self.extract(run_extractor, server, pages)
+        
+        assert server.stats.counts['messages_requests'] == 1
+        assert extractor.combined_calls == 1
+        assert [p['product_name'] for p in results[0]['products']] == ["Oak Sofa", "Modern Chair"]
+        assert [p['promo_type'] for p in results[0]['promotions']] == ["percentage_off"]
+        assert extractor.combined_products == 2
+        assert extractor.combined_promotions == 1
+        assert all(item['competitor'] == "Acme" for item in results[0]['products'] + results[0]['promotions'])
+    
+    def test_single_kind_pages_use_separate_prompts(self, fake_anthropic, run_extractor):
+        """Test that pages needing one extraction are not combined."""
+        server = fake_anthropic()
+        pages = [
+            {'url': "https://example.com/new/", 'content': self.MIXED, 'extract': ['products']},
+            {'url': "https://example.com/sale/", 'content': self.MIXED, 'extract': ['promotions']}
+        ]
+        
+        extractor, results = self.extract(run_extractor, server, pages)
+        
+        assert server.stats.counts['messages_requests'] == 2
+        assert extractor.combined_calls == 0
+        assert len(results[0]['products']) == 2 and results[0]['promotions'] == []
+        assert results[1]['products'] == [] and len(results[1]['promotions']) == 1
+    
+    def test_disabled_splits_mixed_pages(self, fake_anthropic, run_extractor):
+        """Test that disabling combined extraction makes one call per type."""
+        server = fake_anthropic()
+        pages = [{'url': "https://example.com/new/", 'content': self.MIXED, 'extract': ['products', 'promotions']}]
+        
+        extractor, results = self.extract(run_extractor, server, pages, combined=False)
+        
+        assert server.stats.counts['messages_requests'] == 2
+        assert extractor.combined_calls == 0
+        assert len(results[0]['products']) == 2
+        assert len(results[0]['promotions']) == 1
+
+
+class TestCircuitBreaking:
+    """Test cases for the Claude circuit breaker on queued calls."""
+    
+    def test_queued_calls_stop_once_circuit_opens(self, fake_anthropic, run_extractor):
+        """Test that calls queued before the circuit opened are rejected."""
+        server = fake_anthropic(faults=FaultProfile(server_error_rate=1.0))
+        pages = [{'url': f"https://example.com/new/{i}", 'content': "## Sofa - $899", 'extract': ['products']} for i in range(20)]
+        
+        async def test(extractor):
+            extractor.circuit_breakers = CircuitBreakerRegistry(failure_threshold=3)
+            extractor.retry_policy = RetryPolicy(max_retries=0, retry_on=ClaudeExtractor.RETRY_ON)
+            extractor.rate_limiter.configure('claude', rate_per_minute=60000, burst=100)
+            await extractor.extract_many(pages, "Acme")
+            return extractor.circuit_breakers.get('claude').rejected
+        
+        rejected = asyncio.run(run_extractor(server, test))
+        
+        assert server.stats.counts['messages_requests'] == 3
+        assert rejected == 17
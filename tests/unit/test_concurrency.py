@@ -0,0 +1,190 @@
+"""
+Unit tests for adaptive concurrency limits.
+"""
+
+import asyncio
+
+from src.utils.concurrency import AdaptiveConcurrency, AdaptiveLimit, is_congestion
+from src.utils.retry import RetryableError
+
+
+class TestIsCongestion:
+    """Test cases for congestion classification."""
+    
+    def test_rate_limit_and_timeout(self):
+        """Test that 429s, 503s and timeouts count as congestion."""
+        assert is_congestion(RetryableError("HTTP 429", status=429))
+        assert is_congestion(RetryableError("HTTP 503", status=503))
+        assert is_congestion(asyncio.TimeoutError())
+    
+    def test_other_failures(self):
+        """Test that server errors and connection failures do not."""
+        assert not is_congestion(RetryableError("HTTP 500", status=500))
+        assert not is_congestion(ConnectionError())
+
+
+class TestAdaptiveLimit:
+    """Test cases for AdaptiveLimit."""
+    
+    def test_additive_increase(self):
+        """Test that the limit grows by one per healthy window."""
+        limit = AdaptiveLimit(2, max_limit=4)
+        
+        for _ in range(2):
+            limit.record_success(1.0)
+        assert limit.limit == 3
+        
+        for _ in range(3):
+            limit.record_success(1.0)
+        assert limit.limit == 4
+        
+        for _ in range(10):
+            limit.record_success(1.0)
+        assert limit.limit == 4
+        assert limit.increases == 2
+    
+    def test_multiplicative_decrease_on_429(self):
+        """Test that a rate limit halves the limit once per burst."""
+        limit = AdaptiveLimit(8, max_limit=20)
+        
+        limit.record_failure(RetryableError("HTTP 429", status=429))
+        limit.record_failure(RetryableError("HTTP 429", status=429))
+        
+        assert limit.limit == 4
+        assert limit.decreases == 1
+        assert limit.decisions[-1]['reason'] == 'HTTP 429'
+    
+    def test_decrease_respects_min_limit(self):
+        """Test that decreases stop at the minimum."""
+        limit = AdaptiveLimit(1, min_limit=1)
+        
+        limit.record_failure(asyncio.TimeoutError())
+        
+        assert limit.limit == 1
+        assert limit.decreases == 0
+    
+    def test_latency_spike_decreases(self):
+        """Test that a latency far above the baseline cuts the limit."""
+        limit = AdaptiveLimit(10, max_limit=10)
+        for _ in range(AdaptiveLimit.MIN_LATENCY_SAMPLES):
+            limit.record_success(1.0)
+        
+        limit.record_success(5.0)
+        
+        assert limit.limit == 5
+        assert 'latency spike' in limit.decisions[-1]['reason']
+    
+    def test_error_rate_decreases(self):
+        """Test that non-congestion failures cut the limit once the error rate is high."""
+        limit = AdaptiveLimit(10, max_limit=10)
+        for _ in range(7):
+            limit.record_success(1.0)
+        
+        for _ in range(3):
+            limit.record_failure(ConnectionError())
+        
+        assert limit.limit == 5
+    
+    def test_fixed_limit(self):
+        """Test that equal bounds keep the limit fixed."""
+        limit = AdaptiveLimit(3, min_limit=3, max_limit=3)
+        
+        for _ in range(10):
+            limit.record_success(1.0)
+        limit.record_failure(RetryableError("HTTP 429", status=429))
+        
+        assert limit.limit == 3
+    
+    def test_slots_respect_limit(self):
+        """Test that concurrent requests never exceed the limit."""
+        limit = AdaptiveLimit(2, max_limit=2)
+        active = 0
+        peak = 0
+        
+        async def request():
+            nonlocal active, peak
+            async with limit.slot():
+                active += 1
+                peak = max(peak, active)
+                await asyncio.sleep(0.01)
+                active -= 1
+        
+        async def run():
+            await asyncio.gather(*[request() for _ in range(6)])
+        
+        asyncio.run(run())
+        
+        assert peak == 2
+        assert limit.in_flight == 0
+    
+    def test_try_acquire_does_not_wait(self):
+        """Test that try_acquire takes free slots and fails instead of waiting when full."""
+        limit = AdaptiveLimit(2, max_limit=2)
+        
+        assert limit.try_acquire()
+        assert limit.try_acquire()
+        assert not limit.try_acquire()
+        
+        limit.release()
+        assert limit.try_acquire()
+        assert limit.in_flight == 2
+    
+    def test_increase_wakes_waiters(self):
+        """Test that a raised limit admits waiting requests."""
+        limit = AdaptiveLimit(1, max_limit=2)
+        
+        async def run():
+            await limit.acquire()
+            waiter = asyncio.create_task(limit.acquire())
+            await asyncio.sleep(0)
+            assert not waiter.done()
+            
+            limit.record_success(1.0)
+            await asyncio.wait_for(waiter, timeout=1)
+        
+        asyncio.run(run())
+        
+        assert limit.in_flight == 2
+    
+    def test_cancelled_waiter_passes_wakeup(self):
+        """Test that cancelling a woken waiter hands its slot to the next one."""
+        limit = AdaptiveLimit(1, max_limit=1)
+        
+        async def run():
+            await limit.acquire()
+            first = asyncio.create_task(limit.acquire())
+            second = asyncio.create_task(limit.acquire())
+            await asyncio.sleep(0)
+            
+            limit.release()
+            first.cancel()
+            await asyncio.wait_for(second, timeout=1)
+        
+        asyncio.run(run())
+        
+        assert limit.in_flight == 1
+
+
+class TestAdaptiveConcurrency:
+    """Test cases for AdaptiveConcurrency."""
+    
+    def test_configure_and_summary(self):
+        """Test that configured keys report their state and decisions."""
+        registry = AdaptiveConcurrency()
+        registry.configure('claude', initial_limit=4, max_limit=8)
+        
+        registry.get('claude').record_failure(RetryableError("HTTP 429", status=429))
+        
+        assert registry.is_configured('claude')
+        assert registry.get_summary()['claude']['limit'] == 2
+        assert registry.get_decisions('claude')[0]['action'] == 'decrease'
+        assert registry.get_decisions('firecrawl') == []
+    
+    def test_default_limit(self):
+        """Test that unconfigured keys get the default bounds."""
+        registry = AdaptiveConcurrency(initial_limit=3, max_limit=6)
+        
+        limit = registry.get('firecrawl')
+        
+        assert limit.limit == 3
+        assert limit.max_limit == 6
@@ -0,0 +1,153 @@
+"""
+Unit tests for the direct-fetch fast path.
+"""
+
+import asyncio
+import time
+
+from aiohttp import web
+from aiohttp.test_utils import TestServer
+
+from src.collectors.direct_fetcher import DirectFetcher
+from src.utils.validators import TextValidator
+
+
+PAGE_HTML = """
+<html>
+<head><title>New Furniture | Example</title><script>var x = 1;</script></head>
+<body>
+  <nav><a href="/account">Account</a></nav>
+  <main>
+    <h1>New Arrivals</h1>
+    <ul>
+      <li><a href="/products/sofa"><img src="/img/sofa.jpg" alt="Sofa"> Harmony Sofa</a> $1,299</li>
+      <li><a href="/products/chair">Slope Chair</a> $499</li>
+    </ul>
+  </main>
+  <footer>Copyright</footer>
+</body>
+</html>
+"""
+
+
+LISTING_HTML = "<html><head><title>New Arrivals</title></head><body><h1>New Arrivals</h1><ul>" + "".join(
+    f'<li><a href="/products/{i}">Harmony Sofa {i}</a> $1,{i}99</li>' for i in range(20)
+) + "</ul></body></html>"
+
+APP_SHELL_HTML = '<html><body><div id="root"></div><noscript>Please enable JavaScript</noscript></body></html>'
+
+
+def serve(body, content_type='text/html'):
+    """Build a handler answering with a fixed body."""
+    async def handle(request):
+        return web.Response(text=body, content_type=content_type)
+    return handle
+
+
+def site_app():
+    """Build a site with a server-rendered listing, an app shell and a JSON feed."""
+    app = web.Application()
+    app.router.add_get('/new/', serve(LISTING_HTML))
+    app.router.add_get('/app/', serve(APP_SHELL_HTML))
+    app.router.add_get('/feed', serve('{"products": []}', 'application/json'))
+    return app
+
+
+async def fetch_from_site(path, **kwargs):
+    """Fetch a path from the local site with a new fetcher."""
+    async with TestServer(site_app()) as server:
+        fetcher = DirectFetcher()
+        try:
+            return await fetcher.fetch(str(server.make_url(path)), **kwargs)
+        finally:
+            await fetcher.close()
+
+
+class TestHtmlToMarkdown:
+    """Test cases for TextValidator.html_to_markdown."""
+    
+    def test_headings_lists_and_links(self):
+        """Test that structure and absolute links are kept."""
+        markdown = TextValidator.html_to_markdown(PAGE_HTML, "https://example.com/shop/new/")
+        
+        assert "# New Arrivals" in markdown
+        assert "- [Slope Chair](https://example.com/products/chair) $499" in markdown
+        assert "![Sofa](https://example.com/img/sofa.jpg)" in markdown
+    
+    def test_drops_navigation_and_scripts(self):
+        """Test that non-content elements are removed."""
+        markdown = TextValidator.html_to_markdown(PAGE_HTML, "https://example.com/")
+        
+        assert "Account" not in markdown
+        assert "Copyright" not in markdown
+        assert "var x" not in markdown
+
+
+class TestNeedsJavascript:
+    """Test cases for DirectFetcher.needs_javascript."""
+    
+    def test_app_shell_needs_javascript(self):
+        """Test that near-empty pages fall back to Firecrawl."""
+        assert DirectFetcher.needs_javascript("Loading...")
+    
+    def test_javascript_notice(self):
+        """Test that pages asking for JavaScript fall back to Firecrawl."""
+        assert DirectFetcher.needs_javascript("Please enable JavaScript to continue. " * 30)
+    
+    def test_server_rendered_page(self):
+        """Test that content-rich pages are used directly."""
+        assert not DirectFetcher.needs_javascript("- [Harmony Sofa](https://example.com/p/1) $1,299\n" * 20)
+
+
+class TestFetch:
+    """Test cases for DirectFetcher.fetch against a local site."""
+    
+    def test_server_rendered_page(self):
+        """Test that a server-rendered page is converted without keeping its HTML."""
+        result = asyncio.run(fetch_from_site('/new/'))
+        
+        assert result['status'] == 'success'
+        assert result['engine'] == 'direct'
+        assert result['title'] == "New Arrivals"
+        assert "[Harmony Sofa 3](http://" in result['markdown']
+        assert result['html'] == ''
+    
+    def test_html_kept_when_requested(self):
+        """Test that the raw HTML is returned when the html format is requested."""
+        result = asyncio.run(fetch_from_site('/new/', formats=['markdown', 'html']))
+        
+        assert result['html'] == LISTING_HTML
+    
+    def test_unusable_pages_fail(self):
+        """Test that app shells, non-HTML and missing pages are reported as failures."""
+        results = [asyncio.run(fetch_from_site(path)) for path in ('/app/', '/feed', '/missing/')]
+        
+        assert [result['status'] for result in results] == ['failed'] * 3
+        assert results[0]['error'] == "Page appears to be JavaScript-rendered"
+        assert results[1]['error'].startswith("Not HTML")
+        assert results[2]['error'] == "HTTP 404"
+    
+    def test_parsing_does_not_block_the_event_loop(self, monkeypatch):
+        """Test that HTML conversion runs off the event loop."""
+        def slow_convert(html, base_url=""):
+            time.sleep(0.3)
+            return "- [Harmony Sofa](https://example.com/p/1) $1,299\n" * 20
+        
+        monkeypatch.setattr(TextValidator, 'html_to_markdown', staticmethod(slow_convert))
+        ticks = 0
+        
+        async def ticker():
+            nonlocal ticks
+            while True:
+                await asyncio.sleep(0.01)
+                ticks += 1
+        
+        async def run():
+            task = asyncio.create_task(ticker())
+            try:
+                return await fetch_from_site('/new/')
+            finally:
+                task.cancel()
+        
+        assert asyncio.run(run())['status'] == 'success'
+        assert ticks >= 10
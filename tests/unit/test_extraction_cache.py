@@ -0,0 +1,83 @@
+"""
+Unit tests for the extraction result cache.
+"""
+
+from src.storage.extraction_cache import ExtractionCache
+
+
+PRODUCTS = [{'product_name': 'Oak Sofa', 'price': 1299.0, 'competitor': 'Acme'}]
+
+
+class TestExtractionCache:
+    """Test cases for ExtractionCache."""
+    
+    def test_content_hash_normalizes_whitespace(self):
+        """Test that whitespace changes do not change the hash."""
+        spaced = ExtractionCache.content_hash("##   Oak Sofa\n\n-  $1,299  ", "Acme")
+        
+        assert spaced == ExtractionCache.content_hash("## Oak Sofa - $1,299", "Acme")
+        assert spaced != ExtractionCache.content_hash("## Oak Sofa - $1,199", "Acme")
+        assert spaced != ExtractionCache.content_hash("## Oak Sofa - $1,299", "Other")
+    
+    def test_round_trip(self, tmp_path):
+        """Test that stored results are returned and counted as hits."""
+        cache = ExtractionCache(tmp_path / "cache.db")
+        digest = ExtractionCache.content_hash("page", "Acme")
+        
+        assert cache.get(digest, 'products', '1', 'model') is None
+        cache.put(digest, 'products', '1', 'model', PRODUCTS)
+        
+        assert cache.get(digest, 'products', '1', 'model') == PRODUCTS
+        assert cache.get_stats()['hits'] == 1
+        assert cache.get_stats()['misses'] == 1
+    
+    def test_key_includes_type_version_and_model(self, tmp_path):
+        """Test that other extraction types, prompt versions and models miss."""
+        cache = ExtractionCache(tmp_path / "cache.db")
+        digest = ExtractionCache.content_hash("page")
+        cache.put(digest, 'products', '1', 'model', PRODUCTS)
+        
+        assert cache.get(digest, 'promotions', '1', 'model') is None
+        assert cache.get(digest, 'products', '2', 'model') is None
+        assert cache.get(digest, 'products', '1', 'other-model') is None
+    
+    def test_persists_across_instances(self, tmp_path):
+        """Test that results survive closing and reopening the cache."""
+        digest = ExtractionCache.content_hash("page")
+        cache = ExtractionCache(tmp_path / "cache.db")
+        cache.put(digest, 'combined', '1', 'model', {'products': PRODUCTS, 'promotions': []})
+        cache.close()
+        
+        reopened = ExtractionCache(tmp_path / "cache.db")
+        
+        assert reopened.get(digest, 'combined', '1', 'model') == {'products': PRODUCTS, 'promotions': []}
+        assert reopened.get_stats()['total_bytes'] > 0
+    
+    def test_evicts_least_recently_used(self, tmp_path):
+        """Test that the least recently used entries are evicted over budget."""
+        cache = ExtractionCache(tmp_path / "cache.db")
+        result = [{'description': 'x' * 100}]
+        for page in ('a', 'b', 'c'):
+            cache.put(page, 'promotions', '1', 'model', result)
+        entry_size = cache.get_stats()['total_bytes'] // 3
+        
+        # Touch 'a' so 'b' becomes the least recently used entry
+        cache.get('a', 'promotions', '1', 'model')
+        cache.max_bytes = int(entry_size * 3.5)
+        cache.put('d', 'promotions', '1', 'model', result)
+        
+        assert cache.get('b', 'promotions', '1', 'model') is None
+        assert cache.get('a', 'promotions', '1', 'model') == result
+        assert cache.get('d', 'promotions', '1', 'model') == result
+        assert cache.get_stats()['evicted'] == 1
+        assert cache.get_stats()['total_bytes'] <= cache.max_bytes
+    
+    def test_replacing_entry_keeps_size(self, tmp_path):
+        """Test that overwriting an entry does not double count its size."""
+        cache = ExtractionCache(tmp_path / "cache.db")
+        cache.put('a', 'products', '1', 'model', PRODUCTS)
+        size = cache.get_stats()['total_bytes']
+        
+        cache.put('a', 'products', '1', 'model', PRODUCTS)
+        
+        assert cache.get_stats()['total_bytes'] == size
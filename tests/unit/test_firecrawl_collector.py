@@ -0,0 +1,646 @@
+"""
+Unit tests for the Firecrawl collector against the local fake Firecrawl server.
+"""
+
+import asyncio
+import time
+from pathlib import Path
+from urllib.parse import parse_qs, urlparse
+
+import pytest
+from aiohttp import web
+
+from src.simulators.common import FaultProfile
+from src.simulators.firecrawl_server import FakeFirecrawlServer
+from src.storage.scrape_cache import ScrapeCache
+
+
+class RecordingServer(FakeFirecrawlServer):
+    """Fake Firecrawl server that records scraped URLs and fails some of them."""
+    
+    # URL substrings Firecrawl cannot scrape, answered with this status
+    # (200 meaning an unsuccessful scrape result)
+    missing = ()
+    missing_status = 404
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize the scrape log."""
+        super().__init__(*args, **kwargs)
+        self.scraped = []
+    
+    async def handle_scrape(self, request):
+        """Record the URL, then scrape or fail it."""
+        url = (await request.json()).get('url', '')
+        self.scraped.append(url)
+        if any(part in url for part in self.missing):
+            return web.json_response({'success': False, 'error': 'Page returned 404'}, status=self.missing_status)
+        return await super().handle_scrape(request)
+
+
+def competitor(urls, promo_urls=(), **crawl):
+    """Build a competitor config scraping urls with fast pacing."""
+    return {
+        'name': "Acme",
+        'new_urls': list(urls),
+        'promo_urls': list(promo_urls),
+        'crawl': {'delay': 0.1, 'backoff_base': 0.1, 'backoff_max': 1.0, **crawl}
+    }
+
+
+def origin_of(collector):
+    """Get the test server origin a collector points at."""
+    return collector.base_url.rsplit('/v0', 1)[0]
+
+
+class TestCircuitBreaking:
+    """Test cases for circuit breakers on queued scrapes."""
+    
+    def test_queued_scrapes_stop_once_circuit_opens(self, fake_firecrawl, run_collector):
+        """Test that scrapes queued before the Firecrawl circuit opened are rejected."""
+        server = fake_firecrawl(faults=FaultProfile(server_error_rate=1.0))
+        urls = [f"https://example.com/new/{i}" for i in range(20)]
+        
+        async def test(collector):
+            results = await collector.scrape_competitor_urls(competitor(urls, retries=0))
+            return collector, results
+        
+        collector, results = asyncio.run(run_collector(server, test, circuit_failure_threshold=3))
+        
+        assert server.stats.counts['scrape_requests'] == 3
+        assert all(result['status'] == 'failed' for result in results)
+        assert collector.circuit_breakers.get('firecrawl').rejected == 17
+    
+    def test_firecrawl_errors_do_not_open_domain_circuits(self, fake_firecrawl, run_collector):
+        """Test that 5xx responses from Firecrawl count against Firecrawl, not the target site."""
+        server = fake_firecrawl(faults=FaultProfile(server_error_rate=1.0))
+        urls = [f"https://{domain}/new/" for domain in ('a.example.com', 'b.example.com', 'c.example.com')]
+        
+        async def test(collector):
+            await collector.scrape_competitor_urls(competitor(urls, retries=0))
+            return collector.circuit_breakers.get_summary()
+        
+        summary = asyncio.run(run_collector(server, test, circuit_failure_threshold=3))
+        
+        assert summary['firecrawl']['state'] == 'open'
+        assert all(summary[domain]['consecutive_failures'] == 0 for domain in ('a.example.com', 'b.example.com', 'c.example.com'))
+    
+    @pytest.mark.parametrize('status', [200, 404])
+    def test_page_failures_open_the_domain_circuit(self, fake_firecrawl, run_collector, status):
+        """Test that pages Firecrawl could not scrape count against their site only."""
+        server = fake_firecrawl(RecordingServer)
+        server.missing = ('broken.example.com',)
+        server.missing_status = status
+        broken = [f"https://broken.example.com/new/{i}" for i in range(10)]
+        healthy = [f"https://example.com/new/{i}" for i in range(5)]
+        
+        async def test(collector):
+            results = await collector.scrape_competitor_urls(competitor(broken + healthy))
+            return collector, results
+        
+        collector, results = asyncio.run(run_collector(server, test, circuit_failure_threshold=3))
+        
+        assert len(server.scraped) == 3 + len(healthy)
+        assert collector.circuit_breakers.get('broken.example.com').state == 'open'
+        assert collector.circuit_breakers.get('firecrawl').state == 'closed'
+        assert [result['status'] for result in results[len(broken):]] == ['success'] * len(healthy)
+
+
+class FormatsServer(FakeFirecrawlServer):
+    """Fake Firecrawl server that records the formats each scrape requests."""
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize the format log."""
+        super().__init__(*args, **kwargs)
+        self.requested = []
+    
+    async def handle_scrape(self, request):
+        """Record the requested formats, then scrape."""
+        self.requested.append((await request.json()).get('formats'))
+        return await super().handle_scrape(request)
+
+
+class TestHtmlOnDemand:
+    """Test cases for markdown-only scrapes with HTML fetched on demand."""
+    
+    URL = "https://example.com/new/"
+    
+    def test_html_fetched_on_second_request(self, fake_firecrawl, run_collector):
+        """Test that the first scrape asks for markdown only and fetch_html makes a separate HTML request."""
+        server = fake_firecrawl(FormatsServer)
+        
+        async def test(collector):
+            collector.cache = ScrapeCache(Path("scrape_cache"))
+            results = await collector.scrape_competitor_urls(competitor([self.URL]))
+            requested = list(server.requested)
+            html = await collector.fetch_html(self.URL)
+            return results[0], requested, html
+        
+        page, first_requests, html = asyncio.run(run_collector(server, test))
+        
+        assert first_requests == [['markdown']]
+        assert page['markdown'] and not page['html']
+        assert server.requested == [['markdown'], ['html']]
+        assert html.lstrip().startswith('<')
+
+
+class StallingServer(FakeFirecrawlServer):
+    """Fake Firecrawl server whose first scrape stalls."""
+    
+    # Seconds the first scrape takes
+    stall = 1.0
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize the request count."""
+        super().__init__(*args, **kwargs)
+        self.received = 0
+    
+    async def handle_scrape(self, request):
+        """Stall the first scrape, then answer every scrape normally."""
+        self.received += 1
+        if self.received == 1:
+            await asyncio.sleep(self.stall)
+        return await super().handle_scrape(request)
+
+
+class CountingServer(FakeFirecrawlServer):
+    """Fake Firecrawl server that holds each scrape and records peak in-flight scrapes and client connections."""
+    
+    # Seconds each scrape is held open
+    hold = 0.05
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize counters."""
+        super().__init__(*args, **kwargs)
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.peers = set()
+    
+    async def handle_scrape(self, request):
+        """Count the scrape while it is being answered."""
+        self.in_flight += 1
+        self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+        self.peers.add(request.transport.get_extra_info('peername'))
+        try:
+            await asyncio.sleep(self.hold)
+            return await super().handle_scrape(request)
+        finally:
+            self.in_flight -= 1
+
+
+class TestScrapeCompetitor:
+    """Test cases for scraping a competitor's configured URLs."""
+    
+    # One domain per URL so per-domain pacing does not serialize the fan-out
+    NEW_URLS = [f"https://shop{i}.example.com/new/" for i in range(6)]
+    PROMO_URLS = [f"https://deals{i}.example.com/sale/" for i in range(2)]
+    
+    def test_results_in_input_order(self, fake_firecrawl, run_collector):
+        """Test that URLs are scraped concurrently and results keep input order and tags."""
+        server = fake_firecrawl(CountingServer)
+        
+        async def test(collector):
+            return await collector.scrape_competitor_urls(competitor(self.NEW_URLS, self.PROMO_URLS))
+        
+        results = asyncio.run(run_collector(server, test))
+        
+        assert [result['url'] for result in results] == self.NEW_URLS + self.PROMO_URLS
+        assert [result['url_type'] for result in results] == ['new'] * 6 + ['promo'] * 2
+        assert all(result['competitor'] == "Acme" for result in results)
+        assert all(result['status'] == 'success' for result in results)
+        assert server.peak_in_flight > 1
+    
+    def test_session_is_pooled(self, fake_firecrawl, run_collector):
+        """Test that scrapes reuse one session and its kept-alive connections."""
+        server = fake_firecrawl(CountingServer)
+        
+        async def test(collector):
+            session = await collector._get_session()
+            await collector.scrape_competitor_urls(competitor(self.NEW_URLS, self.PROMO_URLS))
+            return session is await collector._get_session()
+        
+        assert asyncio.run(run_collector(server, test, concurrent_requests=2, adaptive_concurrency=False))
+        assert len(server.peers) <= 2
+    
+    def test_pages_are_handed_over_as_they_finish(self, fake_firecrawl, run_collector):
+        """Test that on_page sees each page when it is scraped, not when the whole competitor is."""
+        server = fake_firecrawl(StallingServer)
+        server.stall = 0.5
+        urls = ["https://example.com/new/slow", "https://example.com/new/fast"]
+        handed_over = []
+        
+        async def test(collector):
+            return await collector.scrape_competitor_urls(
+                competitor(urls), on_page=lambda page: handed_over.append(page['url'])
+            )
+        
+        results = asyncio.run(run_collector(server, test))
+        
+        assert handed_over == urls[::-1]
+        assert [result['url'] for result in results] == urls
+
+
+class TestHedging:
+    """Test cases for hedged scrapes."""
+    
+    URL = "https://example.com/new/"
+    
+    def scrape(self, run_collector, server, delay, concurrency=None):
+        """Scrape one URL with hedging after 0.5s and the given domain delay."""
+        async def test(collector):
+            collector.latency.min_samples = 1
+            if concurrency:
+                collector.concurrency.configure('firecrawl', initial_limit=concurrency, max_limit=concurrency)
+            results = await collector.scrape_competitor_urls(competitor([self.URL], delay=delay))
+            return collector, results[0]
+        
+        return asyncio.run(run_collector(server, test, hedge_requests=True, hedge_delay=0.5))
+    
+    def test_hedge_wins_and_loser_latency_is_recorded(self, fake_firecrawl, run_collector):
+        """Test that a hedge beats a stalled scrape and the cancelled scrape still counts."""
+        server = fake_firecrawl(StallingServer)
+        
+        collector, result = self.scrape(run_collector, server, delay=0.1)
+        
+        assert result['status'] == 'success'
+        assert server.received == 2
+        assert collector.hedge_budget.hedges_won == 1
+        assert collector.latency.percentile(100) >= 0.5
+        assert collector.latency.percentile(0) < 0.5
+    
+    def test_hedge_respects_domain_delay(self, fake_firecrawl, run_collector):
+        """Test that no hedge is sent before the domain's crawl delay allows another request."""
+        server = fake_firecrawl(StallingServer)
+        
+        collector, result = self.scrape(run_collector, server, delay=2.0)
+        
+        assert result['status'] == 'success'
+        assert server.received == 1
+        assert collector.hedge_budget.hedges == 0
+        assert collector.hedge_budget.hedges_skipped == 1
+    
+    def test_hedge_respects_concurrency_limit(self, fake_firecrawl, run_collector):
+        """Test that no hedge is sent while the Firecrawl concurrency limit is full."""
+        server = fake_firecrawl(StallingServer)
+        
+        collector, result = self.scrape(run_collector, server, delay=0.1, concurrency=1)
+        
+        assert result['status'] == 'success'
+        assert server.received == 1
+        assert collector.hedge_budget.hedges_skipped == 1
+        assert collector.concurrency.get('firecrawl').in_flight == 0
+
+
+class OversizedServer(FakeFirecrawlServer):
+    """Fake Firecrawl server streaming scrape bodies larger than the client's cap."""
+    
+    # Send a Content-Length header instead of a chunked body
+    announce_length = False
+    
+    # Body of CHUNKS chunks of CHUNK_SIZE bytes, paced by PAUSE seconds
+    CHUNK_SIZE = 64 * 1024
+    CHUNKS = 100
+    PAUSE = 0.01
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize the streaming progress."""
+        super().__init__(*args, **kwargs)
+        self.finished = False
+    
+    async def handle_scrape(self, request):
+        """Stream the oversized body slowly."""
+        response = web.StreamResponse(headers={'Content-Type': 'application/json'})
+        if self.announce_length:
+            response.content_length = self.CHUNK_SIZE * self.CHUNKS
+        await response.prepare(request)
+        
+        for _ in range(self.CHUNKS):
+            await response.write(b' ' * self.CHUNK_SIZE)
+            await asyncio.sleep(self.PAUSE)
+        self.finished = True
+        await response.write_eof()
+        return response
+
+
+class TestResponseSizeCap:
+    """Test cases for the scrape response size cap."""
+    
+    URL = "https://example.com/new/"
+    
+    def scrape(self, run_collector, server):
+        """Scrape one URL with a 0.1 MB cap and a scrape cache, timing the scrape."""
+        async def test(collector):
+            collector.cache = ScrapeCache(Path("scrape_cache"))
+            started_at = time.monotonic()
+            results = await collector.scrape_competitor_urls(competitor([self.URL]))
+            return collector, results[0], time.monotonic() - started_at
+        
+        return asyncio.run(run_collector(server, test, max_response_mb=0.1))
+    
+    def test_content_length_rejected_before_body(self, fake_firecrawl, run_collector):
+        """Test that an announced oversized body is rejected without reading it."""
+        server = fake_firecrawl(OversizedServer)
+        server.announce_length = True
+        
+        collector, result, elapsed = self.scrape(run_collector, server)
+        
+        assert result['error'].startswith("Content-Length")
+        assert elapsed < OversizedServer.PAUSE * OversizedServer.CHUNKS / 2
+        assert not server.finished
+    
+    def test_chunked_body_aborted_mid_stream(self, fake_firecrawl, run_collector):
+        """Test that a chunked body is abandoned once it passes the cap."""
+        server = fake_firecrawl(OversizedServer)
+        
+        collector, result, elapsed = self.scrape(run_collector, server)
+        
+        assert result['error'].startswith("Response exceeds")
+        assert elapsed < OversizedServer.PAUSE * OversizedServer.CHUNKS / 2
+        assert not server.finished
+    
+    def test_truncated_page_is_failed_and_not_cached(self, fake_firecrawl, run_collector):
+        """Test that an aborted page is counted, reported as failed and kept out of the cache."""
+        server = fake_firecrawl(OversizedServer)
+        
+        collector, result, _ = self.scrape(run_collector, server)
+        
+        assert result['status'] == 'failed'
+        assert result['truncated']
+        assert result['competitor'] == "Acme"
+        assert collector.truncated_pages == 1
+        assert collector.cache.get(self.URL) is None
+
+
+class TestDirectFetch:
+    """Test cases for the direct-fetch fast path and its Firecrawl fallback."""
+    
+    SITE = {
+        '/new/': "<html><head><title>New</title></head><body><ul>" + "".join(
+            f'<li><a href="/products/{i}">Harmony Sofa {i}</a> $1,{i}99</li>' for i in range(20)
+        ) + "</ul></body></html>",
+        '/app/': '<html><body><div id="root"></div></body></html>'
+    }
+    
+    def scrape(self, run_collector, server, **crawl):
+        """Scrape the site's listing and app shell with direct fetching and a scrape cache."""
+        async def test(collector):
+            collector.cache = ScrapeCache(Path("scrape_cache"))
+            origin = origin_of(collector)
+            config = competitor([f"{origin}/new/", f"{origin}/app/"], engine='direct', **crawl)
+            results = await collector.scrape_competitor_urls(config)
+            cached = collector.cache.get(results[0]['url'])
+            return collector, results, cached
+        
+        return asyncio.run(run_collector(server, test, site=self.SITE))
+    
+    def test_js_pages_fall_back_to_firecrawl(self, fake_firecrawl, run_collector):
+        """Test that server-rendered pages skip Firecrawl and app shells go through it."""
+        server = fake_firecrawl()
+        
+        collector, results, _ = self.scrape(run_collector, server)
+        
+        assert [result['status'] for result in results] == ['success', 'success']
+        assert results[0]['engine'] == 'direct'
+        assert "Harmony Sofa 3" in results[0]['markdown']
+        assert 'engine' not in results[1]
+        assert server.stats.counts['scrape_requests'] == 1
+        assert (collector.direct_pages, collector.direct_fallbacks) == (1, 1)
+    
+    def test_markdown_only_pages_cache_no_html(self, fake_firecrawl, run_collector):
+        """Test that direct fetches keep HTML only when the competitor requests it."""
+        _, results, cached = self.scrape(run_collector, fake_firecrawl())
+        _, html_results, html_cached = self.scrape(run_collector, fake_firecrawl(), formats=['markdown', 'html'])
+        
+        assert results[0]['html'] == '' and cached['html'] == ''
+        assert html_results[0]['html'].startswith("<html>")
+        assert html_cached['html'] == html_results[0]['html']
+
+
+class TestSitemapCrawl:
+    """Test cases for incremental sitemap crawls."""
+    
+    SITE = {
+        '/robots.txt': "User-agent: *\nDisallow: /private/\nSitemap: {origin}/sitemap.xml\n",
+        '/sitemap.xml': (
+            '<?xml version="1.0" encoding="UTF-8"?>'
+            '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">'
+            '<url><loc>{origin}/private/a</loc><lastmod>2024-06-01</lastmod></url>'
+            '<url><loc>{origin}/gone</loc><lastmod>2024-05-01</lastmod></url>'
+            '<url><loc>{origin}/new/</loc><lastmod>2024-04-01</lastmod></url>'
+            '<url><loc>{origin}/products/a</loc><lastmod>2024-03-01</lastmod></url>'
+            '<url><loc>{origin}/products/b</loc><lastmod>2024-02-01</lastmod></url>'
+            '</urlset>'
+        )
+    }
+    
+    def test_blocked_failing_and_seed_urls_do_not_fill_the_limit(self, fake_firecrawl, run_collector):
+        """Test that later runs reach modified URLs past blocked, failing and seed URLs."""
+        server = fake_firecrawl(RecordingServer)
+        server.missing = ('/gone',)
+        runs = []
+        
+        async def test(collector):
+            origin = origin_of(collector)
+            config = competitor([f"{origin}/new/"], [f"{origin}/sale/"], mode='sitemap', limit=2)
+            for _ in range(2):
+                server.scraped.clear()
+                await collector.scrape_competitor_urls(config)
+                runs.append(sorted(urlparse(url).path for url in server.scraped))
+        
+        asyncio.run(run_collector(server, test, site=self.SITE, respect_robots_txt=True))
+        
+        # The seed is scraped once though the sitemap lists it; /private/ is never scraped
+        assert runs[0] == ['/gone', '/new/', '/sale/']
+        assert runs[1] == ['/new/', '/products/a', '/products/b', '/sale/']
+
+
+class CrawlRecordingServer(FakeFirecrawlServer):
+    """Fake Firecrawl server that records crawl job submissions."""
+    
+    def __init__(self, *args, **kwargs):
+        """Initialize the submission log."""
+        super().__init__(*args, **kwargs)
+        self.submitted = []
+    
+    async def handle_crawl(self, request):
+        """Record the submitted payload, then start the job."""
+        self.submitted.append(await request.json())
+        return await super().handle_crawl(request)
+
+
+class TestCrawlJobs:
+    """Test cases for Firecrawl crawl-job mode."""
+    
+    def crawl(self, run_collector, server, config, poll_interval=0.01, job_timeout=None):
+        """Collect every page a competitor's crawl jobs yield."""
+        async def test(collector):
+            collector.CRAWL_POLL_INTERVAL = poll_interval
+            if job_timeout is not None:
+                collector.CRAWL_JOB_TIMEOUT = job_timeout
+            return await collector.scrape_competitor_urls(config)
+        
+        return asyncio.run(run_collector(server, test))
+    
+    def test_submits_settings_and_tags_pages(self, fake_firecrawl, run_collector):
+        """Test that jobs carry depth, limit and excludes and pages are tagged."""
+        server = fake_firecrawl(CrawlRecordingServer, crawl_page_interval=0.0)
+        config = competitor(
+            ["https://example.com/new"], ["https://example.com/sale"],
+            mode='crawl', depth=3, limit=4, formats=['markdown', 'html']
+        )
+        config['exclude_patterns'] = ['/page-2/']
+        
+        pages = self.crawl(run_collector, server, config)
+        
+        options = [payload['crawlerOptions'] for payload in server.submitted]
+        assert options == [{'maxDepth': 3, 'limit': 4, 'excludes': ['/page-2/']}] * 2
+        assert all(payload['pageOptions']['includeHtml'] for payload in server.submitted)
+        
+        urls = {page['url'] for page in pages}
+        assert urls == {
+            f"https://example.com/{path}/{suffix}"
+            for path in ('new', 'sale') for suffix in ('', 'page-1/', 'page-3/')
+        }
+        assert all(page['competitor'] == "Acme" and page['status'] == 'success' for page in pages)
+        assert {page['url_type'] for page in pages if '/sale/' in page['url']} == {'promo'}
+        assert all(page['html'] for page in pages)
+    
+    def test_competitor_is_configured_once(self, fake_firecrawl, run_collector):
+        """Test that crawl mode reuses the settings scrape_competitor_urls configured."""
+        server = fake_firecrawl(crawl_page_interval=0.0)
+        config = competitor(["https://example.com/new"], mode='crawl', limit=2)
+        configured = []
+        
+        async def test(collector):
+            collector.CRAWL_POLL_INTERVAL = 0.01
+            configure = collector.configure_competitor
+            
+            def record(competitor_config):
+                configured.append(competitor_config['name'])
+                return configure(competitor_config)
+            
+            collector.configure_competitor = record
+            return await collector.scrape_competitor_urls(config)
+        
+        pages = asyncio.run(run_collector(server, test))
+        
+        assert len(pages) == 2
+        assert len(configured) == 1
+    
+    def test_robots_disallowed_paths_never_reach_crawl(self, fake_firecrawl, run_collector):
+        """Test that robots.txt-disallowed seeds and paths are excluded before jobs are submitted."""
+        server = fake_firecrawl(CrawlRecordingServer, crawl_page_interval=0.0)
+        site = {'/robots.txt': "User-agent: *\nDisallow: /new/page-2/\nDisallow: /sale\n"}
+        
+        async def test(collector):
+            collector.CRAWL_POLL_INTERVAL = 0.01
+            origin = origin_of(collector)
+            config = competitor([f"{origin}/new"], [f"{origin}/sale"], mode='crawl', limit=4)
+            return await collector.scrape_competitor_urls(config)
+        
+        pages = asyncio.run(run_collector(server, test, site=site, respect_robots_txt=True))
+        
+        assert [payload['crawlerOptions']['excludes'] for payload in server.submitted] == [['/new/page-2/', '/sale']]
+        crawled = [url for job in server.jobs.values() for url in job['urls']]
+        assert len(crawled) == 3
+        assert not any('/page-2/' in url or '/sale' in url for url in crawled)
+        assert len(pages) == 3
+    
+    def test_partial_results_are_paged_until_limit(self, fake_firecrawl, run_collector):
+        """Test that pages reported while the job runs are yielded once, up to the limit."""
+        server = fake_firecrawl(crawl_page_interval=0.02)
+        config = competitor(["https://example.com/new"], mode='crawl', limit=5)
+        
+        pages = self.crawl(run_collector, server, config)
+        
+        assert [page['url'] for page in pages] == (
+            ["https://example.com/new/"] + [f"https://example.com/new/page-{i}/" for i in range(1, 5)]
+        )
+        assert server.stats.counts['crawl_status_requests'] > 1
+    
+    def test_overlapping_seeds_are_deduplicated(self, fake_firecrawl, run_collector):
+        """Test that pages found by two seed crawls are yielded once."""
+        server = fake_firecrawl(crawl_page_interval=0.0)
+        config = competitor(["https://example.com/new", "https://example.com/new/"], mode='crawl', limit=3)
+        
+        pages = self.crawl(run_collector, server, config)
+        
+        assert len(pages) == 3
+        assert server.stats.counts['crawl_requests'] == 2
+    
+    def test_job_timeout_keeps_partial_pages(self, fake_firecrawl, run_collector):
+        """Test that a job running past the timeout stops with the pages found so far."""
+        server = fake_firecrawl(crawl_page_interval=0.05)
+        config = competitor(["https://example.com/new"], mode='crawl', limit=50)
+        
+        pages = self.crawl(run_collector, server, config, job_timeout=0.12)
+        
+        assert 0 < len(pages) < 50
+
+
+class PaginatedServer(FakeFirecrawlServer):
+    """Fake Firecrawl server serving a listing split over numbered or cursor pages."""
+    
+    # The listing's page count and link style
+    total_pages = 3
+    numbered = True
+    
+    def get_page(self, url):
+        """Build one page of the listing with its pagination links."""
+        query = parse_qs(urlparse(url).query)
+        number = int((query.get('page') or query.get('after') or ['1'])[0])
+        markdown = f"# New Arrivals\n\n## [Sofa {number}](https://example.com/p/{number}) - $899\n\n"
+        if self.numbered:
+            markdown += " ".join(f"[{n}](/shop/new/?page={n})" for n in range(1, min(number + 2, self.total_pages) + 1))
+        elif number < self.total_pages:
+            markdown += f"[Next](/shop/new/?after={number + 1})"
+        return {'title': "New Arrivals", 'markdown': markdown, 'html': ''}
+
+
+class TestPagination:
+    """Test cases for following listing pagination."""
+    
+    LISTING = "https://example.com/shop/new/"
+    
+    def scrape(self, run_collector, server, max_pages):
+        """Scrape the listing with pagination up to max_pages."""
+        async def test(collector):
+            return await collector.scrape_competitor_urls(competitor([self.LISTING], max_pages=max_pages))
+        
+        return asyncio.run(run_collector(server, test))[0]
+    
+    def test_merges_pages_in_order_with_merged_hash(self, fake_firecrawl, run_collector):
+        """Test that every page is merged in order and the hash covers the merged content."""
+        server = fake_firecrawl(PaginatedServer)
+        
+        page = self.scrape(run_collector, server, max_pages=10)
+        
+        assert page['pages'] == 3
+        assert [f"Sofa {n}" in page['markdown'] for n in (1, 2, 3)] == [True] * 3
+        assert page['markdown'].index("Sofa 1") < page['markdown'].index("Sofa 2") < page['markdown'].index("Sofa 3")
+        assert page['content_hash'] == ScrapeCache.content_hash(page)
+        assert page['content_hash'] != ScrapeCache.content_hash(server.get_page(self.LISTING))
+    
+    def test_numbered_pages_stop_at_cap(self, fake_firecrawl, run_collector):
+        """Test that no more than max_pages numbered pages are fetched."""
+        server = fake_firecrawl(PaginatedServer)
+        server.total_pages = 10
+        
+        page = self.scrape(run_collector, server, max_pages=4)
+        
+        assert page['pages'] == 4
+        assert server.stats.counts['scrape_requests'] == 4
+    
+    def test_next_links_stop_at_cap(self, fake_firecrawl, run_collector):
+        """Test that next links are followed one page at a time up to max_pages."""
+        server = fake_firecrawl(PaginatedServer)
+        server.total_pages = 10
+        server.numbered = False
+        
+        page = self.scrape(run_collector, server, max_pages=3)
+        
+        assert page['page_urls'] == [
+            self.LISTING,
+            "https://example.com/shop/new/?after=2",
+            "https://example.com/shop/new/?after=3"
+        ]
+        assert server.stats.counts['scrape_requests'] == 3
@@ -0,0 +1,131 @@
+"""
+Unit tests for the breadth-first crawl frontier and Bloom filter.
+"""
+
+import pytest
+
+from src.collectors.frontier import CrawlFrontier, extract_links
+from src.utils.bloom_filter import BloomFilter
+
+
+class TestBloomFilter:
+    """Test cases for BloomFilter."""
+    
+    def test_membership(self):
+        """Test that added items are always found."""
+        bloom = BloomFilter(capacity=1000)
+        items = [f"https://example.com/p/{i}" for i in range(1000)]
+        for item in items:
+            bloom.add(item)
+        
+        assert all(item in bloom for item in items)
+    
+    def test_false_positive_rate(self):
+        """Test that the false-positive rate stays near the target."""
+        bloom = BloomFilter(capacity=5000, error_rate=0.01)
+        for i in range(5000):
+            bloom.add(f"https://example.com/p/{i}")
+        
+        false_positives = sum(f"https://example.com/q/{i}" in bloom for i in range(5000))
+        assert false_positives / 5000 < 0.03
+    
+    def test_invalid_arguments(self):
+        """Test that invalid sizing is rejected."""
+        with pytest.raises(ValueError):
+            BloomFilter(capacity=0)
+        with pytest.raises(ValueError):
+            BloomFilter(error_rate=1.5)
+
+
+class TestExtractLinks:
+    """Test cases for extract_links."""
+    
+    def test_markdown_and_html_links(self):
+        """Test that relative links are resolved and fragments dropped."""
+        content = '[Sofa](/products/sofa#reviews) <a href="https://example.com/sale/">Sale</a>'
+        links = extract_links(content, "https://example.com/new/")
+        
+        assert links == ["https://example.com/products/sofa", "https://example.com/sale/"]
+    
+    def test_skips_files_and_other_schemes(self):
+        """Test that images and mailto links are ignored."""
+        content = "![Chair](/images/chair.jpg) [Mail](mailto:shop@example.com)"
+        
+        assert extract_links(content, "https://example.com/") == []
+
+
+class TestCrawlFrontier:
+    """Test cases for CrawlFrontier."""
+    
+    def make_frontier(self, **kwargs):
+        """Build a frontier for example.com."""
+        options = {"max_depth": 2, "limit": 10, "allowed_domains": ["example.com"]}
+        options.update(kwargs)
+        return CrawlFrontier(**options)
+    
+    def test_deduplicates_normalized_urls(self):
+        """Test that equivalent URLs are scheduled once."""
+        frontier = self.make_frontier()
+        
+        assert frontier.add("https://example.com/new/", 1, "new")
+        assert not frontier.add("https://example.com:443/new", 1, "new")
+        assert len(frontier) == 1
+    
+    def test_fingerprints_checked_only_on_bloom_hits(self):
+        """Test that new URLs skip the fingerprint lookup and repeats go through it."""
+        frontier = self.make_frontier(limit=100)
+        lookups = []
+        
+        class RecordingSet(set):
+            def __contains__(self, item):
+                lookups.append(item)
+                return super().__contains__(item)
+        
+        frontier._fingerprints = RecordingSet()
+        urls = [f"https://example.com/p/{i}" for i in range(50)]
+        
+        assert all(frontier.add(url, 1, "new") for url in urls)
+        assert lookups == []
+        
+        assert not any(frontier.add(url, 1, "new") for url in urls)
+        assert len(lookups) == 50
+    
+    def test_bloom_false_positives_are_resolved(self):
+        """Test that distinct URLs are kept when the Bloom filter is saturated."""
+        frontier = self.make_frontier(limit=100, expected_urls=1)
+        urls = [f"https://example.com/p/{i}" for i in range(50)]
+        
+        assert all(frontier.add(url, 1, "new") for url in urls)
+        assert not frontier.add(urls[0], 1, "new")
+    
+    def test_scope_and_exclusions(self):
+        """Test that off-site and excluded URLs are not scheduled."""
+        frontier = self.make_frontier(is_excluded=lambda url: "/account" in url)
+        
+        assert not frontier.add("https://other.com/new/", 1, "new")
+        assert not frontier.add("https://example.com/account/login", 1, "new")
+    
+    def test_breadth_first_levels(self):
+        """Test that levels are returned in depth order up to max depth."""
+        frontier = self.make_frontier()
+        frontier.add("https://example.com/new/", 1, "new")
+        
+        level = frontier.pop_level()
+        assert level == [("https://example.com/new/", 1, "new")]
+        
+        frontier.add_links("[A](/a) [B](/b)", "https://example.com/new/", 1, "new")
+        assert [url for url, _, _ in frontier.pop_level()] == [
+            "https://example.com/a",
+            "https://example.com/b"
+        ]
+        
+        assert frontier.add_links("[C](/c)", "https://example.com/a", 2, "new") == 0
+    
+    def test_limit(self):
+        """Test that no more than limit URLs are scheduled."""
+        frontier = self.make_frontier(limit=3)
+        content = " ".join(f"[P](/p/{i})" for i in range(50))
+        frontier.add("https://example.com/", 1, "new")
+        frontier.add_links(content, "https://example.com/", 1, "new")
+        
+        assert frontier.scheduled == 3
@@ -0,0 +1,126 @@
+"""
+Unit tests for request hedging.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.hedging import HedgeBudget, HedgeUnavailableError, LatencyTracker, run_hedged
+
+
+def make_request(delay, result=None, error=None):
+    """Build a request factory that finishes after a delay."""
+    async def request():
+        await asyncio.sleep(delay)
+        if error:
+            raise error
+        return result
+    return request
+
+
+class TestLatencyTracker:
+    """Test cases for LatencyTracker."""
+    
+    def test_needs_min_samples(self):
+        """Test that no percentile is reported before enough samples."""
+        tracker = LatencyTracker(min_samples=3)
+        tracker.record(1.0)
+        
+        assert tracker.percentile(95) is None
+    
+    def test_percentile(self):
+        """Test nearest-rank percentiles over the window."""
+        tracker = LatencyTracker(min_samples=1)
+        for seconds in range(1, 101):
+            tracker.record(float(seconds))
+        
+        assert tracker.percentile(50) == 50.0
+        assert tracker.percentile(95) == 95.0
+    
+    def test_window_drops_old_samples(self):
+        """Test that only recent latencies count."""
+        tracker = LatencyTracker(window=2, min_samples=1)
+        for seconds in (100.0, 1.0, 2.0):
+            tracker.record(seconds)
+        
+        assert tracker.percentile(100) == 2.0
+
+
+class TestHedgeBudget:
+    """Test cases for HedgeBudget."""
+    
+    def test_budget_limits_hedges(self):
+        """Test that hedges are capped by the ratio of requests."""
+        budget = HedgeBudget(ratio=0.1)
+        assert budget.try_acquire()
+        assert not budget.try_acquire()
+        
+        for _ in range(10):
+            budget.record_request()
+        assert budget.try_acquire()
+
+
+class TestRunHedged:
+    """Test cases for run_hedged."""
+    
+    def test_fast_primary_is_not_hedged(self):
+        """Test that a request finishing before the delay sends no hedge."""
+        budget = HedgeBudget()
+        result = asyncio.run(run_hedged(
+            make_request(0.01, "primary"), make_request(0.01, "hedge"), 0.2, budget
+        ))
+        
+        assert result == "primary"
+        assert budget.hedges == 0
+    
+    def test_hedge_wins_over_slow_primary(self):
+        """Test that a faster hedge result is used."""
+        budget = HedgeBudget()
+        result = asyncio.run(run_hedged(
+            make_request(1.0, "primary"), make_request(0.01, "hedge"), 0.05, budget
+        ))
+        
+        assert result == "hedge"
+        assert budget.hedges_won == 1
+    
+    def test_failed_hedge_falls_back_to_primary(self):
+        """Test that a failing hedge does not fail the request."""
+        result = asyncio.run(run_hedged(
+            make_request(0.2, "primary"), make_request(0.01, error=ValueError("boom")), 0.05, HedgeBudget()
+        ))
+        
+        assert result == "primary"
+    
+    def test_both_failing_raises_primary_error(self):
+        """Test that the primary error surfaces when both requests fail."""
+        with pytest.raises(KeyError):
+            asyncio.run(run_hedged(
+                make_request(0.1, error=KeyError("primary")),
+                make_request(0.01, error=ValueError("hedge")),
+                0.05,
+                HedgeBudget()
+            ))
+    
+    def test_no_budget_waits_for_primary(self):
+        """Test that an exhausted budget skips the hedge."""
+        budget = HedgeBudget(ratio=0.0)
+        budget.tokens = 0.0
+        result = asyncio.run(run_hedged(
+            make_request(0.1, "primary"), make_request(0.01, "hedge"), 0.01, budget
+        ))
+        
+        assert result == "primary"
+        assert budget.hedges == 0
+    
+    def test_unavailable_hedge_is_refunded(self):
+        """Test that a hedge that could not be sent gives its budget back."""
+        budget = HedgeBudget(ratio=0.0)
+        result = asyncio.run(run_hedged(
+            make_request(0.1, "primary"), make_request(0.0, error=HedgeUnavailableError()), 0.01, budget
+        ))
+        
+        assert result == "primary"
+        assert budget.hedges == 0
+        assert budget.hedges_skipped == 1
+        assert budget.tokens == 1.0
@@ -297,6 +297,48 @@ class TestCrawlSettings:
         # Test limit too high
         with pytest.raises(ValidationError):
             CrawlSettings(limit=5000)
+        
+        # Test backoff too small
+        with pytest.raises(ValidationError):
+            CrawlSettings(backoff_base=0.0)
+        
+        # Test pagination disabled below one page
+        with pytest.raises(ValidationError):
+            CrawlSettings(max_pages=0)
+    
+    def test_mode_validation(self):
+        """Test collection mode validation."""
+        assert CrawlSettings().mode == "scrape"
+        assert CrawlSettings(mode="CRAWL").mode == "crawl"
+        assert CrawlSettings(mode="frontier").mode == "frontier"
+        assert CrawlSettings(mode="sitemap").mode == "sitemap"
+        
+        with pytest.raises(ValidationError):
+            CrawlSettings(mode="spider")
+    
+    def test_engine_validation(self):
+        """Test fetch engine validation."""
+        assert CrawlSettings().engine == "firecrawl"
+        assert CrawlSettings(engine="Direct").engine == "direct"
+        
+        with pytest.raises(ValidationError):
+            CrawlSettings(engine="curl")
+    
+    def test_formats_validation(self):
+        """Test page format selection."""
+        assert CrawlSettings().formats == ["markdown"]
+        assert CrawlSettings(formats=["Markdown", "html", "markdown"]).formats == ["markdown", "html"]
+        
+        with pytest.raises(ValidationError):
+            CrawlSettings(formats=["pdf"])
+    
+    def test_retry_defaults(self):
+        """Test default retry settings."""
+        settings = CrawlSettings()
+        
+        assert settings.retries == 3
+        assert settings.backoff_base == 1.0
+        assert settings.backoff_max == 30.0
 
 
 class TestCompetitorConfig:
@@ -317,6 +359,9 @@ class TestCompetitorConfig:
         
         assert len(config.competitors) == 1
         assert config.global_settings.concurrent_requests == 5
+        assert config.global_settings.max_response_mb == 10.0
+        assert config.global_settings.circuit_failure_threshold == 5
+        assert config.global_settings.hedge_requests is False
     
     def test_get_enabled_competitors(self):
         """Test getting enabled competitors."""
@@ -0,0 +1,69 @@
+"""
+Unit tests for listing pagination detection.
+"""
+
+from src.collectors.pagination import find_next_page, find_numbered_pages, get_page_number, page_url
+
+
+BASE_URL = "https://example.com/shop/new/"
+
+
+class TestPageNumbers:
+    """Test cases for page number parsing and building."""
+    
+    def test_query_parameter(self):
+        """Test that ?page=N is recognized and rewritten."""
+        url = "https://example.com/shop/new/?sort=new&page=2"
+        
+        assert get_page_number(url) == ("page", 2)
+        assert page_url(url, 5) == "https://example.com/shop/new/?sort=new&page=5"
+    
+    def test_path_segment(self):
+        """Test that /page/N is recognized and rewritten."""
+        url = "https://example.com/shop/new/page/2/"
+        
+        assert get_page_number(url) == ("path", 2)
+        assert page_url(url, 7) == "https://example.com/shop/new/page/7/"
+    
+    def test_no_page_number(self):
+        """Test that ordinary URLs have no page number."""
+        assert get_page_number(BASE_URL) is None
+
+
+class TestFindNumberedPages:
+    """Test cases for find_numbered_pages."""
+    
+    def test_same_listing_only(self):
+        """Test that page links of other listings are ignored."""
+        content = (
+            "[2](/shop/new/?page=2) [3](/shop/new/?page=3) [12](/shop/new/?page=12) "
+            "[Sale page 2](/shop/sale/?page=2)"
+        )
+        pages = find_numbered_pages(content, BASE_URL)
+        
+        assert sorted(pages) == [2, 3, 12]
+
+
+class TestFindNextPage:
+    """Test cases for find_next_page."""
+    
+    def test_rel_next(self):
+        """Test that rel="next" links are followed."""
+        content = '<link rel="next" href="/shop/new/?cursor=abc">'
+        
+        assert find_next_page(content, BASE_URL) == "https://example.com/shop/new/?cursor=abc"
+    
+    def test_markdown_next_text(self):
+        """Test that "Next" and "Load more" links are found."""
+        assert find_next_page("[Next](/shop/new/?after=20)", BASE_URL) == "https://example.com/shop/new/?after=20"
+        assert find_next_page("[Load More](/api/items?offset=24)", BASE_URL) == "https://example.com/api/items?offset=24"
+    
+    def test_load_more_attribute(self):
+        """Test that load-more endpoints in data attributes are found."""
+        content = '<button data-load-more-url="/shop/new/items?offset=48">More</button>'
+        
+        assert find_next_page(content, BASE_URL) == "https://example.com/shop/new/items?offset=48"
+    
+    def test_no_pagination(self):
+        """Test that pages without pagination return None."""
+        assert find_next_page("[Sofa](/products/sofa)", BASE_URL) is None
@@ -0,0 +1,88 @@
+"""
+Unit tests for the keyed token-bucket rate limiter.
+"""
+
+import asyncio
+import time
+
+import pytest
+
+from src.utils.rate_limiter import RateLimiter, TokenBucket
+
+
+class TestTokenBucket:
+    """Test cases for TokenBucket."""
+    
+    def test_burst_is_immediate(self):
+        """Test that requests within the burst size do not wait."""
+        async def run():
+            bucket = TokenBucket(rate=1.0, capacity=3)
+            return [await bucket.acquire() for _ in range(3)]
+        
+        assert asyncio.run(run()) == [0.0, 0.0, 0.0]
+    
+    def test_waits_when_empty(self):
+        """Test that an empty bucket makes callers wait for a refill."""
+        async def run():
+            bucket = TokenBucket(rate=20.0, capacity=1)
+            await bucket.acquire()
+            return await bucket.acquire()
+        
+        waited = asyncio.run(run())
+        assert waited == pytest.approx(0.05, abs=0.02)
+    
+    def test_invalid_rate(self):
+        """Test that a non-positive rate is rejected."""
+        with pytest.raises(ValueError):
+            TokenBucket(rate=0)
+
+
+class TestRateLimiter:
+    """Test cases for RateLimiter."""
+    
+    def test_keys_are_independent(self):
+        """Test that different domains do not share a budget."""
+        async def run():
+            limiter = RateLimiter()
+            limiter.configure("a.example.com", min_interval=0.2)
+            limiter.configure("b.example.com", min_interval=0.2)
+            
+            start = time.monotonic()
+            await asyncio.gather(
+                limiter.acquire("a.example.com"),
+                limiter.acquire("b.example.com")
+            )
+            return time.monotonic() - start
+        
+        assert asyncio.run(run()) < 0.1
+    
+    def test_same_key_is_paced(self):
+        """Test that requests to one domain respect its delay."""
+        async def run():
+            limiter = RateLimiter()
+            limiter.configure("a.example.com", min_interval=0.1)
+            
+            start = time.monotonic()
+            await asyncio.gather(*[limiter.acquire("a.example.com") for _ in range(3)])
+            return time.monotonic() - start
+        
+        assert asyncio.run(run()) == pytest.approx(0.2, abs=0.05)
+    
+    def test_try_acquire_takes_all_or_nothing(self):
+        """Test that try_acquire takes a token from every key only when all have one."""
+        limiter = RateLimiter()
+        limiter.configure("a.example.com", min_interval=10)
+        limiter.configure("firecrawl", rate_per_minute=6000, burst=5)
+        
+        assert limiter.try_acquire("a.example.com", "firecrawl")
+        assert not limiter.try_acquire("a.example.com", "firecrawl")
+        assert limiter._get_bucket("firecrawl").tokens == pytest.approx(4, abs=0.1)
+    
+    def test_none_key_is_unlimited(self):
+        """Test that a missing key skips limiting."""
+        assert asyncio.run(RateLimiter().acquire(None)) == 0.0
+    
+    def test_configure_requires_budget(self):
+        """Test that configure needs a rate or an interval."""
+        with pytest.raises(ValueError):
+            RateLimiter().configure("a.example.com")
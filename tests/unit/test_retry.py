@@ -0,0 +1,85 @@
+"""
+Unit tests for the retry policy.
+"""
+
+import asyncio
+
+import pytest
+
+from src.utils.retry import RetryPolicy, RetryableError, is_retryable_status, parse_retry_after
+
+
+class TestRetryPolicy:
+    """Test cases for RetryPolicy."""
+    
+    def test_retries_transient_failures(self):
+        """Test that transient errors are retried until success."""
+        calls = []
+        
+        async def flaky():
+            calls.append(1)
+            if len(calls) < 3:
+                raise RetryableError("HTTP 503", status=503)
+            return "ok"
+        
+        policy = RetryPolicy(max_retries=3, base_delay=0.001)
+        assert asyncio.run(policy.run(flaky)) == "ok"
+        assert len(calls) == 3
+    
+    def test_gives_up_after_max_retries(self):
+        """Test that the last error is raised once retries are exhausted."""
+        calls = []
+        
+        async def always_fails():
+            calls.append(1)
+            raise RetryableError("HTTP 429", status=429)
+        
+        policy = RetryPolicy(max_retries=2, base_delay=0.001)
+        with pytest.raises(RetryableError):
+            asyncio.run(policy.run(always_fails))
+        assert len(calls) == 3
+    
+    def test_non_transient_errors_are_not_retried(self):
+        """Test that unexpected errors propagate immediately."""
+        calls = []
+        
+        async def broken():
+            calls.append(1)
+            raise KeyError("bad payload")
+        
+        with pytest.raises(KeyError):
+            asyncio.run(RetryPolicy(base_delay=0.001).run(broken))
+        assert len(calls) == 1
+    
+    def test_backoff_is_capped(self):
+        """Test exponential backoff without jitter respects max_delay."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=False)
+        
+        assert policy.get_delay(0) == 1.0
+        assert policy.get_delay(2) == 4.0
+        assert policy.get_delay(10) == 5.0
+    
+    def test_retry_after_takes_precedence(self):
+        """Test that a server-requested delay overrides backoff."""
+        policy = RetryPolicy(base_delay=1.0, max_retry_after=60.0)
+        
+        assert policy.get_delay(0, retry_after=12.0) == 12.0
+        assert policy.get_delay(0, retry_after=600.0) == 60.0
+
+
+class TestRetryHelpers:
+    """Test cases for retry helper functions."""
+    
+    def test_retryable_statuses(self):
+        """Test transient status classification."""
+        assert is_retryable_status(429)
+        assert is_retryable_status(503)
+        assert not is_retryable_status(404)
+        assert not is_retryable_status(200)
+    
+    def test_parse_retry_after(self):
+        """Test Retry-After parsing for seconds, dates and bad values."""
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
@@ -0,0 +1,100 @@
+"""
+Unit tests for robots.txt parsing and caching.
+"""
+
+import json
+
+from src.utils.robots import RobotsCache, RobotsRules
+
+
+ROBOTS_TXT = """
+# Example robots.txt
+User-agent: *
+Disallow: /checkout
+Disallow: /*.pdf$
+Allow: /checkout/help
+Crawl-delay: 5
+
+User-agent: BadBot
+User-agent: OtherBot
+Disallow: /
+
+Sitemap: https://example.com/sitemap_index.xml
+"""
+
+
+class TestRobotsRules:
+    """Test cases for RobotsRules."""
+    
+    def test_disallow_prefix(self):
+        """Test that disallowed path prefixes are blocked."""
+        rules = RobotsRules.parse(ROBOTS_TXT, "Mozilla/5.0")
+        
+        assert not rules.can_fetch("https://example.com/checkout/cart")
+        assert rules.can_fetch("https://example.com/collections/new")
+    
+    def test_longest_allow_wins(self):
+        """Test that a more specific allow overrides a disallow."""
+        rules = RobotsRules.parse(ROBOTS_TXT, "Mozilla/5.0")
+        
+        assert rules.can_fetch("https://example.com/checkout/help/returns")
+    
+    def test_wildcard_and_anchor(self):
+        """Test that '*' and '$' patterns match as in the robots.txt spec."""
+        rules = RobotsRules.parse(ROBOTS_TXT, "Mozilla/5.0")
+        
+        assert not rules.can_fetch("https://example.com/files/lookbook.pdf")
+        assert rules.can_fetch("https://example.com/files/lookbook.pdf?download=1")
+    
+    def test_disallowed_prefixes(self):
+        """Test that only literal prefixes with no allowed pages under them are listed."""
+        rules = RobotsRules.parse(
+            "User-agent: *\nDisallow: /checkout\nAllow: /checkout/help\nDisallow: /*.pdf$\n"
+            "Disallow: /account/\nDisallow: /search$\nDisallow: /cart\nDisallow: /account/",
+            "Mozilla/5.0"
+        )
+        
+        assert rules.get_disallowed_prefixes() == ["/account/", "/cart"]
+    
+    def test_crawl_delay(self):
+        """Test that the group's crawl-delay is parsed."""
+        assert RobotsRules.parse(ROBOTS_TXT, "Mozilla/5.0").crawl_delay == 5.0
+    
+    def test_specific_group_overrides_wildcard(self):
+        """Test that a group naming the user agent replaces the '*' group."""
+        rules = RobotsRules.parse(ROBOTS_TXT, "OtherBot/2.1")
+        
+        assert not rules.can_fetch("https://example.com/collections/new")
+        assert rules.crawl_delay is None
+    
+    def test_sitemaps(self):
+        """Test that sitemap lines are collected for every user agent."""
+        assert RobotsRules.parse(ROBOTS_TXT, "OtherBot").sitemaps == ["https://example.com/sitemap_index.xml"]
+    
+    def test_empty_allows_everything(self):
+        """Test that a missing robots.txt places no restrictions."""
+        assert RobotsRules.parse("", "Mozilla/5.0").can_fetch("https://example.com/checkout")
+
+
+class TestRobotsCache:
+    """Test cases for RobotsCache."""
+    
+    def test_round_trip(self, tmp_path):
+        """Test that a stored body is returned while fresh."""
+        cache = RobotsCache(tmp_path)
+        cache.put("example.com", ROBOTS_TXT)
+        
+        assert cache.get("example.com") == ROBOTS_TXT
+        assert cache.get("other.com") is None
+    
+    def test_expired_entry_is_miss(self, tmp_path):
+        """Test that entries older than the TTL are ignored."""
+        cache = RobotsCache(tmp_path, ttl_seconds=60)
+        cache.put("example.com", ROBOTS_TXT)
+        
+        path = tmp_path / "example.com.json"
+        entry = json.loads(path.read_text())
+        entry["fetched_at"] -= 120
+        path.write_text(json.dumps(entry))
+        
+        assert cache.get("example.com") is None
@@ -0,0 +1,158 @@
+"""
+Unit tests for deadline-aware competitor scheduling.
+"""
+
+from src.utils.scheduler import DeadlineScheduler
+
+
+class FakeClock:
+    """Manually advanced monotonic clock."""
+    
+    def __init__(self):
+        self.now = 0.0
+    
+    def __call__(self):
+        return self.now
+
+
+def make_competitor(name, priority, new=0, promo=0, crawl=None):
+    """Build a competitor configuration with numbered URLs."""
+    config = {
+        'name': name,
+        'priority': priority,
+        'new_urls': [f"https://{name}.com/new/{i}" for i in range(new)],
+        'promo_urls': [f"https://{name}.com/sale/{i}" for i in range(promo)]
+    }
+    if crawl:
+        config['crawl'] = crawl
+    return config
+
+
+class TestDeadlineScheduler:
+    """Test cases for DeadlineScheduler."""
+    
+    def test_orders_by_priority(self):
+        """Test that competitors run highest priority first, stable within a priority."""
+        competitors = [
+            make_competitor('low', 5),
+            make_competitor('first', 1),
+            make_competitor('mid', 3),
+            make_competitor('second', 1)
+        ]
+        
+        ordered = DeadlineScheduler.order(competitors)
+        
+        assert [c['name'] for c in ordered] == ['first', 'second', 'mid', 'low']
+    
+    def test_budget_weighted_by_priority(self):
+        """Test that the remaining time is split by priority weight."""
+        scheduler = DeadlineScheduler(600, seconds_per_page=1.0, clock=FakeClock())
+        high = make_competitor('high', 1, new=2)
+        low = make_competitor('low', 5, new=2)
+        
+        plan = scheduler.plan(high, [low])
+        
+        # Weights 5 and 1
+        assert plan['budget_seconds'] == 500
+        assert plan['shed'] == 0
+        assert plan['config'] is high
+    
+    def test_reserve_and_elapsed_reduce_budget(self):
+        """Test that elapsed time and the export reserve come out of the budget."""
+        clock = FakeClock()
+        scheduler = DeadlineScheduler(600, seconds_per_page=1.0, reserve_seconds=60, clock=clock)
+        clock.now = 240
+        
+        plan = scheduler.plan(make_competitor('only', 1, new=1), [])
+        
+        assert plan['budget_seconds'] == 300
+    
+    def test_sheds_urls_proportionally(self):
+        """Test that URLs beyond the budget are shed, keeping new and promo URLs in proportion."""
+        scheduler = DeadlineScheduler(100, seconds_per_page=10.0, clock=FakeClock())
+        competitor = make_competitor('acme', 1, new=10, promo=10)
+        
+        plan = scheduler.plan(competitor, [])
+        
+        assert plan['pages'] == 10
+        assert plan['shed'] == 10
+        assert plan['config']['new_urls'] == competitor['new_urls'][:5]
+        assert plan['config']['promo_urls'] == competitor['promo_urls'][:5]
+        assert len(competitor['new_urls']) == 10
+        assert scheduler.shed_pages == 10
+    
+    def test_caps_crawl_limit(self):
+        """Test that discovery crawls get a smaller page limit."""
+        scheduler = DeadlineScheduler(100, seconds_per_page=10.0, clock=FakeClock())
+        competitor = make_competitor('acme', 1, new=2, crawl={'mode': 'frontier', 'limit': 50})
+        
+        plan = scheduler.plan(competitor, [])
+        
+        assert plan['config']['crawl'] == {'mode': 'frontier', 'limit': 10}
+        assert len(plan['config']['new_urls']) == 2
+        assert plan['shed'] == 40
+        assert competitor['crawl']['limit'] == 50
+    
+    def test_projects_pages_per_mode(self):
+        """Test that crawl.limit is projected per seed for crawl jobs and on top of seeds for sitemaps."""
+        crawl = make_competitor('acme', 1, new=2, promo=1, crawl={'mode': 'crawl', 'limit': 10})
+        sitemap = make_competitor('acme', 1, new=2, promo=1, crawl={'mode': 'sitemap', 'limit': 10})
+        frontier = make_competitor('acme', 1, new=2, promo=1, crawl={'mode': 'frontier', 'limit': 10})
+        
+        assert DeadlineScheduler.get_planned_pages(crawl) == 30
+        assert DeadlineScheduler.get_planned_pages(sitemap) == 13
+        assert DeadlineScheduler.get_planned_pages(frontier) == 10
+    
+    def test_caps_crawl_job_limit_per_seed(self):
+        """Test that crawl jobs keep their seeds with a smaller per-seed limit."""
+        scheduler = DeadlineScheduler(100, seconds_per_page=5.0, clock=FakeClock())
+        competitor = make_competitor('acme', 1, new=2, promo=2, crawl={'mode': 'crawl', 'limit': 50})
+        
+        plan = scheduler.plan(competitor, [])
+        
+        assert plan['config']['crawl']['limit'] == 5
+        assert len(plan['config']['new_urls']) + len(plan['config']['promo_urls']) == 4
+        assert plan['pages'] == 20
+        assert plan['shed'] == 180
+    
+    def test_caps_sitemap_limit_after_seeds(self):
+        """Test that sitemap crawls keep their seeds and give the rest of the budget to the limit."""
+        scheduler = DeadlineScheduler(100, seconds_per_page=10.0, clock=FakeClock())
+        competitor = make_competitor('acme', 1, new=2, promo=1, crawl={'mode': 'sitemap', 'limit': 50})
+        
+        plan = scheduler.plan(competitor, [])
+        
+        assert plan['config']['crawl']['limit'] == 7
+        assert plan['pages'] == 10
+        assert plan['shed'] == 43
+    
+    def test_skips_when_out_of_time(self):
+        """Test that competitors with no time left are skipped."""
+        clock = FakeClock()
+        scheduler = DeadlineScheduler(100, seconds_per_page=10.0, clock=clock)
+        clock.now = 100
+        
+        plan = scheduler.plan(make_competitor('late', 5, new=3), [])
+        
+        assert plan['pages'] == 0
+        assert plan['config']['new_urls'] == []
+        assert scheduler.get_summary()['skipped'] == ['late']
+    
+    def test_record_updates_pace(self):
+        """Test that observed pace feeds later shedding decisions."""
+        scheduler = DeadlineScheduler(1000, seconds_per_page=1.0, clock=FakeClock())
+        
+        scheduler.record(pages=10, seconds=50)
+        scheduler.record(pages=0, seconds=10)
+        
+        assert scheduler.seconds_per_page == 3.0
+    
+    def test_summary_tracks_timeouts(self):
+        """Test that cut-short competitors are reported."""
+        scheduler = DeadlineScheduler(100, seconds_per_page=1.0, clock=FakeClock())
+        
+        scheduler.record_timeout(make_competitor('slow', 2))
+        
+        summary = scheduler.get_summary()
+        assert summary['timed_out'] == ['slow']
+        assert summary['deadline_seconds'] == 100
@@ -0,0 +1,131 @@
+"""
+Unit tests for the on-disk scrape cache.
+"""
+
+import os
+
+from src.storage.scrape_cache import ScrapeCache
+
+
+def make_result(markdown="# New Arrivals", status="success"):
+    """Build a scrape result dictionary."""
+    return {
+        'url': "https://www.westelm.com/shop/furniture/new/",
+        'markdown': markdown,
+        'html': "<h1>New Arrivals</h1>",
+        'title': "New Furniture",
+        'status': status
+    }
+
+
+class TestScrapeCache:
+    """Test cases for ScrapeCache."""
+    
+    def test_round_trip(self, tmp_path):
+        """Test that a stored scrape is returned on the next lookup."""
+        cache = ScrapeCache(tmp_path)
+        digest = cache.put("https://www.westelm.com/shop/furniture/new/", make_result())
+        
+        cached = cache.get("https://www.westelm.com/shop/furniture/new/")
+        
+        assert cached['markdown'] == "# New Arrivals"
+        assert cached['title'] == "New Furniture"
+        assert cached['cached'] is True
+        assert cached['content_hash'] == digest
+        assert cache.get_stats() == {'hits': 1, 'misses': 0}
+    
+    def test_lookup_uses_normalized_url(self, tmp_path):
+        """Test that equivalent URLs share a cache entry."""
+        cache = ScrapeCache(tmp_path)
+        cache.put("https://www.westelm.com:443/shop/furniture/new/", make_result())
+        
+        assert cache.get("https://www.westelm.com/shop/furniture/new") is not None
+    
+    def test_expired_entries_miss(self, tmp_path):
+        """Test that entries older than the TTL are ignored."""
+        cache = ScrapeCache(tmp_path, ttl_seconds=0)
+        cache.put("https://example.com/new/", make_result())
+        
+        assert cache.get("https://example.com/new/") is None
+        assert cache.get_stats()['misses'] == 1
+    
+    def test_identical_content_stored_once(self, tmp_path):
+        """Test that identical pages share one content blob."""
+        cache = ScrapeCache(tmp_path)
+        cache.put("https://example.com/a/", make_result())
+        cache.put("https://example.com/b/", make_result())
+        
+        assert len(list(cache.content_dir.iterdir())) == 1
+        assert len(list(cache.index_dir.iterdir())) == 2
+    
+    def test_required_fields(self, tmp_path):
+        """Test that entries missing a required format count as misses."""
+        cache = ScrapeCache(tmp_path)
+        result = make_result()
+        result['html'] = ''
+        cache.put("https://example.com/a/", result)
+        
+        assert cache.get("https://example.com/a/", fields=['markdown']) is not None
+        assert cache.get("https://example.com/a/", fields=['html']) is None
+    
+    def test_put_merges_missing_fields(self, tmp_path):
+        """Test that a later HTML-only scrape keeps the cached markdown."""
+        cache = ScrapeCache(tmp_path)
+        cache.put("https://example.com/a/", {**make_result(), 'html': ''})
+        cache.put("https://example.com/a/", {**make_result(markdown=''), 'html': "<p>Sofa</p>"})
+        
+        cached = cache.get("https://example.com/a/", fields=['markdown', 'html'])
+        
+        assert cached['markdown'] == "# New Arrivals"
+        assert cached['html'] == "<p>Sofa</p>"
+    
+    def test_failed_scrapes_not_cached(self, tmp_path):
+        """Test that failed scrapes are never stored."""
+        cache = ScrapeCache(tmp_path)
+        
+        assert cache.put("https://example.com/a/", make_result(status="failed")) is None
+        assert cache.get("https://example.com/a/") is None
+    
+    def test_blobs_are_compressed(self, tmp_path):
+        """Test that content blobs are stored compressed."""
+        cache = ScrapeCache(tmp_path)
+        cache.put("https://example.com/a/", make_result(markdown="# Sofa " * 1000))
+        
+        blob = next(cache.content_dir.iterdir())
+        assert blob.name.endswith(('.json.zst', '.json.gz'))
+        assert blob.stat().st_size < 1000
+    
+    def test_history_keeps_past_versions(self, tmp_path):
+        """Test that earlier fetches stay available for re-extraction."""
+        cache = ScrapeCache(tmp_path)
+        first = cache.put("https://example.com/a/", make_result(markdown="# Old"))
+        second = cache.put("https://example.com/a/", make_result(markdown="# New"))
+        
+        history = cache.get_history("https://example.com/a/")
+        
+        assert [item['content_hash'] for item in history] == [first, second]
+        assert cache.get_content(first)['markdown'] == "# Old"
+    
+    def test_compact_evicts_least_recently_used(self, tmp_path):
+        """Test that compaction removes the oldest blobs to fit the budget."""
+        cache = ScrapeCache(tmp_path)
+        old = cache.put("https://example.com/old/", make_result(markdown=os.urandom(2000).hex()))
+        new = cache.put("https://example.com/new/", make_result(markdown=os.urandom(2000).hex()))
+        
+        old_blob = cache._blob_path(old)
+        os.utime(old_blob, (0, 0))
+        cache.max_bytes = int(cache._blob_path(new).stat().st_size / ScrapeCache.COMPACT_TARGET) + 100
+        
+        stats = cache.compact()
+        
+        assert stats['removed'] == 1
+        assert cache.get("https://example.com/old/") is None
+        assert cache.get("https://example.com/new/") is not None
+        assert cache.get_history("https://example.com/old/") == []
+    
+    def test_compact_within_budget_is_noop(self, tmp_path):
+        """Test that nothing is evicted while under budget."""
+        cache = ScrapeCache(tmp_path, max_bytes=10 * 1024 * 1024)
+        cache.put("https://example.com/a/", make_result())
+        
+        assert cache.compact()['removed'] == 0
@@ -0,0 +1,120 @@
+"""
+Unit tests for the local stand-in API servers.
+"""
+
+import json
+import random
+
+import pytest
+from pydantic import ValidationError
+
+from src.simulators.common import FaultProfile, LatencyProfile
+from src.simulators.anthropic_server import (
+    FakeAnthropicServer,
+    extract_prompt_content,
+    rule_products,
+    rule_promotions
+)
+from src.simulators.firecrawl_server import synthetic_page
+
+
+class TestLatencyProfile:
+    """Test cases for LatencyProfile."""
+    
+    def test_fixed_latency(self):
+        """Test that fixed latency always returns the median."""
+        profile = LatencyProfile(distribution="fixed", median=0.25)
+        
+        assert profile.sample(random.Random(1)) == 0.25
+    
+    def test_latency_is_capped(self):
+        """Test that samples never exceed max_latency."""
+        profile = LatencyProfile(distribution="lognormal", median=5.0, spread=3.0, max_latency=6.0)
+        rng = random.Random(1)
+        
+        assert all(profile.sample(rng) <= 6.0 for _ in range(200))
+    
+    def test_invalid_distribution(self):
+        """Test that unknown distributions are rejected."""
+        with pytest.raises(ValidationError):
+            LatencyProfile(distribution="pareto")
+
+
+class TestFaultProfile:
+    """Test cases for FaultProfile."""
+    
+    def test_no_faults_by_default(self):
+        """Test that the default profile never fails."""
+        rng = random.Random(1)
+        
+        assert all(FaultProfile().pick_fault(rng) is None for _ in range(100))
+    
+    def test_always_rate_limited(self):
+        """Test that a 100% 429 rate always rate limits."""
+        profile = FaultProfile(rate_limit_rate=1.0)
+        
+        assert profile.pick_fault(random.Random(1)) == 429
+
+
+class TestFakeFirecrawlPages:
+    """Test cases for synthetic Firecrawl pages."""
+    
+    def test_pages_are_deterministic(self):
+        """Test that the same URL always produces the same page."""
+        url = "https://www.westelm.com/shop/furniture/new/"
+        
+        assert synthetic_page(url) == synthetic_page(url)
+    
+    def test_page_size_and_products(self):
+        """Test payload size and product count controls."""
+        title, markdown = synthetic_page("https://example.com/new/", products_per_page=5, page_size_kb=8)
+        
+        assert title == "New"
+        assert markdown.count("## [") == 5
+        assert len(markdown) >= 8 * 1024
+
+
+class TestFakeAnthropicRules:
+    """Test cases for rule-generated extractions."""
+    
+    CONTENT = """# New Arrivals
+## [Oak Sofa](https://example.com/products/oak-sofa/) - $1,299
+![Oak Sofa](https://example.com/images/oak-sofa.jpg)
+## Modern Chair - $249
+## Sale: 20% Off All Chairs
+Use code CHAIR20 at checkout
+"""
+    
+    def test_prompt_content(self):
+        """Test extracting the content section from a prompt."""
+        prompt = "Extract product information.\n\nContent:\nHello\n\nReturn only valid JSON array:\n"
+        
+        assert extract_prompt_content(prompt) == "Hello"
+    
+    def test_rule_products(self):
+        """Test product generation from listing lines."""
+        products = rule_products(self.CONTENT)
+        
+        assert [p['product_name'] for p in products] == ["Oak Sofa", "Modern Chair"]
+        assert products[0]['price'] == 1299.0
+        assert products[0]['image_url'] == "https://example.com/images/oak-sofa.jpg"
+    
+    def test_rule_promotions(self):
+        """Test promotion generation from discount lines."""
+        promotions = rule_promotions(self.CONTENT)
+        
+        assert len(promotions) == 1
+        assert promotions[0]['promo_type'] == "percentage_off"
+        assert promotions[0]['discount_value'] == 20.0
+    
+    def test_combined_reply(self):
+        """Test that combined prompts get both arrays in one object."""
+        prompt = (
+            "Extract product and promotion information from this page.\n\n"
+            f"Content:\n{self.CONTENT}\n\nReturn only valid JSON object:\n"
+        )
+        
+        reply = json.loads(FakeAnthropicServer().build_reply(prompt))
+        
+        assert len(reply['products']) == 2
+        assert len(reply['promotions']) == 1
@@ -0,0 +1,132 @@
+"""
+Unit tests for sitemap parsing and the URL state table.
+"""
+
+import gzip
+
+import pytest
+
+from src.collectors.sitemap import SitemapParser, normalize_lastmod
+from src.storage.url_state import URLStateStore
+
+
+SITEMAP_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9"
+        xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">
+  <url>
+    <loc>https://example.com/products/sofa</loc>
+    <lastmod>2024-01-15</lastmod>
+    <image:image><image:loc>https://example.com/img/sofa.jpg</image:loc></image:image>
+  </url>
+  <url>
+    <loc>https://example.com/products/chair</loc>
+  </url>
+</urlset>
+"""
+
+SITEMAP_INDEX_XML = b"""<?xml version="1.0" encoding="UTF-8"?>
+<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">
+  <sitemap><loc>https://example.com/sitemap-products.xml.gz</loc></sitemap>
+</sitemapindex>
+"""
+
+
+def parse_in_chunks(data, size=7):
+    """Feed data to a parser in small chunks."""
+    parser = SitemapParser()
+    entries = []
+    for i in range(0, len(data), size):
+        entries.extend(parser.feed(data[i:i + size]))
+    entries.extend(parser.close())
+    return entries
+
+
+class TestSitemapParser:
+    """Test cases for SitemapParser."""
+    
+    def test_urlset(self):
+        """Test that page URLs and lastmod values are parsed across chunks."""
+        assert parse_in_chunks(SITEMAP_XML) == [
+            ("url", "https://example.com/products/sofa", "2024-01-15T00:00:00Z"),
+            ("url", "https://example.com/products/chair", None)
+        ]
+    
+    def test_sitemap_index(self):
+        """Test that sitemap index entries are reported as sitemaps."""
+        assert parse_in_chunks(SITEMAP_INDEX_XML) == [
+            ("sitemap", "https://example.com/sitemap-products.xml.gz", None)
+        ]
+    
+    def test_gzip(self):
+        """Test that gzip-compressed sitemaps are detected and decompressed."""
+        assert len(parse_in_chunks(gzip.compress(SITEMAP_XML))) == 2
+    
+    def test_invalid_xml(self):
+        """Test that malformed XML raises ValueError."""
+        with pytest.raises(ValueError):
+            parse_in_chunks(b"<urlset><url><loc>x</url>")
+    
+    def test_normalize_lastmod(self):
+        """Test that lastmod values are converted to UTC."""
+        assert normalize_lastmod("2024-01-15T10:30:00+02:00") == "2024-01-15T08:30:00Z"
+        assert normalize_lastmod("2024-01-15T10:30:00Z") == "2024-01-15T10:30:00Z"
+        assert normalize_lastmod("yesterday") is None
+
+
+class TestURLStateStore:
+    """Test cases for URLStateStore."""
+    
+    def test_only_new_or_modified_are_pending(self, tmp_path):
+        """Test that scraped URLs return only after their lastmod changes."""
+        store = URLStateStore(tmp_path / "state.db")
+        store.upsert("West Elm", [
+            ("https://example.com/a", "2024-01-01T00:00:00Z"),
+            ("https://example.com/b", None)
+        ])
+        assert len(store.get_pending("West Elm", 10)) == 2
+        
+        store.mark_scraped("West Elm", "https://example.com/a", "2024-01-01T00:00:00Z")
+        store.mark_scraped("West Elm", "https://example.com/b", None)
+        assert store.get_pending("West Elm", 10) == []
+        
+        store.upsert("West Elm", [("https://example.com/a", "2024-02-01T00:00:00Z")])
+        assert store.get_pending("West Elm", 10) == [("https://example.com/a", "2024-02-01T00:00:00Z")]
+        store.close()
+    
+    def test_competitors_are_separate(self, tmp_path):
+        """Test that URL state is kept per competitor."""
+        store = URLStateStore(tmp_path / "state.db")
+        store.upsert("West Elm", [("https://example.com/a", None)])
+        
+        assert store.get_pending("Crate & Barrel", 10) == []
+        assert store.get_stats("West Elm") == {"total": 1, "unscraped": 1}
+        store.close()
+    
+    def test_blocked_urls_are_not_pending(self, tmp_path):
+        """Test that URLs disallowed by robots.txt never fill the limit."""
+        store = URLStateStore(tmp_path / "state.db")
+        store.upsert("West Elm", [("https://example.com/private", "2024-03-01")], blocked=True)
+        store.upsert("West Elm", [("https://example.com/a", "2024-01-01")])
+        
+        assert store.get_pending("West Elm", 1) == [("https://example.com/a", "2024-01-01")]
+        
+        store.upsert("West Elm", [("https://example.com/private", "2024-03-01")])
+        assert store.get_pending("West Elm", 1) == [("https://example.com/private", "2024-03-01")]
+        store.close()
+    
+    def test_failing_urls_give_way_then_stop(self, tmp_path):
+        """Test that failed URLs come after untried ones and stop after MAX_FAILURES."""
+        store = URLStateStore(tmp_path / "state.db")
+        store.upsert("West Elm", [("https://example.com/gone", "2024-03-01"), ("https://example.com/a", "2024-01-01")])
+        
+        store.mark_failed("West Elm", "https://example.com/gone", "2024-03-01")
+        assert store.get_pending("West Elm", 1) == [("https://example.com/a", "2024-01-01")]
+        
+        for _ in range(URLStateStore.MAX_FAILURES - 1):
+            store.mark_failed("West Elm", "https://example.com/gone", "2024-03-01")
+        assert store.get_pending("West Elm", 10) == [("https://example.com/a", "2024-01-01")]
+        
+        # A new lastmod gives the URL another chance
+        store.upsert("West Elm", [("https://example.com/gone", "2024-04-01")])
+        assert store.get_pending("West Elm", 1) == [("https://example.com/gone", "2024-04-01")]
+        store.close()